@@ -5,21 +5,31 @@ This script creates a connection between the Debugger and Foundry's Maya for deb
 
 """
 
-from util import (Queue, log, run, dirname, debugpy_path, join, split,
-                  basename, ATTACH_TEMPLATE, ATTACH_ARGS, 
-                  INITIALIZE_RESPONSE, CONTENT_HEADER)
+from util import (log, run, dirname, debugpy_path, has_command, frame_message, maya_connection_error,
+                  configure_logging, connect_with_retry, format_address, MessageReader, ATTACH_TEMPLATE,
+                  ATTACH_ARGS, INITIALIZE_RESPONSE, MAYA_ADDRESS, MAYA_TIMEOUT, UNIX_HOST_PREFIX)
 from interface import DebuggerInterface
-from tempfile import gettempdir
-import socket
+from maya_client import MayaTarget, MayaError
+from multiplexer import SessionMultiplexer
+from response_cache import ResponseCache
+from stats import stats, stats_response
 import json
+import time
+import sys
 
 interface = None
+engine = None  # Set when running on the asyncio engine instead of threads
 
 processed_seqs = []
-attach_code = ""
+initialize_message = None  # Forwarded to each target's debugpy once the attach request lists them
 
-debugpy_send_queue = Queue()
-debugpy_socket = None
+targets = []  # MayaTargets of the session, from the attach request
+multiplexer = None  # Set when debugging more than one Maya at once
+response_cache = None  # Set when the launch config enables "cacheResponses"
+
+# Only messages carrying these commands are decoded, everything else is relayed as raw bytes
+INTERCEPTED_DEBUGGER_COMMANDS = (b'initialize', b'attach', b'mayaAdapterStats')
+INTERCEPTED_DEBUGPY_COMMANDS = (b'initialize',)
 
 
 def main():
@@ -28,7 +38,14 @@ def main():
     then remains in a loop reading messages from debugger.
     """
 
-    global interface
+    global interface, engine
+
+    if '--asyncio' in sys.argv:
+        # Drive every connection from a single event loop, which also acts as the interface
+        from async_engine import AsyncRelay
+        engine = interface = AsyncRelay(on_receive_from_debugger, on_receive_from_debugpy, on_debugpy_closed)
+        engine.start()
+        return
 
     # Create and start the interface with the debugger
     interface = DebuggerInterface(on_receive=on_receive_from_debugger)
@@ -41,163 +58,250 @@ def on_receive_from_debugger(message):
     while debugpy is being set up
     """
 
-    # Load message contents into a dictionary
-    contents = json.loads(message)
+    global response_cache, initialize_message, targets, multiplexer
 
     log('Received from Debugger:', message)
 
+    if response_cache:
+        response = response_cache.on_request(message)
+        if response:
+            interface.send(response)
+            return
+
+    if not has_command(message, INTERCEPTED_DEBUGGER_COMMANDS):
+        # Nothing to intercept, forward the raw bytes untouched
+        send_to_targets(message)
+        return
+
+    # Load message contents into a dictionary
+    contents = json.loads(message.decode('UTF-8'))
+
     # Get the type of command the debugger sent
-    cmd = contents['command']
+    cmd = contents.get('command', '')
     
     if cmd == 'initialize':
         # Run init request once Maya connection is established and send success response to the debugger
-        interface.send(json.dumps(json.loads(INITIALIZE_RESPONSE)))  # load and dump to remove indents
+        interface.send(json.dumps(json.loads(INITIALIZE_RESPONSE)).encode('UTF-8'))  # load and dump to remove indents
         processed_seqs.append(contents['seq'])
+
+        # Held back until the attach request tells which debugpy to send it to
+        initialize_message = message
+
+    elif cmd == 'mayaAdapterStats':
+        # Custom request answered by the adapter itself, debugpy doesn't know it
+        interface.send(stats_response(contents['seq']))
     
     elif cmd == 'attach':
-        # time to attach to Maya
-        run(attach_to_maya, (contents,))
-
-        # Change arguments to valid ones for debugpy
         config = contents['arguments']
-        new_args = ATTACH_ARGS.format(
-            dir=dirname(config['program']).replace('\\', '\\\\'),
-            hostname=config['debugpy']['host'],
-            port=int(config['debugpy']['port']),
-            # filepath=config['program'].replace('\\', '\\\\')
-        )
+        configure_logging(config.get('logging'))
+
+        if config.get('cacheResponses'):
+            response_cache = ResponseCache()
+
+        targets = read_targets(config)
+        if len(targets) > 1:
+            multiplexer = SessionMultiplexer(len(targets))
+            multiplexer.fan_out(contents['seq'], cmd)
+
+        for target in targets:
+            # Change arguments to valid ones for debugpy
+            new_args = ATTACH_ARGS.format(
+                dir=dirname(config['program']).replace('\\', '\\\\'),
+                hostname=target.debugpy_address[0],
+                port=target.debugpy_address[1],
+                # filepath=config['program'].replace('\\', '\\\\')
+            )
+            log("New attach arguments loaded:", new_args)
 
-        # Update the message with the new arguments to then be sent to debugpy
-        contents = contents.copy()
-        contents['arguments'] = json.loads(new_args)
-        message = json.dumps(contents)  # update contents to reflect new args
+            # Update the message with the new arguments to then be sent to debugpy
+            target_message = json.dumps(dict(contents, arguments=json.loads(new_args))).encode('UTF-8')
 
-        log("New attach arguments loaded:", new_args)
+            if initialize_message:
+                send_to_debugpy(initialize_message, target.index)
+            send_to_debugpy(target_message, target.index)
 
-    # Then just put the message in the debugpy queue
-    debugpy_send_queue.put(message)
+            # time to attach to Maya
+            attach_to_maya(target, config)
+
+    else:
+        send_to_targets(message)
 
 
-def attach_to_maya(contents):
+def read_targets(config):
     """
-    Defines commands to send to Maya, and sends the attach code to it.
+    Returns the MayaTargets listed in the "targets" of the launch config, each with the
+    "commandPort" (and optional "commandHost") its server listens on and its own "debugpy".
+    Without them, the session only has the Maya listening on MAYA_ADDRESS.
     """
 
-    global attach_code, Maya_path
-    config = contents['arguments']
+    entries = config.get('targets') or [{}]
+    targets = []
+    for index, entry in enumerate(entries):
+        command_address = (entry.get('commandHost', MAYA_ADDRESS[0]), int(entry.get('commandPort', MAYA_ADDRESS[1])))
+        debugpy = entry.get('debugpy', config.get('debugpy'))
+        targets.append(MayaTarget(index, command_address, read_debugpy_address(debugpy)))
+    return targets
+
+
+def read_debugpy_address(debugpy):
+    """
+    Returns the (host, port) of a "debugpy" of the launch config. Giving it a "path" instead
+    of a "host" and "port" has debugpy listen on that Unix domain socket, which is faster
+    than TCP when Maya runs on the same machine.
+    """
+
+    if 'path' in debugpy:
+        return (UNIX_HOST_PREFIX + debugpy['path'], 0)
+    return (debugpy['host'], int(debugpy.get('port', 0)))
+
+
+def send_to_targets(message):
+    """
+    Sends a request from the debugger to the debugpy of the targets it concerns
+    """
+
+    if multiplexer:
+        for index, target_message in multiplexer.route_request(message):
+            send_to_debugpy(target_message, index)
+    else:
+        send_to_debugpy(message)
+
+
+def send_to_debugpy(message, index=0):
+    """
+    Queues a message to be sent to the debugpy of the target at index by whichever engine is running
+    """
+
+    if engine:
+        engine.send_to_debugpy(message, index)
+    else:
+        targets[index].send_queue.put(message)
+
+
+def attach_to_maya(target, config):
+    """
+    Defines commands to send to Maya, and sends the attach code to it.
+    """
 
     # Format the simulated attach response to send it back to the debugger
     # while we set up the debugpy in the background
     attach_code = ATTACH_TEMPLATE.format(
         debugpy_path=debugpy_path,
-        hostname=config['debugpy']['host'],
-        port=int(config['debugpy']['port']),
+        hostname=target.debugpy_address[0],
+        port=target.debugpy_address[1],
         interpreter=config['interpreter'],
     )
 
-    # Copy code to temporary file and start a Maya console with it
+    if engine:
+        # The event loop talks to Maya and debugpy itself
+        engine.attach(target, attach_code)
+    else:
+        run(connect_to_maya, (target, attach_code, time.time()))
+
+
+def connect_to_maya(target, code, start_time):
+    """
+    Sends the attach code to Maya, unless debugpy is already listening there,
+    then starts the threads communicating with debugpy.
+    """
+
+    address = target.debugpy_address
     try: 
-        send_code_to_maya(attach_code)
-    except Exception as e:
+        listener = find_debugpy_listener(target)
+        if listener:
+            address = listener
+        else:
+            send_code_to_maya(target, code)
+    except MayaError as e:
         # Raising exceptions shows the text in the Debugger's output.
+        log("Exception occurred: \n\n" + str(e))
+        on_debugpy_closed(target.index)
+        raise Exception("Maya failed to run the attach code: " + str(e))
+    except Exception as e:
         # Raise an error to show a potential solution to this problem.
         log("Exception occurred: \n\n" + str(e))
-        import platform
-        module_path = join(dirname(__file__), 'resources', 'module')
-        separator = ';' if platform.system() == 'Windows' else ':'
-        raise Exception(
-            """
-                              Could not connect to Maya.
-
-                Please ensure Maya is running. If this is your first time
-                using the debug adapter, ensure the MAYA_MODULE_PATH
-                environment variable is set correctly (ie contains {0}), 
-                           then restart Maya and try again.
-            """.format(module_path + separator)
-        )
+        on_debugpy_closed(target.index)
+        raise maya_connection_error()
 
     # Then start the Maya debugging threads
-    run(start_debugging, ((config['debugpy']['host'], int(config['debugpy']['port'])),))
+    run(start_debugging, (target, address, start_time))
 
 
-def send_code_to_maya(code):
+def find_debugpy_listener(target):
+    """
+    Returns the address debugpy is already listening on in the target's Maya if it was
+    started along with Maya (see MAYA_DEBUGGER_PRELISTEN), otherwise None.
     """
-    Copies code to temporary file, formats execution template code with file location, 
-    and sends execution code to Maya via socket connection.
+
+    try:
+        listener = target.maya_client.query('debugpy', MAYA_TIMEOUT)
+    except MayaError:
+        return None  # Older server, which can't tell
+
+    if isinstance(listener, dict):
+        log("debugpy is already listening in " + str(target))
+        return (listener['host'], int(listener['port']))
+    return None
+
+
+def send_code_to_maya(target, code):
+    """
+    Sends code to be executed by the server in the target's Maya, over the connection shared
+    by all code sent to it. Returns once Maya has run the code.
 
     Inspired by send_to_Maya.py at https://github.com/tokejepsen/atom-foundry-Maya
     """
 
     # Throws error if it fails
-    log("Sending code to Maya...")
-
-    ADDR = ("localhost", 8890)
+    log("Sending code to " + str(target) + "...")
 
-    # Create a socket and connect to server in Maya
-    client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    client.connect(ADDR)
+    result = target.maya_client.execute(code, MAYA_TIMEOUT)
 
-    # Send the code directly to the server and close the socket
-    client.send(code.encode("UTF-8"))
-    client.close()
-    
-    log("Success")
+    log("Success, Maya returned " + str(result))
 
 
-def start_debugging(address):
+def start_debugging(target, address, start_time):
     """
     Connects to debugpy in Maya, then starts the threads needed to
-    send and receive information from it
+    send and receive information from it.
+    Messages for debugpy wait in the target's send_queue until then.
     """
 
-    log("Connecting to " + address[0] + ":" + str(address[1]))
+    log("Connecting to " + format_address(address))
 
-    # Create the socket used to communicate with debugpy
-    global debugpy_socket
-    debugpy_socket = socket.create_connection(address)
+    # Create the socket used to communicate with debugpy,
+    # retrying until the listener Maya was asked to start is up
+    try:
+        target.socket = connect_with_retry(address)
+    except OSError as e:
+        log("Exception occurred: \n\n" + str(e))
+        on_debugpy_closed(target.index)
+        raise Exception("Could not connect to debugpy in Maya at {}: {}".format(format_address(address), e))
 
-    log("Successfully connected to Maya for debugging. Starting...")
+    log("Successfully connected to Maya for debugging after {:.3f}s. Starting...".format(time.time() - start_time))
 
     # Start a thread that sends requests to debugpy
-    run(debugpy_send_loop)
+    run(debugpy_send_loop, (target,))
 
-    fstream = debugpy_socket.makefile()
+    reader = MessageReader(target.socket.recv_into)
 
     while True:
         try:
-            # Wait for the CONTENT_HEADER to show up,
-            # then get the length of the content following it
-            content_length = 0
-            while True:
-                header = fstream.readline()
-                if header:
-                    header = header.strip()
-                if not header:
-                    break
-                if header.startswith(CONTENT_HEADER):
-                    content_length = int(header[len(CONTENT_HEADER):])
-
-            # Read the content of the response, then call the callback
-            if content_length > 0:
-                total_content = ""
-                while content_length > 0:
-                    content = fstream.read(content_length)
-                    content_length -= len(content)
-                    total_content += content
-
-                if content_length == 0:
-                    message = total_content
-                    on_receive_from_debugpy(message)
-
+            message = reader.read()
         except Exception as e:
             # Problem with socket. Close it then return
 
             log("Failure reading Maya's debugpy output: \n" + str(e))
-            debugpy_socket.close()
+            target.socket.close()
             break
 
+        stats.message_received('debugpy', message)
+        on_receive_from_debugpy(message, target.index)
+
+    on_debugpy_closed(target.index)
+
 
-def debugpy_send_loop():
+def debugpy_send_loop(target):
     """
     The loop that waits for items to show in the send queue and prints them.
     Blocks until an item is present
@@ -205,16 +309,16 @@ def debugpy_send_loop():
 
     while True:
         # Get the first message off the queue
-        msg = debugpy_send_queue.get()
+        msg = target.send_queue.get()
         if msg is None:
             # get() is blocking, so None means it was intentionally
             # added to the queue to stop this loop, or that a problem occurred
             return
         else:
             try:
-                # First send the content header with the length of the message, then send the message
-                debugpy_socket.send(bytes(CONTENT_HEADER + '{}\r\n\r\n'.format(len(msg)), 'UTF-8'))
-                debugpy_socket.send(msg.encode('UTF-8'))
+                # Send the content header and the message together
+                target.socket.sendall(frame_message(msg))
+                stats.message_sent('debugpy', msg)
                 log('Sent to debugpy:', msg)
             except OSError:
                 log("Debug socket closed.")
@@ -224,22 +328,21 @@ def debugpy_send_loop():
                 return
 
 
-def on_receive_from_debugpy(message):
+def on_receive_from_debugpy(message, index=0):
     """
-    Handles messages going from debugpy to the debugger
+    Handles messages going from the debugpy of the target at index to the debugger
     """
 
-    # Load the message into a dictionary
-    c = json.loads(message)
-    seq = int(c.get('request_seq', -1))  # a negative seq will never occur
-    cmd = c.get('command', '')
-
-    if cmd == 'configurationDone':
-        # When Debugger & debugpy are done setting up, send the code to debug
+    if not has_command(message, INTERCEPTED_DEBUGPY_COMMANDS):
+        # Send responses and events to debugger without decoding them
         log('Received from debugpy:', message)
-        interface.send(message)
+        send_to_debugger(message, index)
         return
 
+    # Load the message into a dictionary
+    c = json.loads(message.decode('UTF-8'))
+    seq = int(c.get('request_seq', -1))  # a negative seq will never occur
+
     # Send responses and events to debugger
     if seq in processed_seqs:
         # Should only be the initialization request
@@ -247,6 +350,29 @@ def on_receive_from_debugpy(message):
     else:
         # Send the message normally to the debugger
         log('Received from debugpy:', message)
+        send_to_debugger(message, index)
+
+
+def on_debugpy_closed(index):
+    """
+    Stops waiting for the target at index to answer, once its debugpy can't be reached anymore
+    """
+
+    if multiplexer:
+        for message in multiplexer.remove_target(index):
+            send_to_debugger(message)
+
+
+def send_to_debugger(message, index=0):
+    """
+    Sends a message from the debugpy of the target at index to the debugger,
+    once translated for the session when there are several targets
+    """
+
+    messages = multiplexer.on_message(index, message) if multiplexer else (message,)
+    for message in messages:
+        if response_cache:
+            response_cache.on_message_from_debugpy(message)
         interface.send(message)
 
 
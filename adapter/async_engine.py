@@ -0,0 +1,419 @@
+"""
+
+An optional engine running the whole adapter on a single asyncio event loop.
+
+Instead of one thread per reader, sender and connection, the debugger's stdin/stdout,
+the command port and debugpy socket of each Maya are all driven as streams from one thread.
+Readers stop reading while the queue they just wrote to is full, so a slow peer
+slows down whoever is flooding it, and only them. Requires Python 3.5+.
+
+"""
+
+from util import (log, frame_message, maya_connection_error, backoff_delays, format_address,
+                  unix_socket_path, CONTENT_HEADER, MAYA_ADDRESS, MAYA_TIMEOUT, CONNECT_TIMEOUT)
+from maya_client import MayaError
+from stats import stats
+from threading import Thread
+import asyncio
+import json
+import time
+import sys
+
+
+# Maximum amount of messages waiting to be written to one side before reading pauses
+QUEUE_SIZE = 64
+
+# How each side is named in the log, same as the threaded engine
+LABELS = {'debugger': 'Debugger', 'debugpy': 'debugpy'}
+
+
+class AsyncRelay:
+    """
+    Relays DAP messages between the debugger and debugpy from one event loop.
+    Offers the same send() as DebuggerInterface, so it can be used in its place.
+    """
+
+    def __init__(self, on_receive_from_debugger, on_receive_from_debugpy, on_debugpy_closed=None,
+                 queue_size=QUEUE_SIZE):
+        self.on_receive_from_debugger = on_receive_from_debugger
+        self.on_receive_from_debugpy = on_receive_from_debugpy
+        self.on_debugpy_closed = on_debugpy_closed
+        self.queue_size = queue_size
+
+        self.loop = None
+        self.tasks = set()
+        self.debugger_queue = None
+        self.debugpy_queues = {}  # Target index -> queue of messages for its debugpy
+        self.debugpy_writers = []
+
+        # Persistent connections to the command server of each Maya, see maya_client.MayaClient
+        self.maya_clients = {}  # Address -> AsyncMayaClient
+
+    def start(self):
+        """
+        Runs the event loop until the debugger closes stdin
+        """
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._main())
+        finally:
+            self.loop.close()
+
+    def send(self, message):
+        """ Queues a message for the debugger. Must be called from the loop """
+        self.debugger_queue.put_nowait(message)
+
+    def send_to_debugpy(self, message, index=0):
+        """ Queues a message for the debugpy of the target at index. Must be called from the loop """
+        self._debugpy_queue(index).put_nowait(message)
+
+    def attach(self, target, code):
+        """
+        Sends the attach code to the Maya of target (a maya_client.MayaTarget), then connects to its debugpy
+        """
+
+        self._spawn(self._attach(target, code))
+
+    async def _main(self):
+        # Queues are unbounded so callbacks never block, the readers enforce the size limit
+        self.debugger_queue = TimedQueue('AsyncRelay.debugger_queue')
+
+        reader = await self._open_stdin()
+        writer = await self._open_stdout()
+        self._spawn(self._write_loop(self.debugger_queue, writer, 'debugger'))
+
+        try:
+            await self._read_loop(reader, self.on_receive_from_debugger, 'debugger')
+        finally:
+            # Stop everything still running, then close the connections
+            tasks = list(self.tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            for writer in self.debugpy_writers:
+                writer.close()
+            for client in self.maya_clients.values():
+                client.close()
+
+    async def execute_in_maya(self, code, address=MAYA_ADDRESS):
+        """
+        Runs code in Maya's main thread and returns the repr of its value, None for statements.
+        Raises MayaError if it failed, or socket errors if Maya can't be reached.
+        """
+
+        return await self._maya_client(address).request({"code": code})
+
+    async def query_maya(self, query, address=MAYA_ADDRESS):
+        """
+        Asks the server in Maya about its state without running any code
+        """
+
+        return await self._maya_client(address).request({"query": query})
+
+    def _maya_client(self, address):
+        if address not in self.maya_clients:
+            self.maya_clients[address] = AsyncMayaClient(self, address)
+        return self.maya_clients[address]
+
+    def _debugpy_queue(self, index):
+        if index not in self.debugpy_queues:
+            name = 'AsyncRelay.debugpy_queue' if index == 0 else 'AsyncRelay.debugpy_queue.' + str(index)
+            self.debugpy_queues[index] = TimedQueue(name)
+        return self.debugpy_queues[index]
+
+    async def _attach(self, target, code):
+        try:
+            await self._connect(target, code)
+        finally:
+            if self.on_debugpy_closed:
+                self.on_debugpy_closed(target.index)
+
+    async def _connect(self, target, code):
+        start_time = time.time()
+        address = target.debugpy_address
+        try:
+            listener = await self.query_maya('debugpy', target.command_address)
+        except MayaError:
+            listener = None  # Older server, which can't tell
+        except OSError as e:
+            log("Exception occurred: \n\n" + str(e))
+            raise maya_connection_error()
+
+        if isinstance(listener, dict):
+            # debugpy was started with Maya, no need to send any code
+            address = (listener['host'], int(listener['port']))
+            log("debugpy is already listening in " + str(target))
+        else:
+            log("Sending code to " + str(target) + "...")
+            try:
+                result = await self.execute_in_maya(code, target.command_address)
+            except MayaError as e:
+                log("Exception occurred: \n\n" + str(e))
+                raise Exception("Maya failed to run the attach code: " + str(e))
+            except OSError as e:
+                log("Exception occurred: \n\n" + str(e))
+                raise maya_connection_error()
+            log("Success, Maya returned " + str(result))
+
+        log("Connecting to " + format_address(address))
+        try:
+            reader, writer = await open_connection_with_retry(address)
+        except OSError as e:
+            log("Exception occurred: \n\n" + str(e))
+            raise Exception("Could not connect to debugpy in Maya at {}: {}".format(format_address(address), e))
+        log("Successfully connected to Maya for debugging after {:.3f}s. Starting...".format(time.time() - start_time))
+
+        if self._debugpy_queue(target.index).closed:
+            # The writer of a previous connection to this target died, start over with a new queue
+            del self.debugpy_queues[target.index]
+
+        self.debugpy_writers.append(writer)
+        self._spawn(self._write_loop(self._debugpy_queue(target.index), writer, 'debugpy'))
+        await self._read_loop(reader, lambda message: self.on_receive_from_debugpy(message, target.index), 'debugpy')
+
+    async def _read_loop(self, reader, callback, name):
+        """
+        Reads messages from reader and passes them to callback until the stream closes.
+        Waits for the queues callback wrote to to drain whenever one of them is full.
+        """
+
+        while True:
+            try:
+                message = await read_message(reader)
+            except (asyncio.IncompleteReadError, ConnectionError) as e:
+                log(LABELS[name] + " closed the connection: " + str(e))
+                return
+
+            queues = [self.debugger_queue] + list(self.debugpy_queues.values())
+            sizes = [queue.qsize() for queue in queues]
+
+            stats.message_received(name, message)
+            callback(message)
+
+            for queue, size in zip(queues, sizes):
+                if queue.qsize() > size and queue.qsize() >= self.queue_size:
+                    await queue.join()
+
+    async def _write_loop(self, queue, writer, name):
+        """
+        Writes each message put in queue to writer, waiting for it to be flushed.
+        Closes the queue when writing fails or the task is cancelled, so no reader waits on it.
+        """
+
+        try:
+            while True:
+                message = await queue.get()
+                try:
+                    writer.write(frame_message(message))
+                    await writer.drain()
+                    stats.message_sent(name, message)
+                    log('Sent to ' + LABELS[name] + ':', message)
+                except ConnectionError as e:
+                    log("Failure writing to " + LABELS[name] + ": " + str(e))
+                    return
+                finally:
+                    queue.task_done()
+        finally:
+            queue.close()
+
+    async def _open_stdin(self):
+        """
+        Wraps stdin in a StreamReader. If the loop can't watch the pipe directly
+        (ie on Windows), a thread feeds it instead.
+        """
+
+        reader = asyncio.StreamReader()
+        try:
+            await self.loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer)
+        except (NotImplementedError, OSError, ValueError):
+            Thread(target=self._feed_stdin, args=(reader,), daemon=True).start()
+        return reader
+
+    def _feed_stdin(self, reader):
+        stdin = sys.stdin.buffer.raw
+        while True:
+            data = stdin.read(65536)
+            if not data:
+                self.loop.call_soon_threadsafe(reader.feed_eof)
+                return
+            self.loop.call_soon_threadsafe(reader.feed_data, data)
+
+    async def _open_stdout(self):
+        """
+        Wraps stdout in a StreamWriter, or in a blocking writer if the loop can't watch the pipe
+        """
+
+        try:
+            transport, protocol = await self.loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout.buffer)
+        except (NotImplementedError, OSError, ValueError):
+            return BlockingWriter(sys.stdout.buffer)
+        return asyncio.StreamWriter(transport, protocol, None, self.loop)
+
+    def _spawn(self, coroutine):
+        task = self.loop.create_task(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task):
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            # Writing to stderr shows the text in the Debugger's output, as raising in a thread does
+            log("Exception occurred: \n\n" + str(task.exception()))
+            sys.stderr.write(str(task.exception()) + '\n')
+            sys.stderr.flush()
+
+
+class AsyncMayaClient:
+    """
+    asyncio version of maya_client.MayaClient, for the command server of one Maya
+    """
+
+    def __init__(self, relay, address):
+        self.relay = relay
+        self.address = address
+        self.writer = None
+        self.lock = asyncio.Lock()
+        self.next_id = 1
+        self.pending = {}  # Request id -> Future receiving the reply
+
+    async def request(self, contents):
+        async with self.lock:
+            if self.writer is None:
+                reader, self.writer = await asyncio.open_connection(*self.address)
+                self.relay._spawn(self._read_loop(reader, self.writer))
+
+            request_id = self.next_id
+            self.next_id += 1
+            reply = self.pending[request_id] = self.relay.loop.create_future()
+
+            request = dict(contents, id=request_id)
+            self.writer.write(frame_message(json.dumps(request).encode('UTF-8')))
+            await self.writer.drain()
+
+        try:
+            contents = await asyncio.wait_for(reply, MAYA_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise MayaError("Maya did not answer within {} seconds".format(MAYA_TIMEOUT))
+        finally:
+            self.pending.pop(request_id, None)
+
+        if not contents.get('success'):
+            raise MayaError(contents.get('error', 'Unknown error'))
+        return contents.get('result')
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+
+    async def _read_loop(self, reader, writer):
+        """
+        Hands each reply from Maya to the request waiting for it, until the connection closes
+        """
+
+        try:
+            while True:
+                contents = json.loads((await read_message(reader)).decode('UTF-8'))
+                reply = self.pending.pop(contents.get('id'), None)
+                if reply and not reply.done():
+                    reply.set_result(contents)
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            log("Connection to Maya closed: " + str(e))
+        finally:
+            if self.writer is writer:
+                self.writer = None
+            writer.close()
+
+            for reply in self.pending.values():
+                if not reply.done():
+                    reply.set_exception(MayaError("Connection to Maya closed before it answered"))
+            self.pending.clear()
+
+
+class TimedQueue(asyncio.Queue):
+    """
+    asyncio version of stats.TimedQueue, recording how long each item waited in it.
+    Once closed, it drops the items waiting in it and any put afterwards.
+    """
+
+    def __init__(self, name):
+        asyncio.Queue.__init__(self)
+        self.name = name
+        self.closed = False
+
+    def put_nowait(self, item):
+        if self.closed:
+            log("Dropped a message for " + self.name + ", which is closed")
+            return
+        asyncio.Queue.put_nowait(self, (time.time(), item))
+
+    def close(self):
+        """ Drops what is still waiting to be written and wakes up whoever waits for the queue to drain """
+        self.closed = True
+        while not self.empty():
+            asyncio.Queue.get_nowait(self)
+            self.task_done()
+
+    def get_nowait(self):
+        put_time, item = asyncio.Queue.get_nowait(self)
+        stats.waited(self.name, time.time() - put_time)
+        return item
+
+
+class BlockingWriter:
+    """
+    Minimal StreamWriter stand-in writing straight to a binary file
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data):
+        self.stream.write(data)
+
+    async def drain(self):
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+
+async def open_connection_with_retry(address, timeout=CONNECT_TIMEOUT):
+    """
+    Opens a connection to address, retrying with backoff while nothing is listening there yet.
+    Same as util.connect_with_retry, without blocking the loop.
+    """
+
+    path = unix_socket_path(address)
+    deadline = time.time() + timeout
+    attempts = 0
+    for delay in backoff_delays():
+        attempts += 1
+        connecting = asyncio.open_connection(*address) if path is None else asyncio.open_unix_connection(path)
+        try:
+            return await asyncio.wait_for(connecting, max(deadline - time.time(), 0.1))
+        except (OSError, asyncio.TimeoutError) as e:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                log("Giving up connecting to {} after {} attempts".format(format_address(address), attempts))
+                raise OSError(str(e) or "Timed out")
+            await asyncio.sleep(min(delay, remaining))
+
+
+async def read_message(reader):
+    """
+    Reads one Content-Length framed message from an asyncio StreamReader and returns its body
+    """
+
+    content_length = 0
+    content_header = CONTENT_HEADER.encode('UTF-8')
+    headers = await reader.readuntil(b'\r\n\r\n')
+    for header in headers.split(b'\r\n'):
+        header = header.strip()
+        if header.startswith(content_header):
+            content_length = int(header[len(content_header):])
+
+    return await reader.readexactly(content_length)
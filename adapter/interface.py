@@ -1,6 +1,12 @@
 
 from sys import stdin, stdout
-from util import CONTENT_HEADER, run, log, Queue
+from util import MessageReader, frame_message, run, log
+from stats import stats, TimedQueue
+
+# Messages are relayed as raw bytes, so use the binary streams.
+# stdin is read unbuffered so that readinto returns as soon as any data arrives
+stdin = stdin.buffer.raw
+stdout = stdout.buffer
 
 
 class DebuggerInterface:
@@ -10,7 +16,7 @@ class DebuggerInterface:
     """
 
     def __init__(self, on_receive = None):
-        self.send_queue = Queue()
+        self.send_queue = TimedQueue('DebuggerInterface.send_queue')
         self.running = False
         self.callback = on_receive
 
@@ -29,6 +35,7 @@ class DebuggerInterface:
     def stop(self):
         if self.running:
             self.running = False
+            self.send_queue.put(None)  # Wake up the send loop so it can exit
 
     def send(self, message):
         self.send_queue.put(message)
@@ -39,37 +46,22 @@ class DebuggerInterface:
         function passed in as the callback with the message recieved.
         """
 
+        reader = MessageReader(stdin.readinto)
+
         while self.running:
             try:
-                content_length = 0
-                while self.running:
-                    header = stdin.readline()
-                    if header:
-                        header = header.strip()
-                    if not header:
-                        break
-                    if header.startswith(CONTENT_HEADER):
-                        content_length = int(header[len(CONTENT_HEADER):])
-
-                if content_length > 0:
-                    total_content = ""
-                    while content_length > 0:
-                        content = stdin.read(content_length)
-                        content_length -= len(content)
-                        total_content += content
-
-                    if content_length == 0:
-                        message = total_content
-                        if self.callback:
-                            self.callback(message)
-
+                message = reader.read()
+            except EOFError:
+                log("Debugger closed stdin.")
+                self.stop()
+                return
             except Exception as e:
                 log("Failure reading stdin: " + str(e))
-                log(header)
-                log(message)
-                log(total_content)
                 raise e
 
+            stats.message_received('debugger', message)
+            if self.callback:
+                self.callback(message)
 
     def _debugger_send_loop(self):
         """
@@ -83,9 +75,9 @@ class DebuggerInterface:
                 return
             else:
                 try:
-                    stdout.write('Content-Length: {}\r\n\r\n'.format(len(msg)))
-                    stdout.write(msg)
+                    stdout.write(frame_message(msg))
                     stdout.flush()
+                    stats.message_sent('debugger', msg)
                     log('Sent to Debugger:', msg)
                 except Exception as e:
                     log("Failure writing to stdout (normal on exit):" + str(e))
@@ -0,0 +1,143 @@
+"""
+
+Client side of the command server running in Maya (resources/module/scripts/maya_threaded_server.py).
+
+A single connection is kept open and shared by every piece of code sent to Maya.
+Requests carry an id, so several can be in flight at once, and each is answered with
+the result or the error of running the code on Maya's main thread.
+
+"""
+
+from util import log, frame_message, MessageReader, MAYA_ADDRESS
+from stats import TimedQueue
+from threading import Thread, Lock, Event
+import socket
+import json
+
+
+class MayaError(Exception):
+    """ Raised when code sent to Maya failed, or Maya didn't answer """
+
+
+class MayaClient:
+    """
+    Sends code to Maya over a persistent connection, reconnecting when it drops
+    """
+
+    def __init__(self, address=MAYA_ADDRESS):
+        self.address = address
+        self.socket = None
+        self.lock = Lock()  # Guards the socket, request ids and pending requests
+        self.next_id = 1
+        self.pending = {}  # Request id -> (Event set on reply, dict receiving the reply)
+
+    def execute(self, code, timeout=None):
+        """
+        Runs code in Maya's main thread and returns the repr of its value, None for statements.
+        Raises MayaError if it failed, or socket errors if Maya can't be reached.
+        """
+
+        return self._request({"code": code}, timeout)
+
+    def query(self, query, timeout=None):
+        """
+        Asks the server about its state without running any code, ie "debugpy"
+        for the address debugpy is already listening on
+        """
+
+        return self._request({"query": query}, timeout)
+
+    def _request(self, contents, timeout):
+        done = Event()
+        reply = {}
+
+        with self.lock:
+            if self.socket is None:
+                self.socket = socket.create_connection(self.address)
+                reader = Thread(target=self._read_loop, args=(self.socket,))
+                reader.daemon = True
+                reader.start()
+
+            request_id = self.next_id
+            self.next_id += 1
+            self.pending[request_id] = (done, reply)
+
+            request = dict(contents, id=request_id)
+            try:
+                self.socket.sendall(frame_message(json.dumps(request).encode('UTF-8')))
+            except OSError:
+                self.pending.pop(request_id, None)
+                self._disconnect(self.socket)
+                raise
+
+        if not done.wait(timeout):
+            with self.lock:
+                self.pending.pop(request_id, None)
+            raise MayaError("Maya did not answer within {} seconds".format(timeout))
+
+        if not reply:
+            raise MayaError("Connection to Maya closed before it answered")
+        if not reply.get('success'):
+            raise MayaError(reply.get('error', 'Unknown error'))
+        return reply.get('result')
+
+    def close(self):
+        with self.lock:
+            if self.socket:
+                self._disconnect(self.socket)
+
+    def _read_loop(self, sock):
+        """
+        Hands each reply to the request waiting for it, until the connection closes
+        """
+
+        reader = MessageReader(sock.recv_into)
+        try:
+            while True:
+                contents = json.loads(reader.read().decode('UTF-8'))
+                with self.lock:
+                    waiting = self.pending.pop(contents.get('id'), None)
+                if waiting:
+                    waiting[1].update(contents)
+                    waiting[0].set()
+        except Exception as e:
+            log("Connection to Maya closed: " + str(e))
+
+        with self.lock:
+            self._disconnect(sock)
+
+    def _disconnect(self, sock):
+        """
+        Closes sock and fails the requests waiting on it. Must hold the lock
+        """
+
+        try:
+            # Shutting down wakes up the reader blocked on this socket
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+
+        if self.socket is sock:
+            self.socket = None
+            for done, _ in self.pending.values():
+                done.set()
+            self.pending.clear()
+
+
+class MayaTarget:
+    """
+    One Maya process taking part in the debug session: where its command server and debugpy
+    listen, and the connections to them
+    """
+
+    def __init__(self, index, command_address, debugpy_address):
+        self.index = index
+        self.command_address = command_address
+        self.debugpy_address = debugpy_address
+        self.maya_client = MayaClient(command_address)
+        self.send_queue = TimedQueue('debugpy_send_queue' if index == 0 else 'debugpy_send_queue.' + str(index))
+        self.socket = None  # Connection to debugpy, set once attached
+
+    def __str__(self):
+        return "Maya at {}:{}".format(*self.command_address)
@@ -0,0 +1,225 @@
+"""
+
+Lets a single debug session span several Maya processes ("targets").
+
+Each target has its own command port and debugpy, reached through its own connection.
+The ids debugpy hands out (threads, frames, variables, source references) are made unique
+across targets by encoding the target's index in them, so whichever of those ids a request
+carries tells which target it goes to without any lookup. Requests concerning the whole
+session (breakpoints, configuration, the list of threads...) go to every target,
+and their responses are merged into one.
+
+"""
+
+from util import log
+from threading import Lock
+import json
+
+
+# Ids are encoded as local id * MAX_TARGETS + target index
+MAX_TARGETS = 64
+
+# Keys whose values are ids handed out by debugpy
+ID_KEYS = ('threadId', 'frameId', 'variablesReference', 'sourceReference')
+# Lists whose items' "id" is also one of those
+ID_LISTS = ('threads', 'stackFrames')
+
+# Requests sent to every target, unless they carry an id telling which one they concern
+FANOUT_COMMANDS = ('attach', 'configurationDone', 'setBreakpoints', 'setFunctionBreakpoints',
+                   'setExceptionBreakpoints', 'threads', 'modules', 'loadedSources', 'pause',
+                   'disconnect', 'terminate')
+# Lists in the body of responses to fanned out requests, concatenated when merging them
+MERGED_LISTS = {'threads': 'threads', 'modules': 'modules', 'loadedSources': 'sources'}
+
+# Events only forwarded the first time a target sends them
+FIRST_EVENTS = ('initialized', 'process')
+# Events only forwarded once every target sent them
+LAST_EVENTS = ('exited', 'terminated')
+
+
+def to_global(local_id, index):
+    """ Turns an id handed out by the target at index into an id unique to the session """
+    return local_id * MAX_TARGETS + index if local_id else 0
+
+
+def to_local(global_id):
+    """ Returns (target index, id as the target knows it) for an id made by to_global """
+    return global_id % MAX_TARGETS, global_id // MAX_TARGETS
+
+
+class SessionMultiplexer:
+    """
+    Routes the debugger's requests to the targets, and merges what they send back into one session.
+    Safe to use from the threads reading each target.
+    """
+
+    def __init__(self, count):
+        if count > MAX_TARGETS:
+            raise ValueError("Can't debug more than {} Maya targets at once".format(MAX_TARGETS))
+
+        self.lock = Lock()
+        self.active = set(range(count))  # Indexes of the targets still connected
+        self.fanouts = {}  # seq of fanned out requests -> (command, {target index: response})
+        self.events = {}  # Event name -> indexes of the targets which sent it
+        self.forwarded = set()  # Names of the events only sent once, which were
+
+    def route_request(self, message):
+        """
+        Returns the list of (target index, message) to send a request from the debugger to
+        """
+
+        contents = json.loads(message.decode('UTF-8'))
+        arguments = contents.get('arguments')
+
+        index = _find_target(arguments)
+        if index is not None:
+            _translate(arguments, lambda value: to_local(value)[1])
+            return [(index, json.dumps(contents).encode('UTF-8'))]
+
+        if contents.get('command') not in FANOUT_COMMANDS:
+            # Nothing tells which target it concerns, ie evaluating without a frame
+            return [(0, message)]
+
+        self.fan_out(contents['seq'], contents['command'])
+        with self.lock:
+            return [(index, message) for index in sorted(self.active)]
+
+    def fan_out(self, seq, command):
+        """
+        Waits for every target to answer the request seq, to send the debugger a single response to it
+        """
+
+        with self.lock:
+            self.fanouts[seq] = (command, {})
+
+    def on_message(self, index, message):
+        """
+        Translates a message from the target at index for the debugger.
+        Returns the list of messages to send to the debugger, empty while waiting for other targets.
+        """
+
+        contents = json.loads(message.decode('UTF-8'))
+        _translate(contents, lambda value: to_global(value, index))
+
+        with self.lock:
+            if contents.get('type') == 'event':
+                return self._on_event(index, contents)
+
+            fanout = self.fanouts.get(contents.get('request_seq'))
+            if fanout is None:
+                return [json.dumps(contents).encode('UTF-8')]
+
+            fanout[1][index] = contents
+            return self._complete_fanouts()
+
+    def remove_target(self, index):
+        """
+        Stops waiting for the target at index, once its connection closed.
+        Returns the messages to send to the debugger that were only waiting for it.
+        """
+
+        with self.lock:
+            self.active.discard(index)
+            log("Maya target {} is gone, {} left".format(index, len(self.active)))
+
+            messages = self._complete_fanouts()
+            for event in LAST_EVENTS:
+                if event in self.events and event not in self.forwarded and self.events[event] >= self.active:
+                    self.forwarded.add(event)
+                    messages.append(self._event_message(event))
+            return messages
+
+    def _on_event(self, index, contents):
+        event = contents.get('event')
+        if event not in FIRST_EVENTS and event not in LAST_EVENTS:
+            return [json.dumps(contents).encode('UTF-8')]
+
+        sent_by = self.events.setdefault(event, set())
+        sent_by.add(index)
+        if event in self.forwarded or (event in LAST_EVENTS and not sent_by >= self.active):
+            return []
+
+        self.forwarded.add(event)
+        return [json.dumps(contents).encode('UTF-8')]
+
+    def _event_message(self, event):
+        return json.dumps({"seq": 0, "type": "event", "event": event, "body": {}}).encode('UTF-8')
+
+    def _complete_fanouts(self):
+        """
+        Merges the fanned out requests which every remaining target answered. Must hold the lock
+        """
+
+        messages = []
+        for seq, (command, responses) in list(self.fanouts.items()):
+            if responses and set(responses) >= self.active:
+                del self.fanouts[seq]
+                merged = _merge(command, [responses[index] for index in sorted(responses)])
+                messages.append(json.dumps(merged).encode('UTF-8'))
+        return messages
+
+
+def _find_target(value):
+    """
+    Returns the index of the target the first id found in value belongs to, or None
+    """
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in ID_KEYS and isinstance(item, int) and item:
+                return to_local(item)[0]
+            index = _find_target(item)
+            if index is not None:
+                return index
+    elif isinstance(value, list):
+        for item in value:
+            index = _find_target(item)
+            if index is not None:
+                return index
+    return None
+
+
+def _translate(value, convert):
+    """
+    Replaces in place every id in value with convert(id)
+    """
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in ID_KEYS and isinstance(item, int):
+                value[key] = convert(item)
+            elif key in ID_LISTS and isinstance(item, list):
+                for entry in item:
+                    if isinstance(entry, dict) and isinstance(entry.get('id'), int):
+                        entry['id'] = convert(entry['id'])
+                    _translate(entry, convert)
+            else:
+                _translate(item, convert)
+    elif isinstance(value, list):
+        for item in value:
+            _translate(item, convert)
+
+
+def _merge(command, responses):
+    """
+    Merges the responses of every target to the same request into one
+    """
+
+    succeeded = [response for response in responses if response.get('success')]
+    merged = dict(succeeded[0] if succeeded else responses[0])
+
+    if command in MERGED_LISTS:
+        key = MERGED_LISTS[command]
+        items = [item for response in succeeded for item in (response.get('body') or {}).get(key, [])]
+        merged['body'] = dict(merged.get('body') or {}, **{key: items})
+
+    elif command == 'setBreakpoints' and succeeded:
+        # A breakpoint is verified as soon as one of the targets could set it
+        breakpoints = [dict(bp) for bp in (merged.get('body') or {}).get('breakpoints', [])]
+        for response in succeeded[1:]:
+            for bp, other in zip(breakpoints, (response.get('body') or {}).get('breakpoints', [])):
+                if other.get('verified') and not bp.get('verified'):
+                    bp.update(other)
+        merged['body'] = dict(merged.get('body') or {}, breakpoints=breakpoints)
+
+    return merged
@@ -0,0 +1,156 @@
+"""Microbenchmarks for pydevd's file filtering (which decides what's "just my code").
+
+Run from anywhere with: python adapter/python/benchmarks/bench_filtering.py
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import sys
+import timeit
+
+_python_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _python_dir)
+sys.path.insert(0, os.path.join(_python_dir, "debugpy", "_vendored", "pydevd"))
+
+from _pydevd_bundle.pydevd_filtering import ExcludeFilter, FilesFiltering  # noqa
+
+FILES = 10000
+PROJECT_ROOTS = 20
+LIBRARY_ROOTS = 80
+
+
+def roots():
+    """Project and library roots shaped like the ones of a studio Maya environment."""
+    project_roots = [
+        "/studio/projects/show_%d/tools/python" % i for i in range(PROJECT_ROOTS)
+    ]
+    library_roots = [
+        "/studio/packages/package_%d/1.%d.0/python" % (i, i % 7)
+        for i in range(LIBRARY_ROOTS - 2)
+    ]
+    library_roots.append("/usr/autodesk/maya/lib/python3.7/site-packages")
+    library_roots.append("/usr/autodesk/maya/lib/python3.7")
+    return project_roots, library_roots
+
+
+def filenames():
+    """Distinct files, some in project roots, some in libraries and some in neither."""
+    project_roots, library_roots = roots()
+    all_roots = project_roots + library_roots + ["/tmp/generated"]
+    return [
+        "%s/module_%d/sub_%d/file_%d.py" % (all_roots[i % len(all_roots)], i % 13, i % 5, i)
+        for i in range(FILES)
+    ]
+
+
+def linear_in_project_roots(files_filtering, filename):
+    """The check done by scanning every root (as pydevd did before the roots trie)."""
+    filename = files_filtering._absolute_normalized_path(filename)
+    filename_as_dir = filename + "/"
+
+    found_in_project = [
+        root
+        for root in files_filtering._get_project_roots()
+        if filename.startswith(root) or root == filename_as_dir
+    ]
+    found_in_library = [
+        root
+        for root in files_filtering._get_library_roots()
+        if filename.startswith(root) or root == filename_as_dir
+    ]
+    if not found_in_project:
+        return False
+    if not found_in_library:
+        return True
+    return max(len(x) for x in found_in_project) > max(len(x) for x in found_in_library)
+
+
+def exclude_filters(project_roots, library_roots):
+    """Exclude filters as created from the "rules" of a typical justMyCode=false launch."""
+    filters = []
+    # Directories (sorted by length, as done for the rules in the launch configuration).
+    for root in sorted(project_roots + library_roots, key=lambda root: -len(root)):
+        filters.append(ExcludeFilter(root + "/**", root in library_roots, True))
+    filters.extend(
+        [
+            ExcludeFilter("**/tests/**", True, True),
+            ExcludeFilter("**/*_pb2.py", True, True),
+            ExcludeFilter("**/generated/**/ui_*.py", True, True),
+            ExcludeFilter("**/vendor/**/six.py", True, True),
+        ]
+    )
+    filters.extend(
+        ExcludeFilter(name, True, False)
+        for name in ("pymel", "maya.app", "shiboken2", "PySide2", "Qt")
+    )
+    return filters
+
+
+def bench_exclude_by_filter(files_filtering, files, module_names):
+    def run():
+        for filename, module_name in zip(files, module_names):
+            files_filtering.exclude_by_filter(filename, module_name)
+
+    return min(timeit.repeat(run, number=1, repeat=5)) / len(files)
+
+
+def main():
+    project_roots, library_roots = roots()
+    files_filtering = FilesFiltering()
+    files_filtering.set_project_roots(project_roots)
+    files_filtering.set_library_roots(library_roots)
+    files = filenames()
+
+    # Both must agree (and warm up the caches of the normalized paths).
+    for filename in files:
+        assert files_filtering.in_project_roots(filename) == linear_in_project_roots(
+            files_filtering, filename
+        )
+
+    print(
+        "in_project_roots for {0} files, {1} roots:".format(
+            FILES, PROJECT_ROOTS + LIBRARY_ROOTS
+        )
+    )
+    for name, check in (
+        ("linear scan", lambda f: linear_in_project_roots(files_filtering, f)),
+        ("roots trie", files_filtering.in_project_roots),
+    ):
+
+        def run():
+            for filename in files:
+                check(filename)
+
+        best = min(timeit.repeat(run, number=1, repeat=5))
+        print("  {0:12}  {1:8.2f} us/file".format(name, best / FILES * 1e6))
+
+    filters = exclude_filters(project_roots, library_roots)
+    module_names = ["package.module_%d" % (i % 13) for i in range(FILES)]
+    print("exclude_by_filter for {0} files:".format(FILES))
+    for name, rules in (
+        ("globs only", [f for f in filters if "**/" in f.name[:3]]),
+        ("{0} rules".format(len(filters)), filters),
+    ):
+        files_filtering.set_exclude_filters(rules)
+        print(
+            "  {0:12}  {1:8.2f} us/file".format(
+                name,
+                bench_exclude_by_filter(files_filtering, files, module_names) * 1e6,
+            )
+        )
+
+    # A pattern with a chain of `**` (which would be exponential if matched recursively).
+    files_filtering.set_exclude_filters(
+        [ExcludeFilter("/".join(["**"] * 10) + "/nomatch.py", True, True)]
+    )
+    print(
+        "  {0:12}  {1:8.2f} us/file".format(
+            "** chain",
+            bench_exclude_by_filter(files_filtering, files, module_names) * 1e6,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
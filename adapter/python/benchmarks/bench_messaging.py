@@ -0,0 +1,136 @@
+"""Microbenchmarks for debugpy.common.messaging.
+
+Run from anywhere with: python adapter/python/benchmarks/bench_messaging.py
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from debugpy.common import messaging  # noqa
+
+VARIABLES = 10000
+MESSAGES = 20
+OUTPUT_EVENTS = 20000
+
+
+def variables_event(seq, count=VARIABLES):
+    """A message shaped like a "variables" response with count variables."""
+    return {
+        "seq": seq,
+        "type": "event",
+        "event": "variables",
+        "body": {
+            "variables": [
+                {
+                    "name": "item_%d" % i,
+                    "value": "'%s'" % ("x" * 32),
+                    "type": "str",
+                    "evaluateName": "items[%d]" % i,
+                    "variablesReference": 0,
+                    "presentationHint": {"attributes": ["rawString"]},
+                }
+                for i in range(count)
+            ]
+        },
+    }
+
+
+def framed(messages):
+    data = b""
+    for message in messages:
+        body = json.dumps(message).encode("utf-8")
+        data += b"Content-Length: %d\r\n\r\n" % len(body) + body
+    return data
+
+
+def bench_parse(lazy, data):
+    """Parses every message in data, without running any handler."""
+
+    stream = messaging.JsonIOStream(io.BytesIO(data), io.BytesIO(), "bench")
+    channel = messaging.JsonMessageChannel(stream)
+    channel.lazy_message_dicts = lazy
+    channel._enqueue_handlers = lambda what, *handlers: None
+    for _ in range(MESSAGES):
+        channel._parse_incoming_message()
+
+
+def output_event(seq):
+    """A small "output" event, like the ones sent for every line a program prints."""
+    return {
+        "seq": seq,
+        "type": "event",
+        "event": "output",
+        "body": {"category": "stdout", "output": "line %d\n" % seq},
+    }
+
+
+def bench_write(window):
+    """Writes a burst of output events to a socket, and waits for them to be read."""
+
+    writer_sock, reader_sock = socket.socketpair()
+    stream = messaging.JsonIOStream.from_socket(writer_sock, "bench")
+    stream.write_coalescing_window = window
+
+    reader_stream = messaging.JsonIOStream.from_socket(reader_sock, "bench")
+
+    def read_all():
+        for _ in range(OUTPUT_EVENTS):
+            reader_stream.read_json()
+
+    reader = threading.Thread(target=read_all)
+    reader.start()
+    for seq in range(1, OUTPUT_EVENTS + 1):
+        stream.write_json(output_event(seq))
+    stream.flush()
+    reader.join()
+    messages_per_flush = stream.coalesced_messages / stream.flushes if stream.flushes else 0
+    stream.close()
+    reader_stream.close()
+    return messages_per_flush
+
+
+def main():
+    data = framed(variables_event(seq) for seq in range(1, MESSAGES + 1))
+    print(
+        "Parsing {0} messages of {1} variables ({2} KB each):".format(
+            MESSAGES, VARIABLES, len(data) // MESSAGES // 1024
+        )
+    )
+
+    results = {}
+    for lazy in (False, True):
+        best = min(timeit.repeat(lambda: bench_parse(lazy, data), number=1, repeat=5))
+        results[lazy] = best / MESSAGES
+        print(
+            "  lazy_message_dicts={0!s:5}  {1:8.2f} ms/message".format(
+                lazy, results[lazy] * 1000
+            )
+        )
+    print("  speedup: {0:.1f}x".format(results[False] / results[True]))
+
+    print("Writing {0} output events to a socket:".format(OUTPUT_EVENTS))
+    for window in (0, 0.001):
+        messages_per_flush = [0]
+
+        def run():
+            messages_per_flush[0] = bench_write(window)
+
+        best = min(timeit.repeat(run, number=1, repeat=5))
+        print(
+            "  write_coalescing_window={0:<5}  {1:8.2f} us/message  {2:.0f} messages/write".format(
+                window, best / OUTPUT_EVENTS * 1e6, messages_per_flush[0] or 1
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
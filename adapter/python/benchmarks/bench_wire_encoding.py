@@ -0,0 +1,113 @@
+"""Compares the encodings pydevd can send messages to the adapter in.
+
+For each encoding, measures the size of typical "stackTrace" and "variables" responses,
+and the time pydevd takes to encode them plus the time the adapter takes to read them.
+
+Run from anywhere with: python adapter/python/benchmarks/bench_wire_encoding.py
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+import os
+import sys
+import timeit
+
+_python_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _python_dir)
+sys.path.insert(0, os.path.join(_python_dir, "debugpy", "_vendored", "pydevd"))
+
+from debugpy.common import messaging  # noqa
+from _pydevd_bundle import pydevd_constants  # noqa
+from _pydevd_bundle.pydevd_comm_constants import CMD_RETURN  # noqa
+from _pydevd_bundle.pydevd_net_command import NetCommand  # noqa
+
+from bench_messaging import variables_event  # noqa
+
+FRAMES = 100
+VARIABLES = 1000
+MESSAGES = 50
+
+
+def stack_trace_response(seq, count=FRAMES):
+    """A message shaped like a "stackTrace" response with count frames."""
+    return {
+        "seq": seq,
+        "type": "response",
+        "request_seq": seq,
+        "success": True,
+        "command": "stackTrace",
+        "body": {
+            "stackFrames": [
+                {
+                    "id": i + 1,
+                    "name": "function_%d" % i,
+                    "source": {
+                        "path": "/home/user/project/package/module_%d.py" % i,
+                        "sourceReference": 0,
+                    },
+                    "line": i * 10,
+                    "column": 1,
+                }
+                for i in range(count)
+            ],
+            "totalFrames": count,
+        },
+    }
+
+
+class _SocketStub(object):
+    def __init__(self):
+        self.sent = []
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+
+def encode(messages):
+    """Encodes messages as pydevd does, and returns all the bytes it would send."""
+    sock = _SocketStub()
+    for message in messages:
+        NetCommand(CMD_RETURN, 0, dict(message), is_json=True).send(sock)
+    return b"".join(sock.sent)
+
+
+def decode(data):
+    """Reads every message in data as the adapter does."""
+    stream = messaging.JsonIOStream(io.BytesIO(data), io.BytesIO(), "bench")
+    for _ in range(MESSAGES):
+        stream.read_json()
+
+
+def main():
+    pydevd_constants.set_protocol(pydevd_constants.HTTP_JSON_PROTOCOL)
+    encodings = pydevd_constants.get_supported_wire_encodings()
+
+    for name, make in (
+        ("stackTrace", lambda seq: stack_trace_response(seq)),
+        ("variables", lambda seq: variables_event(seq, VARIABLES)),
+    ):
+        messages = [make(seq) for seq in range(1, MESSAGES + 1)]
+        print('"{0}" responses, {1} messages:'.format(name, MESSAGES))
+
+        for encoding in encodings:
+            pydevd_constants.set_wire_encoding(encoding)
+            data = encode(messages)
+            encoding_time = min(
+                timeit.repeat(lambda: encode(messages), number=1, repeat=5)
+            )
+            decoding_time = min(timeit.repeat(lambda: decode(data), number=1, repeat=5))
+            print(
+                "  {0:8}  {1:8} bytes  encode {2:7.3f} ms  decode {3:7.3f} ms per message".format(
+                    encoding,
+                    len(data) // MESSAGES,
+                    encoding_time / MESSAGES * 1000,
+                    decoding_time / MESSAGES * 1000,
+                )
+            )
+
+        pydevd_constants.set_wire_encoding(pydevd_constants.JSON_WIRE_ENCODING)
+
+
+if __name__ == "__main__":
+    main()
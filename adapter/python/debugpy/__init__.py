@@ -98,10 +98,17 @@ def listen(address):
     standard socket module for the AF_INET address family, or a port
     number. If only the port is specified, host is "127.0.0.1".
 
+    address can also be the path of a Unix domain socket, which is then
+    also used for this process to connect to the adapter (through a
+    socket next to it, named after it plus ".server"). Such a path can be
+    passed as a string, or as a host like "unix:/path/to/socket" in a
+    (host, port) tuple - the port is then ignored.
+
     Returns the interface and the port on which the debug adapter is
     actually listening, in the same format as address. This may be
     different from address if port was 0 in the latter, in which case
-    the adapter will pick some unused ephemeral port to listen on.
+    the adapter will pick some unused ephemeral port to listen on. For
+    Unix domain sockets, it's ("unix:/path/to/socket", 0).
 
     This function does't wait for a client to connect to the debug
     adapter that it starts. Use wait_for_client() to block execution
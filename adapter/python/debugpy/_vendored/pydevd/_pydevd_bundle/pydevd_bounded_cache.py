@@ -0,0 +1,78 @@
+'''
+Bounds the size of the caches pydevd keeps for every file/code object it sees (which would
+otherwise grow without limit in long running processes which compile code on the fly).
+
+The cache itself is a regular dict (`BoundedCache.cache`) which the fast paths access
+directly, so, a hit is still just a dict lookup (note that the frame evaluation mode requires
+an exact dict in `PyDB.get_cache_file_type()`) plus an increment of `BoundedCache.hits`. Only
+misses go through the `BoundedCache`, whose `on_miss()` must be called before adding a new
+entry to the dict.
+
+Note: the counters aren't synchronized (they're just stats) and lookups done directly in the
+dict by other fast paths (such as the frame evaluation) aren't counted as hits.
+'''
+from itertools import islice
+
+from _pydevd_bundle.pydevd_constants import PYDEVD_MAX_CACHE_SIZE
+
+# name -> BoundedCache (a new cache with the same name replaces the old one in the stats).
+_bounded_caches = {}
+
+
+class BoundedCache(object):
+
+    __slots__ = ['name', 'max_size', 'cache', 'hits', 'misses', 'evictions']
+
+    def __init__(self, name, max_size=PYDEVD_MAX_CACHE_SIZE):
+        '''
+        :param str name:
+            The name used to report the stats of this cache.
+
+        :param int max_size:
+            The max number of entries in the cache (<= 0 means it's unbounded).
+        '''
+        self.name = name
+        self.max_size = max_size
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _bounded_caches[name] = self
+
+    def on_miss(self):
+        '''
+        Makes room for a new entry, evicting the oldest quarter of the entries if the cache
+        is full.
+
+        Note that hits don't reorder entries (they're plain dict lookups), so, entries are
+        evicted in insertion order (in Python 2 the order is arbitrary) and a hot entry which
+        is evicted is just added back in its next miss.
+        '''
+        self.misses += 1
+        cache = self.cache
+        max_size = self.max_size
+        if 0 < max_size <= len(cache):
+            # Note: list(islice()) is done in a single step (so, the dict can't be changed by
+            # another thread while iterating) and pop() is used because another thread may
+            # have removed (or cleared) the entries in the meanwhile.
+            evict = list(islice(cache, max(1, max_size // 4)))
+            for key in evict:
+                cache.pop(key, None)
+            self.evictions += len(evict)
+
+    def get_stats(self):
+        return {
+            'size': len(self.cache),
+            'maxSize': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+def get_bounded_caches_stats():
+    '''
+    :return dict(str, dict):
+        The stats of each cache (as reported in the `pydevdSystemInfo` response).
+    '''
+    return dict((name, bounded_cache.get_stats()) for name, bounded_cache in list(_bounded_caches.items()))
@@ -66,6 +66,7 @@ each command has a format:
 import itertools
 import linecache
 import os
+import stat
 
 from _pydev_bundle.pydev_imports import _queue
 from _pydev_imps._pydev_saved_modules import time
@@ -80,7 +81,7 @@ from _pydev_bundle._pydev_completer import extract_token_and_qualifier
 from _pydevd_bundle._debug_adapter.pydevd_schema import VariablesResponseBody, \
     SetVariableResponseBody
 from _pydevd_bundle._debug_adapter import pydevd_base_schema, pydevd_schema
-from _pydevd_bundle.pydevd_net_command import NetCommand
+from _pydevd_bundle.pydevd_net_command import NetCommand, can_sendmsg, sendmsg_all
 from _pydevd_bundle.pydevd_xml import ExceptionOnEvaluate
 from _pydevd_bundle.pydevd_constants import ForkSafeLock, NULL
 from _pydevd_bundle.pydevd_daemon_thread import PyDBDaemonThread
@@ -310,24 +311,65 @@ class ReaderThread(PyDBDaemonThread):
         self.process_net_command(self.py_db, cmd_id, seq, text)
 
 
+class _BatchSocket(object):
+    ''' Collects what NetCommand.send() writes, so that a batch of commands is sent at once. '''
+
+    def __init__(self):
+        self.chunks = []
+
+    def sendall(self, data):
+        self.chunks.append(data)
+
+    def sendmsg(self, buffers):
+        self.chunks.extend(buffers)
+        return sum(len(b) for b in buffers)
+
+
 class WriterThread(PyDBDaemonThread):
     ''' writer thread writes out the commands in an infinite loop '''
 
+    # Maximum number of queued commands sent with a single write.
+    MAX_BATCH_SIZE = 100
+
     def __init__(self, sock, py_db, terminate_on_socket_close=True):
         PyDBDaemonThread.__init__(self, py_db)
         self.sock = sock
         self.__terminate_on_socket_close = terminate_on_socket_close
         self.setName("pydevd.Writer")
-        self._cmd_queue = _queue.Queue()
+        self._cmd_queue = _queue.Queue()  # Holds (time added, command)
         if pydevd_vm_type.get_vm_type() == 'python':
             self.timeout = 0
         else:
             self.timeout = 0.1
 
+        # See: get_stats()
+        self.max_queue_depth = 0
+        self.batches_sent = 0
+        self.commands_sent = 0
+        self.total_send_latency = 0.0
+        self.max_send_latency = 0.0
+
     def add_command(self, cmd):
         ''' cmd is NetCommand '''
         if not self._kill_received:  # we don't take new data after everybody die
-            self._cmd_queue.put(cmd, False)
+            self._cmd_queue.put((time.time(), cmd), False)
+
+    def get_stats(self):
+        '''
+        :return dict:
+            The number of commands waiting to be sent, the most there ever were, how many
+            were sent (and in how many batches) and how long they waited (in seconds) from the
+            time they were added until they were sent.
+        '''
+        commands_sent = self.commands_sent
+        return {
+            'queueDepth': self._cmd_queue.qsize(),
+            'maxQueueDepth': self.max_queue_depth,
+            'batchesSent': self.batches_sent,
+            'commandsSent': commands_sent,
+            'averageSendLatency': self.total_send_latency / commands_sent if commands_sent else 0.0,
+            'maxSendLatency': self.max_send_latency,
+        }
 
     @overrides(PyDBDaemonThread._on_run)
     def _on_run(self):
@@ -336,47 +378,51 @@ class WriterThread(PyDBDaemonThread):
         try:
             while True:
                 try:
-                    try:
-                        cmd = self._cmd_queue.get(True, 0.1)
-                    except _queue.Empty:
-                        if self._kill_received:
-                            pydev_log.debug('WriterThread: kill_received (sock.shutdown(SHUT_WR))')
-                            try:
-                                self.sock.shutdown(SHUT_WR)
-                            except:
-                                pass
-                            # Note: don't close the socket, just send the shutdown,
-                            # then, when no data is received on the reader, it can close
-                            # the socket.
-                            # See: https://blog.netherlabs.nl/articles/2009/01/18/the-ultimate-so_linger-page-or-why-is-my-tcp-not-reliable
-
-                            # try:
-                            #     self.sock.close()
-                            # except:
-                            #     pass
-
-                            return  # break if queue is empty and _kill_received
-                        else:
-                            continue
+                    # Block until there's something to send (note that being killed also adds
+                    # an exit command, so, that wakes us up too), then take whatever else is
+                    # queued along with it.
+                    batch = [self._cmd_queue.get()]
+                    queue_depth = self._cmd_queue.qsize() + 1
+                    while len(batch) < self.MAX_BATCH_SIZE:
+                        try:
+                            batch.append(self._cmd_queue.get_nowait())
+                        except _queue.Empty:
+                            break
                 except:
                     # pydev_log.info('Finishing debug communication...(1)')
                     # when liberating the thread here, we could have errors because we were shutting down
                     # but the thread was still not liberated
                     return
 
-                if cmd.as_dict is not None:
-                    for listener in self.py_db.dap_messages_listeners:
-                        listener.before_send(cmd.as_dict)
-
-                notify_about_gevent_if_needed()
-                cmd.send(self.sock)
+                if queue_depth > self.max_queue_depth:
+                    self.max_queue_depth = queue_depth
 
-                if cmd.id == CMD_EXIT:
+                if self._send_batch(batch):
                     pydev_log.debug('WriterThread: CMD_EXIT received')
                     break
                 if time is None:
                     break  # interpreter shutdown
-                time.sleep(self.timeout)
+
+                if self._kill_received and self._cmd_queue.empty():
+                    pydev_log.debug('WriterThread: kill_received (sock.shutdown(SHUT_WR))')
+                    try:
+                        self.sock.shutdown(SHUT_WR)
+                    except:
+                        pass
+                    # Note: don't close the socket, just send the shutdown,
+                    # then, when no data is received on the reader, it can close
+                    # the socket.
+                    # See: https://blog.netherlabs.nl/articles/2009/01/18/the-ultimate-so_linger-page-or-why-is-my-tcp-not-reliable
+
+                    # try:
+                    #     self.sock.close()
+                    # except:
+                    #     pass
+
+                    return  # break if queue is empty and _kill_received
+
+                if self.timeout:
+                    time.sleep(self.timeout)
         except Exception:
             if self.__terminate_on_socket_close:
                 self.py_db.dispose_and_kill_all_pydevd_threads()
@@ -385,6 +431,52 @@ class WriterThread(PyDBDaemonThread):
         finally:
             pydev_log.debug('WriterThread: exit')
 
+    def _send_batch(self, batch):
+        '''
+        Sends the commands in the batch with a single write (scatter-gather when the socket
+        supports it).
+
+        :return bool:
+            True if the batch had a CMD_EXIT (in which case the commands after it aren't sent).
+        '''
+        listeners = self.py_db.dap_messages_listeners
+        batch_sock = _BatchSocket()
+        exit_received = False
+        sent = 0
+        for _added, cmd in batch:
+            if listeners and cmd.as_dict is not None:
+                for listener in listeners:
+                    listener.before_send(cmd.as_dict)
+
+            cmd.send(batch_sock)
+            sent += 1
+            if cmd.id == CMD_EXIT:
+                exit_received = True
+                break
+
+        notify_about_gevent_if_needed()
+        if batch_sock.chunks:
+            try:
+                if can_sendmsg(self.sock):
+                    sendmsg_all(self.sock, batch_sock.chunks)
+                else:
+                    self.sock.sendall(b''.join(batch_sock.chunks))
+            except:
+                if not IS_JYTHON:
+                    raise
+                # Ignore errors in sock.sendall in Jython (seems to be common for Jython to
+                # give spurious exceptions at interpreter shutdown here).
+
+        now = time.time()
+        for added, _cmd in batch[:sent]:
+            latency = now - added
+            self.total_send_latency += latency
+            if latency > self.max_send_latency:
+                self.max_send_latency = latency
+        self.commands_sent += sent
+        self.batches_sent += 1
+        return exit_received
+
     def empty(self):
         return self._cmd_queue.empty()
 
@@ -398,15 +490,41 @@ class WriterThread(PyDBDaemonThread):
         PyDBDaemonThread.do_kill_pydev_thread(self)
 
 
+# Hosts starting with it stand for the Unix domain socket at the path that follows
+# (i.e.: unix:/tmp/debugpy.sock) -- the port is ignored then.
+UNIX_HOST_PREFIX = 'unix:'
+
+
+def get_unix_socket_path(host):
+    '''
+    :return str|None:
+        The path of the Unix domain socket host stands for, or None if it's a regular host.
+    '''
+    if host and host.startswith(UNIX_HOST_PREFIX):
+        return host[len(UNIX_HOST_PREFIX):]
+    return None
+
+
 def create_server_socket(host, port):
+    unix_socket_path = get_unix_socket_path(host)
     try:
-        server = socket(AF_INET, SOCK_STREAM, IPPROTO_TCP)
-        if IS_WINDOWS and not IS_JYTHON:
-            server.setsockopt(SOL_SOCKET, SO_EXCLUSIVEADDRUSE, 1)
+        if unix_socket_path is not None:
+            server = socket(socket_module.AF_UNIX, SOCK_STREAM)
+            # Remove the file of a socket that was left behind (we can't bind otherwise).
+            try:
+                if stat.S_ISSOCK(os.stat(unix_socket_path).st_mode):
+                    os.unlink(unix_socket_path)
+            except OSError:
+                pass
+            server.bind(unix_socket_path)
         else:
-            server.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+            server = socket(AF_INET, SOCK_STREAM, IPPROTO_TCP)
+            if IS_WINDOWS and not IS_JYTHON:
+                server.setsockopt(SOL_SOCKET, SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                server.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
 
-        server.bind((host, port))
+            server.bind((host, port))
         server.settimeout(None)
     except Exception:
         server.close()
@@ -432,7 +550,11 @@ def start_server(port):
 
 
 def start_client(host, port):
-    ''' connects to a host/port '''
+    ''' connects to a host/port (or to a Unix domain socket, see UNIX_HOST_PREFIX) '''
+    unix_socket_path = get_unix_socket_path(host)
+    if unix_socket_path is not None:
+        return _start_unix_client(unix_socket_path)
+
     pydev_log.info("Connecting to %s:%s", host, port)
 
     s = socket(AF_INET, SOCK_STREAM)
@@ -471,6 +593,23 @@ def start_client(host, port):
         raise
 
 
+def _start_unix_client(path):
+    pydev_log.info("Connecting to %s", path)
+
+    s = socket(socket_module.AF_UNIX, SOCK_STREAM)
+    try:
+        timeout = int(os.environ.get('PYDEVD_CONNECT_TIMEOUT', 10))
+        s.settimeout(timeout)
+        s.connect(path)
+        s.settimeout(None)  # no timeout after connected
+        pydev_log.info("Connected.")
+        return s
+    except:
+        pydev_log.exception("Could not connect to %s", path)
+        s.close()
+        raise
+
+
 INTERNAL_TERMINATE_THREAD = 1
 INTERNAL_SUSPEND_THREAD = 2
 
@@ -671,7 +810,10 @@ def internal_get_variable_json(py_db, request):
         except KeyError:
             pass
         else:
-            for child_var in variable.get_children_variables(fmt=fmt, scope=scope):
+            children_variables = variable.get_children_variables(
+                fmt=fmt, scope=scope, filter=arguments.filter, start=arguments.start or 0,
+                count=arguments.count or 0)
+            for child_var in children_variables:
                 variables.append(child_var.get_var_data(fmt=fmt))
     except:
         try:
@@ -315,6 +315,16 @@ PYDEVD_UNBLOCK_THREADS_TIMEOUT = as_float_in_env('PYDEVD_UNBLOCK_THREADS_TIMEOUT
 # on how the thread interruption works (there are some caveats related to it).
 PYDEVD_INTERRUPT_THREAD_TIMEOUT = as_float_in_env('PYDEVD_INTERRUPT_THREAD_TIMEOUT', -1)
 
+# Max number of entries in each of the caches kept for the files/code objects seen (when a
+# cache is full its oldest entries are evicted). A value <= 0 means the caches are unbounded.
+# See: _pydevd_bundle.pydevd_bounded_cache
+PYDEVD_MAX_CACHE_SIZE = int(as_float_in_env('PYDEVD_MAX_CACHE_SIZE', 50000))
+
+# If True in env, sys.monitoring (PEP 669) is used instead of sys.settrace to trace the
+# user code (only available on Python 3.12 onwards).
+# See: _pydevd_bundle.pydevd_sys_monitoring
+PYDEVD_USE_SYS_MONITORING = is_true_in_env('PYDEVD_USE_SYS_MONITORING') and hasattr(sys, 'monitoring')
+
 EXCEPTION_TYPE_UNHANDLED = 'UNHANDLED'
 EXCEPTION_TYPE_USER_UNHANDLED = 'USER_UNHANDLED'
 EXCEPTION_TYPE_HANDLED = 'HANDLED'
@@ -788,9 +798,20 @@ ARGUMENT_HTTP_JSON_PROTOCOL = 'json-dap-http'
 
 ARGUMENT_PPID = 'ppid'
 
+# Encodings of the json messages sent with the HTTP_JSON_PROTOCOL. Json is always used
+# unless the client asks for another one it can read in the pydevdSystemInfo request.
+JSON_WIRE_ENCODING = 'json'
+
+# Compact binary form: the message dict (without the pydevd_cmd_id) dumped by marshal
+# (format version 4, so that any Python 3 can load it). Sent with a
+# "Content-Type: marshal" header.
+MARSHAL_WIRE_ENCODING = 'marshal'
+MARSHAL_WIRE_VERSION = 4
+
 
 class _GlobalSettings:
     protocol = QUOTED_LINE_PROTOCOL
+    wire_encoding = JSON_WIRE_ENCODING
 
 
 def set_protocol(protocol):
@@ -809,6 +830,24 @@ def is_json_protocol():
     return _GlobalSettings.protocol in (JSON_PROTOCOL, HTTP_JSON_PROTOCOL)
 
 
+def get_supported_wire_encodings():
+    if IS_CPYTHON and not IS_PY2:
+        return (MARSHAL_WIRE_ENCODING, JSON_WIRE_ENCODING)
+    return (JSON_WIRE_ENCODING,)
+
+
+def set_wire_encoding(wire_encoding):
+    expected = get_supported_wire_encodings()
+    assert wire_encoding in expected, 'Wire encoding (%s) should be one of: %s' % (
+        wire_encoding, expected)
+
+    _GlobalSettings.wire_encoding = wire_encoding
+
+
+def get_wire_encoding():
+    return _GlobalSettings.wire_encoding
+
+
 class GlobalDebuggerHolder:
     '''
         Holder for the global debugger.
@@ -13,7 +13,7 @@ pydev_log.debug("Using Cython speedups")
 # from _pydevd_bundle.pydevd_frame import PyDBFrame
 # ENDIF
 
-version = 11
+version = 13
 
 
 #=======================================================================================================================
@@ -1204,6 +1204,7 @@ from _pydev_bundle.pydev_log import exception as pydev_log_exception
 from _pydev_imps._pydev_saved_modules import threading
 from _pydevd_bundle.pydevd_constants import (get_current_thread_id, NO_FTRACE,
     USE_CUSTOM_SYS_CURRENT_FRAMES_MAP, ForkSafeLock)
+from _pydevd_bundle.pydevd_bounded_cache import BoundedCache
 from pydevd_file_utils import get_abs_path_real_path_and_base_from_frame, NORM_PATHS_AND_BASE_CONTAINER
 
 # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
@@ -1221,13 +1222,21 @@ cdef dict _global_notify_skipped_step_in
 # 144 = 144
 # 109 = 109
 # 160 = 160
+# 
+# # Values of CodeTracingInfo.skip (0 means that the code must be traced).
+# 1 = 1  # A pydevd file or a library not in the project scope.
+# 2 = 2  # Only when not stepping.
+# 3 = 3  # Excluded by the files filter.
 # ENDIF
 
-# Cache where we should keep that we completely skipped entering some context.
-# It needs to be invalidated when:
+# Cache with id(code) -> CodeTracingInfo, used to decide whether some context should be
+# traced with a single lookup when it's entered.
+# It needs to be invalidated (by incrementing PyDB.code_tracing_info_generation) when:
 # - Breakpoints are changed
-# It can be used when running regularly (without step over/step in/step return)
-global_cache_skips = {}
+# - Files filters (or anything which affects PyDB.get_file_type) are changed
+_code_tracing_info_bounded_cache = BoundedCache('codeTracingInfo')
+global_cache_skips = _code_tracing_info_bounded_cache.cache
+code_tracing_info_bounded_cache = _code_tracing_info_bounded_cache
 global_cache_frame_skips = {}
 
 _global_notify_skipped_step_in = False
@@ -1245,6 +1254,78 @@ def notify_skipped_step_in_because_of_filters(py_db, frame):
         _global_notify_skipped_step_in = True
         py_db.notify_skipped_step_in_because_of_filters(frame)
 
+# IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
+cdef class CodeTracingInfo:
+    cdef public object code;
+    cdef public int generation;
+    cdef public tuple frame_cache_key;
+    cdef public tuple abs_path_canonical_path_and_base;
+    cdef public int skip;
+    def __init__(self, code, int generation, tuple frame_cache_key, tuple abs_path_canonical_path_and_base, int skip):
+        self.code = code
+        self.generation = generation
+        self.frame_cache_key = frame_cache_key
+        self.abs_path_canonical_path_and_base = abs_path_canonical_path_and_base
+        self.skip = skip
+# ELSE
+# class CodeTracingInfo(object):
+#     '''
+#     What's needed to decide how to trace some code object (computed when its first frame
+#     is entered).
+# 
+#     Note: the code is kept so that id(code) isn't reused while the entry is in the cache.
+#     '''
+# 
+#     __slots__ = ['code', 'generation', 'frame_cache_key', 'abs_path_canonical_path_and_base', 'skip']
+# 
+#     def __init__(self, code, generation, frame_cache_key, abs_path_canonical_path_and_base, skip):
+#         self.code = code
+#         self.generation = generation
+#         self.frame_cache_key = frame_cache_key
+#         self.abs_path_canonical_path_and_base = abs_path_canonical_path_and_base
+#         self.skip = skip
+# ENDIF
+
+
+def create_code_tracing_info(py_db, frame, cache_skips):
+    # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
+    cdef tuple abs_path_canonical_path_and_base;
+    cdef int generation;
+    cdef int skip;
+    cdef CodeTracingInfo code_tracing_info;
+    # ENDIF
+    # Note: get the generation before computing anything (so, if it's changed in the meanwhile,
+    # this info is recomputed the next time).
+    generation = py_db.code_tracing_info_generation
+    code = frame.f_code
+    try:
+        # Make fast path faster!
+        abs_path_canonical_path_and_base = NORM_PATHS_AND_BASE_CONTAINER[code.co_filename]
+    except:
+        abs_path_canonical_path_and_base = get_abs_path_real_path_and_base_from_frame(frame)
+
+    skip = 0
+    file_type = py_db.get_file_type(frame, abs_path_canonical_path_and_base)  # we don't want to debug threading or anything related to pydevd
+    if file_type is not None:
+        if file_type == 1:  # inlining LIB_FILE = 1
+            if not py_db.in_project_scope(frame, abs_path_canonical_path_and_base[0]):
+                skip = 1
+        else:
+            skip = 1
+
+    if skip == 0 and py_db.is_files_filter_enabled:
+        if py_db.apply_files_filter(frame, abs_path_canonical_path_and_base[0], False):
+            skip = 3
+
+    # Note: it's important that the context name is also given because we may hit something once
+    # in the global context and another in the local context.
+    code_tracing_info = CodeTracingInfo(
+        code, generation, (code.co_firstlineno, code.co_name, code.co_filename), abs_path_canonical_path_and_base, skip)
+    _code_tracing_info_bounded_cache.on_miss()
+    cache_skips[id(code)] = code_tracing_info
+    return code_tracing_info
+
+
 # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
 cdef class SafeCallWrapper:
     cdef method_object
@@ -1532,13 +1613,11 @@ cdef class ThreadTracer:
             This is the global debugger (this method should actually be added as a method to it).
         '''
         # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
-        cdef str filename;
-        cdef str base;
         cdef int pydev_step_cmd;
-        cdef tuple frame_cache_key;
         cdef dict cache_skips;
         cdef bint is_stepping;
-        cdef tuple abs_path_canonical_path_and_base;
+        cdef CodeTracingInfo code_tracing_info;
+        cdef int skip;
         cdef PyDBAdditionalThreadInfo additional_info;
         # ENDIF
 
@@ -1560,55 +1639,30 @@ cdef class ThreadTracer:
                 py_db.notify_thread_not_alive(get_current_thread_id(t))
                 return None if event == 'call' else NO_FTRACE
 
-            # Note: it's important that the context name is also given because we may hit something once
-            # in the global context and another in the local context.
-            frame_cache_key = (frame.f_code.co_firstlineno, frame.f_code.co_name, frame.f_code.co_filename)
-            if frame_cache_key in cache_skips:
+            code_tracing_info = cache_skips.get(id(frame.f_code))
+            if (
+                    code_tracing_info is None
+                    or code_tracing_info.code is not frame.f_code
+                    or code_tracing_info.generation != py_db.code_tracing_info_generation
+                ):
+                code_tracing_info = create_code_tracing_info(py_db, frame, cache_skips)
+            else:
+                _code_tracing_info_bounded_cache.hits += 1
+
+            skip = code_tracing_info.skip
+            if skip != 0:
                 if not is_stepping:
-                    # if DEBUG: print('skipped: trace_dispatch (cache hit)', frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
+                    # if DEBUG: print('skipped: trace_dispatch (cache hit)', code_tracing_info.frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
                     return None if event == 'call' else NO_FTRACE
-                else:
-                    # When stepping we can't take into account caching based on the breakpoints (only global filtering).
-                    if cache_skips.get(frame_cache_key) == 1:
-
-                        if additional_info.pydev_original_step_cmd in (107, 144) and not _global_notify_skipped_step_in:
-                            notify_skipped_step_in_because_of_filters(py_db, frame)
-
-                        back_frame = frame.f_back
-                        if back_frame is not None and pydev_step_cmd in (107, 144, 109, 160):
-                            back_frame_cache_key = (back_frame.f_code.co_firstlineno, back_frame.f_code.co_name, back_frame.f_code.co_filename)
-                            if cache_skips.get(back_frame_cache_key) == 1:
-                                # if DEBUG: print('skipped: trace_dispatch (cache hit: 1)', frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
-                                return None if event == 'call' else NO_FTRACE
-                        else:
-                            # if DEBUG: print('skipped: trace_dispatch (cache hit: 2)', frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
-                            return None if event == 'call' else NO_FTRACE
 
-            try:
-                # Make fast path faster!
-                abs_path_canonical_path_and_base = NORM_PATHS_AND_BASE_CONTAINER[frame.f_code.co_filename]
-            except:
-                abs_path_canonical_path_and_base = get_abs_path_real_path_and_base_from_frame(frame)
-
-            file_type = py_db.get_file_type(frame, abs_path_canonical_path_and_base)  # we don't want to debug threading or anything related to pydevd
+                # When stepping we can't take into account caching based on the breakpoints (only global filtering).
+                if skip != 2:
+                    if additional_info.pydev_original_step_cmd in (107, 144) and not _global_notify_skipped_step_in:
+                        notify_skipped_step_in_because_of_filters(py_db, frame)
 
-            if file_type is not None:
-                if file_type == 1:  # inlining LIB_FILE = 1
-                    if not py_db.in_project_scope(frame, abs_path_canonical_path_and_base[0]):
-                        # if DEBUG: print('skipped: trace_dispatch (not in scope)', abs_path_canonical_path_and_base[2], frame.f_lineno, event, frame.f_code.co_name, file_type)
-                        cache_skips[frame_cache_key] = 1
+                    if skip == 1:
+                        # if DEBUG: print('skipped: trace_dispatch (file type or not in scope)', code_tracing_info.abs_path_canonical_path_and_base[2], frame.f_lineno, event, frame.f_code.co_name)
                         return None if event == 'call' else NO_FTRACE
-                else:
-                    # if DEBUG: print('skipped: trace_dispatch', abs_path_canonical_path_and_base[2], frame.f_lineno, event, frame.f_code.co_name, file_type)
-                    cache_skips[frame_cache_key] = 1
-                    return None if event == 'call' else NO_FTRACE
-
-            if py_db.is_files_filter_enabled:
-                if py_db.apply_files_filter(frame, abs_path_canonical_path_and_base[0], False):
-                    cache_skips[frame_cache_key] = 1
-
-                    if is_stepping and additional_info.pydev_original_step_cmd in (107, 144) and not _global_notify_skipped_step_in:
-                        notify_skipped_step_in_because_of_filters(py_db, frame)
 
                     # A little gotcha, sometimes when we're stepping in we have to stop in a
                     # return event showing the back frame as the current frame, so, we need
@@ -1616,27 +1670,27 @@ cdef class ThreadTracer:
                     back_frame = frame.f_back
                     if back_frame is not None and pydev_step_cmd in (107, 144, 109, 160):
                         if py_db.apply_files_filter(back_frame, back_frame.f_code.co_filename, False):
-                            back_frame_cache_key = (back_frame.f_code.co_firstlineno, back_frame.f_code.co_name, back_frame.f_code.co_filename)
-                            cache_skips[back_frame_cache_key] = 1
-                            # if DEBUG: print('skipped: trace_dispatch (filtered out: 1)', frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
+                            # if DEBUG: print('skipped: trace_dispatch (filtered out: 1)', code_tracing_info.frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
                             return None if event == 'call' else NO_FTRACE
                     else:
-                        # if DEBUG: print('skipped: trace_dispatch (filtered out: 2)', frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
+                        # if DEBUG: print('skipped: trace_dispatch (filtered out: 2)', code_tracing_info.frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
                         return None if event == 'call' else NO_FTRACE
 
-            # if DEBUG: print('trace_dispatch', filename, frame.f_lineno, event, frame.f_code.co_name, file_type)
+            # if DEBUG: print('trace_dispatch', code_tracing_info.abs_path_canonical_path_and_base[2], frame.f_lineno, event, frame.f_code.co_name)
 
             # Just create PyDBFrame directly (removed support for Python versions < 2.5, which required keeping a weak
             # reference to the frame).
             ret = PyDBFrame(
                 (
-                    py_db, abs_path_canonical_path_and_base, additional_info, t, frame_skips_cache, frame_cache_key,
+                    py_db, code_tracing_info.abs_path_canonical_path_and_base, additional_info, t, frame_skips_cache,
+                    code_tracing_info.frame_cache_key,
                 )
             ).trace_dispatch(frame, event, arg)
             if ret is None:
-                # 1 means skipped because of filters.
-                # 2 means skipped because no breakpoints were hit.
-                cache_skips[frame_cache_key] = 2
+                # Note: a frame excluded by the files filter may still be traced when stepping
+                # (and must keep its skip reason).
+                if skip == 0:
+                    code_tracing_info.skip = 2
                 return None if event == 'call' else NO_FTRACE
 
             # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
@@ -45,6 +45,12 @@ global_cache_skips = mod.global_cache_skips
 
 global_cache_frame_skips = mod.global_cache_frame_skips
 
+try:
+    code_tracing_info_bounded_cache = mod._code_tracing_info_bounded_cache
+except AttributeError:
+    # Speedups compiled from an older version (which would be rejected by the version check).
+    raise ImportError('Cython version of speedups does not match.')
+
 _set_additional_thread_info_lock = mod._set_additional_thread_info_lock
 
 fix_top_level_trace_and_get_trace_func = mod.fix_top_level_trace_and_get_trace_func
@@ -86,6 +86,7 @@ DONT_TRACE = {
     'pydevd_additional_thread_info_regular.py': PYDEV_FILE,
     'pydevd_api.py': PYDEV_FILE,
     'pydevd_base_schema.py': PYDEV_FILE,
+    'pydevd_bounded_cache.py': PYDEV_FILE,
     'pydevd_breakpoints.py': PYDEV_FILE,
     'pydevd_code_to_source.py': PYDEV_FILE,
     'pydevd_collect_bytecode_info.py': PYDEV_FILE,
@@ -136,6 +137,7 @@ DONT_TRACE = {
     'pydevd_source_mapping.py': PYDEV_FILE,
     'pydevd_stackless.py': PYDEV_FILE,
     'pydevd_suspended_frames.py': PYDEV_FILE,
+    'pydevd_sys_monitoring.py': PYDEV_FILE,
     'pydevd_thread_lifecycle.py': PYDEV_FILE,
     'pydevd_thread_wrappers.py': PYDEV_FILE,
     'pydevd_timeout.py': PYDEV_FILE,
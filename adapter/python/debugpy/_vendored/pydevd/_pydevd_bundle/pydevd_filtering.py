@@ -1,6 +1,7 @@
 import fnmatch
 import glob
 import os.path
+import re
 import sys
 
 from _pydev_bundle import pydev_log
@@ -12,6 +13,7 @@ from pydevd_file_utils import normcase
 from _pydevd_bundle.pydevd_constants import USER_CODE_BASENAMES_STARTING_WITH, \
     LIBRARY_CODE_BASENAMES_STARTING_WITH, IS_PYPY, IS_WINDOWS
 from _pydevd_bundle import pydevd_constants
+from _pydevd_bundle.pydevd_bounded_cache import BoundedCache
 
 try:
     xrange  # noqa
@@ -37,64 +39,325 @@ def _convert_to_str_and_clear_empty(roots):
     return new_roots
 
 
-def _check_matches(patterns, paths):
-    if not patterns and not paths:
-        # Matched to the end.
-        return True
+# Kinds of segments in a compiled glob.
+_LITERAL_SEGMENT = 0  # Must be equal to the path segment.
+_GLOB_SEGMENT = 1  # fnmatch-like pattern for the path segment.
+_ANY_SEGMENTS = 2  # `**`: matches any number of path segments.
 
-    if (not patterns and paths) or (patterns and not paths):
-        return False
 
-    pattern = normcase(patterns[0])
-    path = normcase(paths[0])
+def _split_path(path, sep, altsep):
+    '''
+    :return tuple(str, list(str)):
+        The drive (empty if there's no drive) and the segments of the path.
+    '''
+    if altsep:
+        path = path.replace(altsep, sep)
 
-    if not glob.has_magic(pattern):
+    drive = ''
+    if len(path) > 1 and path[1] == ':':
+        drive, path = path[0], path[2:]
 
-        if pattern != path:
-            return False
+    paths = path.split(sep)
+    if paths[0] == '':
+        paths = paths[1:]
+    return drive, paths
 
-    elif pattern == '**':
-        if len(patterns) == 1:
-            return True  # if ** is the last one it matches anything to the right.
 
-        for i in xrange(len(paths)):
-            # Recursively check the remaining patterns as the
-            # current pattern could match any number of paths.
-            if _check_matches(patterns[1:], paths[i:]):
-                return True
+class _CompiledGlob(object):
+    '''
+    A glob pattern compiled to be matched against the segments of a path (see: glob_matches_path).
 
-    elif not fnmatch.fnmatch(path, pattern):
-        # Current part doesn't match.
-        return False
+    Matching keeps the set of positions in the pattern reachable after each path segment (i.e.: it
+    runs the pattern as an NFA), so, it's linear in the number of path segments even when the
+    pattern has many `**`.
+    '''
 
-    return _check_matches(patterns[1:], paths[1:])
+    def __init__(self, pattern, sep, altsep):
+        self._sep = sep
+        self._altsep = altsep
+        if altsep:
+            pattern = pattern.replace(altsep, sep)
 
+        self.drive = None
+        self.segments = self._compile_segments(pattern, sep)
+        # When the path has a drive, the drive in the pattern is matched separately.
+        self.segments_without_drive = self.segments
+        if len(pattern) > 1 and pattern[1] == ':':
+            self.drive = pattern[0].lower()
+            self.segments_without_drive = self._compile_segments(pattern[2:], sep)
 
-def glob_matches_path(path, pattern, sep=os.sep, altsep=os.altsep):
-    if altsep:
-        pattern = pattern.replace(altsep, sep)
-        path = path.replace(altsep, sep)
+    @classmethod
+    def _compile_segments(cls, pattern, sep):
+        patterns = pattern.split(sep)
+        if patterns[0] == '':
+            patterns = patterns[1:]
 
-    drive = ''
-    if len(path) > 1 and path[1] == ':':
-        drive, path = path[0], path[2:]
+        segments = []
+        for pattern in patterns:
+            pattern = normcase(pattern)
+            if not glob.has_magic(pattern):
+                segments.append((_LITERAL_SEGMENT, pattern))
+            elif pattern == '**':
+                segments.append((_ANY_SEGMENTS, None))
+            else:
+                segments.append((_GLOB_SEGMENT, re.compile(fnmatch.translate(pattern)).match))
+
+        # The positions reachable from each position without consuming a segment (a `**` may
+        # match no segments at all, as long as there's some path segment still to be matched).
+        closures = []
+        for i in xrange(len(segments) + 1):
+            closure = [i]
+            while i < len(segments) and segments[i][0] == _ANY_SEGMENTS:
+                i += 1
+                closure.append(i)
+            closures.append(closure)
+        return segments, closures
+
+    def get_segments(self, drive):
+        '''
+        :return tuple(list, list)|None:
+            The segments to match against a path with the given drive (None if the drive
+            doesn't match).
+        '''
+        if not drive:
+            return self.segments
+        if self.drive is not None and self.drive != drive.lower():
+            return None
+        return self.segments_without_drive
+
+    @staticmethod
+    def step(segments, positions, path):
+        '''
+        :param str path:
+            The next path segment (already normcased).
+
+        :return set(int):
+            The positions in the pattern reachable after matching the given path segment.
+        '''
+        segments, closures = segments
+        len_segments = len(segments)
+        new_positions = set()
+        for position in positions:
+            for i in closures[position]:
+                if i == len_segments:
+                    continue
+                kind, segment = segments[i]
+                if kind == _LITERAL_SEGMENT:
+                    if segment == path:
+                        new_positions.add(i + 1)
+                elif kind == _ANY_SEGMENTS:
+                    new_positions.add(i)
+                    new_positions.add(i + 1)
+                elif segment(path) is not None:
+                    new_positions.add(i + 1)
+        return new_positions
+
+    def matches(self, path):
+        drive, paths = _split_path(path, self._sep, self._altsep)
+        segments = self.get_segments(drive)
+        if segments is None:
+            return False
 
-    if drive and len(pattern) > 1:
-        if pattern[1] == ':':
-            if drive.lower() != pattern[0].lower():
+        positions = set([0])
+        for path in paths:
+            positions = self.step(segments, positions, normcase(path))
+            if not positions:
                 return False
-            pattern = pattern[2:]
+        return len(segments[0]) in positions
 
-    patterns = pattern.split(sep)
-    paths = path.split(sep)
-    if paths:
-        if paths[0] == '':
-            paths = paths[1:]
-    if patterns:
-        if patterns[0] == '':
-            patterns = patterns[1:]
 
-    return _check_matches(patterns, paths)
+_compiled_globs_bounded_cache = BoundedCache('compiledGlobs')
+_COMPILED_GLOBS_CONTAINER = _compiled_globs_bounded_cache.cache
+
+
+def glob_matches_path(path, pattern, sep=os.sep, altsep=os.altsep):
+    key = (pattern, sep, altsep)
+    try:
+        compiled = _COMPILED_GLOBS_CONTAINER[key]
+        _compiled_globs_bounded_cache.hits += 1
+    except KeyError:
+        _compiled_globs_bounded_cache.on_miss()
+        compiled = _COMPILED_GLOBS_CONTAINER[key] = _CompiledGlob(pattern, sep, altsep)
+    return compiled.matches(path)
+
+
+class _ExcludeFiltersMatcher(object):
+    '''
+    All the exclude filters compiled to be matched at once.
+
+    The path filters are matched in a single pass over the path segments: the literal segments
+    at the start of the filters are kept in a trie (so, a filter is only checked once its
+    literal prefix matched) and each path segment is normalized only once. Module filters are
+    looked up by the module name and its parent packages.
+    '''
+
+    def __init__(self, exclude_filters, sep=os.sep, altsep=os.altsep):
+        '''
+        :param list(ExcludeFilter) exclude_filters:
+        '''
+        self._sep = sep
+        self._altsep = altsep
+        self._path_filters = []  # list(tuple(index, _CompiledGlob, exclude))
+        self._module_filters = {}  # module name -> tuple(index, exclude) (first one found)
+        for i, exclude_filter in enumerate(exclude_filters):
+            if exclude_filter.is_path:
+                self._path_filters.append(
+                    (i, _CompiledGlob(exclude_filter.name, sep, altsep), exclude_filter.exclude))
+            elif exclude_filter.name not in self._module_filters:
+                self._module_filters[exclude_filter.name] = (i, exclude_filter.exclude)
+
+        self._drive_to_trie = {}
+
+    def _get_trie(self, drive):
+        '''
+        :return dict:
+            The trie for paths with the given drive. Each node maps the next literal segment to
+            its child node and `None` to the filters which start to be matched after the segments
+            up to that node (as a list(tuple(index, segments, exclude, position))).
+        '''
+        drive = drive.lower()
+        try:
+            return self._drive_to_trie[drive]
+        except KeyError:
+            pass
+
+        trie = {}
+        for i, compiled, exclude in self._path_filters:
+            segments = compiled.get_segments(drive)
+            if segments is None:
+                continue
+
+            node = trie
+            position = 0
+            for kind, segment in segments[0]:
+                if kind != _LITERAL_SEGMENT:
+                    break
+                child = node.get(segment)
+                if child is None:
+                    child = node[segment] = {}
+                node = child
+                position += 1
+            node.setdefault(None, []).append((i, segments, exclude, position))
+
+        self._drive_to_trie[drive] = trie
+        return trie
+
+    def _match_path(self, absolute_filename):
+        '''
+        :return tuple(index, exclude)|None:
+            The first path filter that matches.
+        '''
+        drive, paths = _split_path(absolute_filename, self._sep, self._altsep)
+        node = self._get_trie(drive)
+
+        active = []  # list(tuple(index, segments, exclude, positions))
+        for i, segments, exclude, position in node.get(None, ()):
+            active.append((i, segments, exclude, set([position])))
+
+        step = _CompiledGlob.step
+        for path in paths:
+            path = normcase(path)
+            new_active = []
+            for i, segments, exclude, positions in active:
+                positions = step(segments, positions, path)
+                if positions:
+                    new_active.append((i, segments, exclude, positions))
+
+            if node is not None:
+                node = node.get(path)
+                if node is not None:
+                    for i, segments, exclude, position in node.get(None, ()):
+                        new_active.append((i, segments, exclude, set([position])))
+
+            active = new_active
+            if not active and node is None:
+                return None
+
+        found = None
+        for i, segments, exclude, positions in active:
+            if len(segments[0]) in positions and (found is None or i < found[0]):
+                found = (i, exclude)
+        return found
+
+    def _match_module(self, module_name):
+        '''
+        :return tuple(index, exclude)|None:
+            The first module filter that matches (the module itself or one of its parents).
+        '''
+        if not self._module_filters or not module_name:
+            return None
+
+        found = None
+        parts = module_name.split('.')
+        for j in xrange(1, len(parts) + 1):
+            match = self._module_filters.get('.'.join(parts[:j]))
+            if match is not None and (found is None or match[0] < found[0]):
+                found = match
+        return found
+
+    def exclude_by_filter(self, absolute_filename, module_name):
+        path_match = self._match_path(absolute_filename) if self._path_filters else None
+        module_match = self._match_module(module_name)
+        if path_match is None:
+            if module_match is None:
+                return None
+            return module_match[1]
+
+        if module_match is None or path_match[0] < module_match[0]:
+            return path_match[1]
+        return module_match[1]
+
+
+class _RootsTrie(object):
+    '''
+    Maps the path components of the project and library roots, so that finding the deepest
+    project/library root which contains some file is O(path depth) (regardless of the number
+    of roots).
+    '''
+
+    PROJECT = 1
+    LIBRARY = 2
+
+    def __init__(self, sep):
+        self._sep = sep
+        self._root_node = {}
+
+    def add(self, root, kind):
+        '''
+        :param str root:
+            An absolute/normalized root ending with the separator.
+
+        :param int kind:
+            Either PROJECT or LIBRARY.
+        '''
+        node = self._root_node
+        for part in root[:-1].split(self._sep):
+            child = node.get(part)
+            if child is None:
+                child = node[part] = {}
+            node = child
+        # Kinds are saved in the `None` key (which is never a path component).
+        node[None] = node.get(None, 0) | kind
+
+    def get_deepest_roots_depth(self, absolute_normalized_filename):
+        '''
+        :return tuple(int, int):
+            The depth of the deepest project and library roots containing the given filename
+            (-1 if it's not inside a root of that kind).
+        '''
+        project_depth = library_depth = -1
+        node = self._root_node
+        for depth, part in enumerate(absolute_normalized_filename.split(self._sep)):
+            node = node.get(part)
+            if node is None:
+                break
+            kinds = node.get(None)
+            if kinds is not None:
+                if kinds & self.PROJECT:
+                    project_depth = depth
+                if kinds & self.LIBRARY:
+                    library_depth = depth
+        return project_depth, library_depth
 
 
 class FilesFiltering(object):
@@ -106,8 +369,10 @@ class FilesFiltering(object):
 
     def __init__(self):
         self._exclude_filters = []
+        self._exclude_filters_matcher = _ExcludeFiltersMatcher([])
         self._project_roots = []
         self._library_roots = []
+        self._roots_trie = _RootsTrie('\\' if IS_WINDOWS else '/')
 
         # Filter out libraries?
         self._use_libraries_filter = False
@@ -139,7 +404,7 @@ class FilesFiltering(object):
                 exclude_filters = []
                 for key, val in json.loads(pydevd_filters).items():
                     exclude_filters.append(ExcludeFilter(key, val, True))
-                self._exclude_filters = exclude_filters
+                self.set_exclude_filters(exclude_filters)
             else:
                 # A ';' separated list of strings with globs for the
                 # list of excludes.
@@ -148,7 +413,7 @@ class FilesFiltering(object):
                 for new_filter in filters:
                     if new_filter.strip():
                         new_filters.append(ExcludeFilter(new_filter.strip(), True, True))
-                self._exclude_filters = new_filters
+                self.set_exclude_filters(new_filters)
 
     @classmethod
     def _get_default_library_roots(cls):
@@ -223,8 +488,17 @@ class FilesFiltering(object):
         '''
         return normcase(pydevd_file_utils.absolute_path(filename))
 
+    def _update_roots_trie(self):
+        roots_trie = _RootsTrie('\\' if IS_WINDOWS else '/')
+        for root in self._project_roots:
+            roots_trie.add(root, _RootsTrie.PROJECT)
+        for root in self._library_roots:
+            roots_trie.add(root, _RootsTrie.LIBRARY)
+        self._roots_trie = roots_trie
+
     def set_project_roots(self, project_roots):
         self._project_roots = self._fix_roots(project_roots)
+        self._update_roots_trie()
         pydev_log.debug("IDE_PROJECT_ROOTS %s\n" % project_roots)
 
     def _get_project_roots(self):
@@ -232,6 +506,7 @@ class FilesFiltering(object):
 
     def set_library_roots(self, roots):
         self._library_roots = self._fix_roots(roots)
+        self._update_roots_trie()
         pydev_log.debug("LIBRARY_ROOTS %s\n" % roots)
 
     def _get_library_roots(self):
@@ -258,47 +533,25 @@ class FilesFiltering(object):
         project_roots = self._get_project_roots()  # roots are absolute/normalized.
 
         absolute_normalized_filename = self._absolute_normalized_path(received_filename)
-        absolute_normalized_filename_as_dir = absolute_normalized_filename + ('\\' if IS_WINDOWS else '/')
-
-        found_in_project = []
-        for root in project_roots:
-            if root and (absolute_normalized_filename.startswith(root) or root == absolute_normalized_filename_as_dir):
-                if DEBUG:
-                    pydev_log.debug('In project: %s (%s)', absolute_normalized_filename, root)
-                found_in_project.append(root)
-
-        found_in_library = []
-        library_roots = self._get_library_roots()
-        for root in library_roots:
-            if root and (absolute_normalized_filename.startswith(root) or root == absolute_normalized_filename_as_dir):
-                found_in_library.append(root)
-                if DEBUG:
-                    pydev_log.debug('In library: %s (%s)', absolute_normalized_filename, root)
-            else:
-                if DEBUG:
-                    pydev_log.debug('Not in library: %s (%s)', absolute_normalized_filename, root)
+
+        # The deepest root is the one with the bigger path matched.
+        project_depth, library_depth = self._roots_trie.get_deepest_roots_depth(absolute_normalized_filename)
+        if DEBUG:
+            pydev_log.debug('Deepest project root: %s, deepest library root: %s (%s)', project_depth, library_depth, absolute_normalized_filename)
 
         if not project_roots:
             # If we have no project roots configured, consider it being in the project
             # roots if it's not found in site-packages (because we have defaults for those
             # and not the other way around).
-            in_project = not found_in_library
+            in_project = library_depth == -1
             if DEBUG:
                 pydev_log.debug('Final in project (no project roots): %s (%s)', absolute_normalized_filename, in_project)
 
         else:
-            in_project = False
-            if found_in_project:
-                if not found_in_library:
-                    if DEBUG:
-                        pydev_log.debug('Final in project (in_project and not found_in_library): %s (True)', absolute_normalized_filename)
-                    in_project = True
-                else:
-                    # Found in both, let's see which one has the bigger path matched.
-                    if max(len(x) for x in found_in_project) > max(len(x) for x in found_in_library):
-                        in_project = True
-                    if DEBUG:
-                        pydev_log.debug('Final in project (found in both): %s (%s)', absolute_normalized_filename, in_project)
+            # Note: if it's not in a project root both are -1 (so, it's not in the project).
+            in_project = project_depth > library_depth
+            if DEBUG:
+                pydev_log.debug('Final in project: %s (%s)', absolute_normalized_filename, in_project)
 
         return in_project
 
@@ -321,21 +574,14 @@ class FilesFiltering(object):
         :return: True if it should be excluded, False if it should be included and None
             if no rule matched the given file.
         '''
-        for exclude_filter in self._exclude_filters:  # : :type exclude_filter: ExcludeFilter
-            if exclude_filter.is_path:
-                if glob_matches_path(absolute_filename, exclude_filter.name):
-                    return exclude_filter.exclude
-            else:
-                # Module filter.
-                if exclude_filter.name == module_name or module_name.startswith(exclude_filter.name + '.'):
-                    return exclude_filter.exclude
-        return None
+        return self._exclude_filters_matcher.exclude_by_filter(absolute_filename, module_name)
 
     def set_exclude_filters(self, exclude_filters):
         '''
         :param list(ExcludeFilter) exclude_filters:
         '''
         self._exclude_filters = exclude_filters
+        self._exclude_filters_matcher = _ExcludeFiltersMatcher(exclude_filters)
         self.require_module = False
         for exclude_filter in exclude_filters:
             if not exclude_filter.is_path:
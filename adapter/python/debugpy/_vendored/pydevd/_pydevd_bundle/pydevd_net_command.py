@@ -3,10 +3,47 @@ from _pydevd_bundle.pydevd_constants import DebugInfoHolder, IS_PY2, \
 from _pydevd_bundle.pydevd_utils import quote_smart as quote, to_string
 from _pydevd_bundle.pydevd_comm_constants import ID_TO_MEANING, CMD_EXIT
 from _pydevd_bundle.pydevd_constants import HTTP_PROTOCOL, HTTP_JSON_PROTOCOL, \
-    get_protocol, IS_JYTHON, ForkSafeLock
+    get_protocol, IS_JYTHON, ForkSafeLock, MARSHAL_WIRE_ENCODING, MARSHAL_WIRE_VERSION, \
+    get_wire_encoding
 import json
+import marshal
 from _pydev_bundle import pydev_log
 
+# Messages are built from plain dicts/lists, so the (slow) check for circular references
+# json.dumps() does by default isn't needed.
+_json_encoder = json.JSONEncoder(check_circular=False)
+
+# Maximum number of buffers passed to a single sendmsg (IOV_MAX is 1024 on Linux and macOS).
+_IOV_MAX = 1024
+
+
+def sendmsg_all(sock, buffers):
+    '''
+    Sends all the given buffers with scatter-gather writes (i.e.: without concatenating them
+    first), retrying as needed when the socket only accepts part of the data.
+
+    :note: the socket must have a `sendmsg` method (check with `can_sendmsg`).
+    '''
+    buffers = [memoryview(b) for b in buffers if b]
+    while buffers:
+        sent = sock.sendmsg(buffers[:_IOV_MAX])
+        while sent:
+            first_len = len(buffers[0])
+            if sent < first_len:
+                buffers[0] = buffers[0][sent:]
+                sent = 0
+            else:
+                sent -= first_len
+                del buffers[0]
+
+
+def can_sendmsg(sock):
+    '''
+    :return bool:
+        Whether sendmsg_all() may be used with the given socket.
+    '''
+    return not IS_PY2 and hasattr(type(sock), 'sendmsg')
+
 
 class _BaseNetCommand(object):
 
@@ -45,6 +82,13 @@ class NetCommand(_BaseNetCommand):
     """
     next_seq = 0  # sequence numbers
 
+    # Value of the Content-Type header sent along with the message (None means json).
+    content_type = None
+
+    # Framing sent before the message contents (computed along with the contents, so
+    # that sending the command doesn't need to check the protocol again).
+    _header = b''
+
     _showing_debug_info = 0
     _show_debug_info_lock = ForkSafeLock(rlock=True)
 
@@ -70,7 +114,19 @@ class NetCommand(_BaseNetCommand):
             as_dict['pydevd_cmd_id'] = cmd_id
             as_dict['seq'] = seq
             self.as_dict = as_dict
-            text = json.dumps(as_dict)
+
+            if protocol == HTTP_JSON_PROTOCOL and get_wire_encoding() == MARSHAL_WIRE_ENCODING:
+                as_bytes = self._marshal(as_dict)
+                if as_bytes is not None:
+                    self._as_bytes = as_bytes
+                    self.content_type = MARSHAL_WIRE_ENCODING
+                    self._header = ('Content-Length: %s\r\nContent-Type: %s\r\n\r\n' % (
+                        len(as_bytes), MARSHAL_WIRE_ENCODING)).encode('ascii')
+                    if DebugInfoHolder.DEBUG_TRACE_LEVEL >= 1:
+                        self._show_debug_info(cmd_id, seq, json.dumps(as_dict))
+                    return
+
+            text = _json_encoder.encode(as_dict)
 
         if IS_PY2:
             if isinstance(text, unicode):
@@ -103,13 +159,31 @@ class NetCommand(_BaseNetCommand):
             assert isinstance(msg, bytes)
             as_bytes = msg
         self._as_bytes = as_bytes
+        if protocol in (HTTP_PROTOCOL, HTTP_JSON_PROTOCOL):
+            self._header = ('Content-Length: %s\r\n\r\n' % len(as_bytes)).encode('ascii')
+
+    @staticmethod
+    def _marshal(as_dict):
+        '''
+        :return bytes|None:
+            The message in the MARSHAL_WIRE_ENCODING, or None if it holds something which
+            can't be marshalled (in which case it's sent as json).
+        '''
+        as_dict = as_dict.copy()
+        del as_dict['pydevd_cmd_id']
+        try:
+            return marshal.dumps(as_dict, MARSHAL_WIRE_VERSION)
+        except ValueError:
+            return None
 
     def send(self, sock):
-        as_bytes = self._as_bytes
+        # Header and contents go in a single write (scatter-gather if possible, so that
+        # big messages aren't copied just to prepend the header).
         try:
-            if get_protocol() in (HTTP_PROTOCOL, HTTP_JSON_PROTOCOL):
-                sock.sendall(('Content-Length: %s\r\n\r\n' % len(as_bytes)).encode('ascii'))
-            sock.sendall(as_bytes)
+            if can_sendmsg(sock):
+                sendmsg_all(sock, (self._header, self._as_bytes))
+            else:
+                sock.sendall(self._header + self._as_bytes)
         except:
             if IS_JYTHON:
                 # Ignore errors in sock.sendall in Jython (seems to be common for Jython to
@@ -17,6 +17,7 @@ from _pydevd_bundle._debug_adapter.pydevd_schema import (
     VariablesResponseBody, SetBreakpointsResponseBody, Response,
     Capabilities, PydevdAuthorizeRequest, Request)
 from _pydevd_bundle.pydevd_api import PyDevdAPI
+from _pydevd_bundle.pydevd_bounded_cache import get_bounded_caches_stats
 from _pydevd_bundle.pydevd_breakpoints import get_exception_class
 from _pydevd_bundle.pydevd_comm_constants import (
     CMD_PROCESS_EVENT, CMD_RETURN, CMD_SET_NEXT_STATEMENT, CMD_STEP_INTO,
@@ -27,7 +28,8 @@ from _pydevd_bundle.pydevd_json_debug_options import _extract_debug_options, Deb
 from _pydevd_bundle.pydevd_net_command import NetCommand
 from _pydevd_bundle.pydevd_utils import convert_dap_log_message_to_expression, ScopeRequest
 from _pydevd_bundle.pydevd_constants import (PY_IMPL_NAME, DebugInfoHolder, PY_VERSION_STR,
-    PY_IMPL_VERSION_STR, IS_64BIT_PROCESS)
+    PY_IMPL_VERSION_STR, IS_64BIT_PROCESS, JSON_WIRE_ENCODING, get_supported_wire_encodings,
+    get_wire_encoding, set_wire_encoding)
 from _pydevd_bundle.pydevd_trace_dispatch import USING_CYTHON
 from _pydevd_frame_eval.pydevd_frame_eval_main import USING_FRAME_EVAL
 
@@ -1075,9 +1077,26 @@ class PyDevJsonCommandProcessor(object):
             executable=sys.executable,
             bitness=64 if IS_64BIT_PROCESS else 32,
         )
+        # The client may list the encodings it can read besides json, most preferred
+        # first: use the first one we support for the messages sent from now on.
+        wire_encoding = get_wire_encoding()
+        wire_encodings = None
+        if request.arguments is not None:
+            wire_encodings = request.arguments.kwargs.get('wireEncodings')
+        if wire_encodings is not None:
+            wire_encoding = JSON_WIRE_ENCODING
+            supported = get_supported_wire_encodings()
+            for encoding in wire_encodings:
+                if encoding in supported:
+                    wire_encoding = encoding
+                    break
+
         pydevd_info = pydevd_schema.PydevdInfo(
             usingCython=USING_CYTHON,
             usingFrameEval=USING_FRAME_EVAL,
+            wireEncoding=wire_encoding,
+            writer=py_db.writer.get_stats(),
+            caches=get_bounded_caches_stats(),
         )
         body = {
             'python': py_info,
@@ -1086,7 +1105,9 @@ class PyDevJsonCommandProcessor(object):
             'pydevd': pydevd_info,
         }
         response = pydevd_base_schema.build_response(request, kwargs={'body': body})
-        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+        cmd = NetCommand(CMD_RETURN, 0, response, is_json=True)
+        set_wire_encoding(wire_encoding)
+        return cmd
 
     def on_setpydevdsourcemap_request(self, py_db, request):
         args = request.arguments  # : :type args: SetPydevdSourceMapArguments
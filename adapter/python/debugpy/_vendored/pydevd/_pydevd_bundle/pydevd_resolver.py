@@ -8,6 +8,7 @@ import traceback
 from os.path import basename
 
 from functools import partial
+from itertools import islice
 from _pydevd_bundle.pydevd_constants import dict_iter_items, dict_keys, xrange, IS_PY36_OR_GREATER, \
     MethodWrapperType, RETURN_VALUES_DICT, DebugInfoHolder, IS_PYPY, GENERATED_LEN_ATTR_NAME
 from _pydevd_bundle.pydevd_safe_repr import SafeRepr
@@ -19,6 +20,19 @@ MAX_ITEMS_TO_HANDLE = 300
 TOO_LARGE_MSG = 'Too large to show contents. Max items to show: ' + str(MAX_ITEMS_TO_HANDLE)
 TOO_LARGE_ATTR = 'Unable to handle:'
 
+# Resolvers may also page through the items of a container (so that a client which asks for
+# `indexedVariables` in chunks doesn't need the whole container to be materialized). Those
+# resolvers provide:
+#
+#     get_indexed_count(obj) -> int|None
+#         The number of items to page through (None if paging isn't possible).
+#
+#     get_indexed_contents_debug_adapter_protocol(obj, start, count, fmt=None)
+#         The entries for the items in [start:start + count].
+#
+#     get_named_contents_debug_adapter_protocol(obj, fmt=None)
+#         The entries which aren't items (i.e.: attributes and the generated len()).
+
 
 #=======================================================================================================================
 # UnableToResolveVariableException
@@ -292,10 +306,29 @@ class DictResolver:
 
         i = 0
 
+        for entry in self._iter_entries(dict_iter_items(dct), fmt):
+            i += 1
+            ret.append(entry)
+            if i > MAX_ITEMS_TO_HANDLE:
+                ret.append((TOO_LARGE_ATTR, TOO_LARGE_MSG, None))
+                break
+
+        # in case the class extends built-in type and has some additional fields
+        from_default_resolver = defaultResolver.get_contents_debug_adapter_protocol(dct, fmt)
+
+        if from_default_resolver:
+            ret = from_default_resolver + ret
+
+        if self.sort_keys:
+            ret = sorted(ret, key=lambda tup: sorted_attributes_key(tup[0]))
+
+        ret.append((GENERATED_LEN_ATTR_NAME, len(dct), partial(_apply_evaluate_name, evaluate_name='len(%s)')))
+        return ret
+
+    def _iter_entries(self, items, fmt):
         found_representations = set()
 
-        for key, val in dict_iter_items(dct):
-            i += 1
+        for key, val in items:
             key_as_str = self.key_to_str(key, fmt)
 
             if key_as_str not in found_representations:
@@ -312,20 +345,18 @@ class DictResolver:
                 eval_key_str = '[%s]' % (s,)
             else:
                 eval_key_str = None
-            ret.append((key_as_str, val, eval_key_str))
-            if i > MAX_ITEMS_TO_HANDLE:
-                ret.append((TOO_LARGE_ATTR, TOO_LARGE_MSG, None))
-                break
-
-        # in case the class extends built-in type and has some additional fields
-        from_default_resolver = defaultResolver.get_contents_debug_adapter_protocol(dct, fmt)
-
-        if from_default_resolver:
-            ret = from_default_resolver + ret
+            yield (key_as_str, val, eval_key_str)
 
+    def get_indexed_count(self, dct):
         if self.sort_keys:
-            ret = sorted(ret, key=lambda tup: sorted_attributes_key(tup[0]))
+            return None  # Items must be sorted, so, they can't be paged.
+        return len(dct)
+
+    def get_indexed_contents_debug_adapter_protocol(self, dct, start, count, fmt=None):
+        return list(self._iter_entries(islice(dict_iter_items(dct), start, start + count), fmt))
 
+    def get_named_contents_debug_adapter_protocol(self, dct, fmt=None):
+        ret = defaultResolver.get_contents_debug_adapter_protocol(dct, fmt)
         ret.append((GENERATED_LEN_ATTR_NAME, len(dct), partial(_apply_evaluate_name, evaluate_name='len(%s)')))
         return ret
 
@@ -353,6 +384,13 @@ def _apply_evaluate_name(parent_name, evaluate_name):
     return evaluate_name % (parent_name,)
 
 
+def _get_index_format_str(l, fmt):
+    format_str = '%0' + str(int(len(str(l - 1)))) + 'd'
+    if fmt is not None and fmt.get('hex', False):
+        format_str = '0x%0' + str(int(len(hex(l).lstrip('0x')))) + 'x'
+    return format_str
+
+
 #=======================================================================================================================
 # TupleResolver
 #=======================================================================================================================
@@ -380,12 +418,9 @@ class TupleResolver:  # to enumerate tuples and lists
 
         :return list(tuple(name:str, value:object, evaluateName:str))
         '''
-        l = len(lst)
         ret = []
 
-        format_str = '%0' + str(int(len(str(l - 1)))) + 'd'
-        if fmt is not None and fmt.get('hex', False):
-            format_str = '0x%0' + str(int(len(hex(l).lstrip('0x')))) + 'x'
+        format_str = _get_index_format_str(len(lst), fmt)
 
         for i, item in enumerate(lst):
             ret.append((format_str % i, item, '[%s]' % i))
@@ -402,13 +437,26 @@ class TupleResolver:  # to enumerate tuples and lists
         ret.append((GENERATED_LEN_ATTR_NAME, len(lst), partial(_apply_evaluate_name, evaluate_name='len(%s)')))
         return ret
 
+    def get_indexed_count(self, lst):
+        return len(lst)
+
+    def get_indexed_contents_debug_adapter_protocol(self, lst, start, count, fmt=None):
+        format_str = _get_index_format_str(len(lst), fmt)
+        if lst.__class__ in (list, tuple):
+            items = lst[start:start + count]
+        else:
+            items = islice(lst, start, start + count)  # i.e.: deque (or some subclass).
+        return [(format_str % i, item, '[%s]' % i) for i, item in enumerate(items, start)]
+
+    def get_named_contents_debug_adapter_protocol(self, lst, fmt=None):
+        ret = defaultResolver.get_contents_debug_adapter_protocol(lst, fmt=fmt)
+        ret.append((GENERATED_LEN_ATTR_NAME, len(lst), partial(_apply_evaluate_name, evaluate_name='len(%s)')))
+        return ret
+
     def get_dictionary(self, var, fmt={}):
-        l = len(var)
         d = {}
 
-        format_str = '%0' + str(int(len(str(l - 1)))) + 'd'
-        if fmt is not None and fmt.get('hex', False):
-            format_str = '0x%0' + str(int(len(hex(l).lstrip('0x')))) + 'x'
+        format_str = _get_index_format_str(len(var), fmt)
 
         for i, item in enumerate(var):
             d[format_str % i] = item
@@ -449,6 +497,17 @@ class SetResolver:
         ret.append((GENERATED_LEN_ATTR_NAME, len(obj), partial(_apply_evaluate_name, evaluate_name='len(%s)')))
         return ret
 
+    def get_indexed_count(self, obj):
+        return len(obj)
+
+    def get_indexed_contents_debug_adapter_protocol(self, obj, start, count, fmt=None):
+        return [(str(id(item)), item, None) for item in islice(obj, start, start + count)]
+
+    def get_named_contents_debug_adapter_protocol(self, obj, fmt=None):
+        ret = defaultResolver.get_contents_debug_adapter_protocol(obj, fmt=fmt)
+        ret.append((GENERATED_LEN_ATTR_NAME, len(obj), partial(_apply_evaluate_name, evaluate_name='len(%s)')))
+        return ret
+
     def resolve(self, var, attribute):
         if attribute in (GENERATED_LEN_ATTR_NAME, TOO_LARGE_ATTR):
             return None
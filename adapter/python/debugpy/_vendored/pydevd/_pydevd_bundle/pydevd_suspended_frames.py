@@ -5,7 +5,8 @@ from _pydevd_bundle.pydevd_constants import get_frame, dict_items, RETURN_VALUES
     dict_iter_items, ForkSafeLock, GENERATED_LEN_ATTR_NAME, silence_warnings_decorator
 from _pydevd_bundle.pydevd_xml import get_variable_details, get_type
 from _pydev_bundle.pydev_override import overrides
-from _pydevd_bundle.pydevd_resolver import sorted_attributes_key, TOO_LARGE_ATTR, get_var_scope
+from _pydevd_bundle.pydevd_resolver import sorted_attributes_key, TOO_LARGE_ATTR, get_var_scope, \
+    MAX_ITEMS_TO_HANDLE
 from _pydevd_bundle.pydevd_safe_repr import SafeRepr
 from _pydev_bundle import pydev_log
 from _pydevd_bundle import pydevd_vars
@@ -83,6 +84,14 @@ class _AbstractVariable(object):
 
         if resolver is not None:  # I.e.: it's a container
             var_data['variablesReference'] = self.get_variable_reference()
+
+            # Big containers are paged by the client (otherwise only the first
+            # MAX_ITEMS_TO_HANDLE items would be shown).
+            # Note: namedVariables is optional and isn't sent: counting the named children
+            # means listing all the attributes, which is only done if the client asks for them.
+            indexed_count = self._get_indexed_count(resolver)
+            if indexed_count is not None and indexed_count > MAX_ITEMS_TO_HANDLE:
+                var_data['indexedVariables'] = indexed_count
         else:
             var_data['variablesReference'] = 0  # It's mandatory (although if == 0 it doesn't have children).
 
@@ -91,7 +100,18 @@ class _AbstractVariable(object):
 
         return var_data
 
-    def get_children_variables(self, fmt=None, scope=None):
+    def get_children_variables(self, fmt=None, scope=None, filter=None, start=0, count=0):
+        '''
+        :param str filter:
+            Either 'named' or 'indexed' to get only the attributes or a page of the items of a
+            container (None to get all the children).
+
+        :param int start:
+            The index of the first item to get (when filter == 'indexed').
+
+        :param int count:
+            The number of items to get (0 means all the items after start).
+        '''
         raise NotImplementedError()
 
     def get_child_variable_named(self, name, fmt=None, scope=None):
@@ -100,6 +120,25 @@ class _AbstractVariable(object):
                 return child_var
         return None
 
+    def _get_indexed_count(self, resolver):
+        '''
+        :return int|None:
+            The number of items of the container (or None if its items can't be paged).
+        '''
+        get_indexed_count = getattr(resolver, 'get_indexed_count', None)
+        if get_indexed_count is None:
+            return None
+        try:
+            return get_indexed_count(self.value)
+        except:
+            pydev_log.exception('Error getting the number of items of: %s', self.name)
+            return None
+
+    def _get_named_contents(self, resolver, fmt):
+        lst = resolver.get_named_contents_debug_adapter_protocol(self.value, fmt=fmt)
+        lst, group_entries = self._group_entries(lst, handle_return_values=False)
+        return group_entries + lst
+
     def _group_entries(self, lst, handle_return_values):
         scope_to_grouper = {}
 
@@ -156,12 +195,26 @@ class _ObjectVariable(_AbstractVariable):
 
     @silence_warnings_decorator
     @overrides(_AbstractVariable.get_children_variables)
-    def get_children_variables(self, fmt=None, scope=None):
+    def get_children_variables(self, fmt=None, scope=None, filter=None, start=0, count=0):
         _type, _type_name, resolver = get_type(self.value)
 
         children_variables = []
         if resolver is not None:  # i.e.: it's a container.
-            if hasattr(resolver, 'get_contents_debug_adapter_protocol'):
+            indexed_count = None
+            if filter in ('named', 'indexed'):
+                indexed_count = self._get_indexed_count(resolver)
+
+            if indexed_count is not None:
+                if filter == 'named':
+                    lst = self._get_named_contents(resolver, fmt)
+                else:
+                    # Only the requested page is gotten from the container.
+                    if not count:
+                        count = indexed_count - start
+                    lst = resolver.get_indexed_contents_debug_adapter_protocol(
+                        self.value, start, count, fmt=fmt)
+
+            elif hasattr(resolver, 'get_contents_debug_adapter_protocol'):
                 # The get_contents_debug_adapter_protocol needs to return sorted.
                 lst = resolver.get_contents_debug_adapter_protocol(self.value, fmt=fmt)
             else:
@@ -172,9 +225,10 @@ class _ObjectVariable(_AbstractVariable):
                 # No evaluate name in this case.
                 lst = [(key, value, None) for (key, value) in lst]
 
-            lst, group_entries = self._group_entries(lst, handle_return_values=False)
-            if group_entries:
-                lst = group_entries + lst
+            if indexed_count is None:
+                lst, group_entries = self._group_entries(lst, handle_return_values=False)
+                if group_entries:
+                    lst = group_entries + lst
             parent_evaluate_name = self.evaluate_name
             if parent_evaluate_name:
                 for key, val, evaluate_name in lst:
@@ -261,7 +315,8 @@ class _FrameVariable(_AbstractVariable):
 
     @silence_warnings_decorator
     @overrides(_AbstractVariable.get_children_variables)
-    def get_children_variables(self, fmt=None, scope=None):
+    def get_children_variables(self, fmt=None, scope=None, filter=None, start=0, count=0):
+        # Note: the locals/globals are never paged.
         children_variables = []
         if scope is not None:
             assert isinstance(scope, ScopeRequest)
@@ -0,0 +1,388 @@
+'''
+Tracing backend based on sys.monitoring (PEP 669), used instead of sys.settrace on Python 3.12
+onwards when PYDEVD_USE_SYS_MONITORING is set.
+
+With sys.settrace every frame entered has a Python callback (even if it's just to decide that it
+shouldn't be traced). With sys.monitoring events are only enabled where they're needed:
+
+- PY_START/PY_RESUME (global): decide whether the code object entered needs to be monitored.
+  The event is always disabled afterwards for that code object (until `restart_events()` is
+  called, which is done when breakpoints are added or some thread starts stepping).
+
+- LINE/PY_RETURN/PY_YIELD (local to a code object): enabled only in code objects which have
+  breakpoints and in the code objects entered by a thread which is stepping. A line without a
+  breakpoint is disabled in its first event if no thread is stepping.
+
+- RAISE/PY_UNWIND (global): only enabled when there are exception breakpoints (RAISE for
+  exceptions raised and PY_UNWIND for unhandled exceptions).
+
+The events are then handled by the same `PyDBFrame.trace_dispatch` used with sys.settrace.
+
+Note that the user unhandled exceptions and the breakpoints from plugins (i.e.: django/jinja2
+templates) are not supported in this mode.
+'''
+import dis
+import sys
+
+from _pydev_bundle import pydev_log
+from _pydevd_bundle.pydevd_comm_constants import (CMD_STEP_INTO, CMD_STEP_INTO_MY_CODE, CMD_STEP_OVER,
+    CMD_STEP_OVER_MY_CODE, CMD_STEP_RETURN, CMD_STEP_RETURN_MY_CODE)
+from _pydevd_bundle.pydevd_constants import STATE_SUSPEND
+from _pydevd_bundle.pydevd_trace_dispatch import USING_CYTHON, global_cache_skips, global_cache_frame_skips, \
+    code_tracing_info_bounded_cache
+from _pydevd_bundle.pydevd_trace_dispatch_regular import SKIP_FILE_TYPE, SKIP_FILES_FILTER
+import pydevd_file_utils
+
+if USING_CYTHON:
+    from _pydevd_bundle.pydevd_cython import (create_code_tracing_info, PyDBFrame,
+        notify_skipped_step_in_because_of_filters)
+else:
+    from _pydevd_bundle.pydevd_trace_dispatch_regular import (create_code_tracing_info, PyDBFrame,
+        notify_skipped_step_in_because_of_filters)
+
+try:
+    monitoring = sys.monitoring
+except AttributeError:
+    monitoring = None
+else:
+    _DEBUGGER_ID = monitoring.DEBUGGER_ID
+    _TOOL_NAME = 'pydevd'
+    DISABLE = monitoring.DISABLE
+    _events = monitoring.events
+    _CODE_EVENTS = _events.LINE | _events.PY_RETURN | _events.PY_YIELD
+
+# The PyDB for which events are being monitored (None when not monitoring).
+_py_db = None
+
+
+def start_monitoring(py_db):
+    '''
+    Starts monitoring the events needed by the given PyDB (does nothing if already monitoring).
+    '''
+    global _py_db
+    if _py_db is py_db:
+        return
+
+    tool_name = monitoring.get_tool(_DEBUGGER_ID)
+    if tool_name is None:
+        monitoring.use_tool_id(_DEBUGGER_ID, _TOOL_NAME)
+
+    elif tool_name != _TOOL_NAME:
+        pydev_log.critical('Unable to debug: sys.monitoring.DEBUGGER_ID is already in use by: %s.', tool_name)
+        return
+
+    register_callback = monitoring.register_callback
+    register_callback(_DEBUGGER_ID, _events.PY_START, _on_py_start)
+    register_callback(_DEBUGGER_ID, _events.PY_RESUME, _on_py_start)
+    register_callback(_DEBUGGER_ID, _events.LINE, _on_line)
+    register_callback(_DEBUGGER_ID, _events.PY_RETURN, _on_py_return)
+    register_callback(_DEBUGGER_ID, _events.PY_YIELD, _on_py_return)
+    register_callback(_DEBUGGER_ID, _events.RAISE, _on_raise)
+    register_callback(_DEBUGGER_ID, _events.PY_UNWIND, _on_py_unwind)
+
+    _py_db = py_db
+    update_global_events(py_db)
+    monitoring.restart_events()
+
+
+def stop_monitoring():
+    global _py_db
+    if _py_db is None:
+        return
+    _py_db = None
+
+    monitoring.set_events(_DEBUGGER_ID, 0)
+    if hasattr(monitoring, 'clear_tool_id'):  # Python 3.13 onwards (also clears the local events).
+        monitoring.clear_tool_id(_DEBUGGER_ID)
+    else:
+        for event in (_events.PY_START, _events.PY_RESUME, _events.LINE, _events.PY_RETURN,
+                      _events.PY_YIELD, _events.RAISE, _events.PY_UNWIND):
+            monitoring.register_callback(_DEBUGGER_ID, event, None)
+    monitoring.free_tool_id(_DEBUGGER_ID)
+
+
+def update_global_events(py_db):
+    '''
+    Enables the global events needed for the current (exception) breakpoints.
+    '''
+    if _py_db is not py_db:
+        return
+
+    events = _events.PY_START | _events.PY_RESUME
+    if py_db.break_on_caught_exceptions or py_db.has_plugin_exception_breaks:
+        events |= _events.RAISE
+    if py_db.break_on_uncaught_exceptions:
+        events |= _events.PY_UNWIND
+    monitoring.set_events(_DEBUGGER_ID, events)
+
+
+def on_breakpoints_changed(py_db, removed):
+    if _py_db is not py_db:
+        return
+
+    update_global_events(py_db)
+    if not removed:
+        # Code objects already disabled must be checked again for the new breakpoints.
+        monitoring.restart_events()
+
+
+def set_events_for_untraced_contexts(py_db):
+    '''
+    Enables the events for the code objects with breakpoints which are already running in some
+    thread (as those won't have a PY_START anymore).
+    '''
+    if _py_db is not py_db:
+        return
+
+    ignore_thread_ids = set(
+        t.ident for t in list(py_db.threading_active.values())
+        if getattr(t, 'is_pydev_daemon_thread', False) or getattr(t, 'pydev_do_not_trace', False)
+    )
+    for thread_id, frame in sys._current_frames().items():
+        if thread_id in ignore_thread_ids:
+            continue
+        while frame is not None:
+            code_tracing_info = _get_code_tracing_info(py_db, frame)
+            if code_tracing_info.skip == 0 and _has_breakpoint_in_code(py_db, code_tracing_info):
+                _enable_code_events(frame.f_code)
+            frame = frame.f_back
+
+    update_global_events(py_db)
+    monitoring.restart_events()
+
+
+def set_events_for_frame_and_parents(py_db, frame, disable=False):
+    '''
+    Enables the events for the code of the given frame and its parents (used when a thread is
+    about to step or when it should be suspended).
+    '''
+    if _py_db is not py_db:
+        return
+
+    while frame is not None:
+        if py_db.get_file_type(frame) is None:
+            if disable:
+                monitoring.set_local_events(_DEBUGGER_ID, frame.f_code, 0)
+            else:
+                _enable_code_events(frame.f_code)
+        frame = frame.f_back
+
+    if not disable:
+        monitoring.restart_events()
+
+
+def _enable_code_events(code):
+    if monitoring.get_local_events(_DEBUGGER_ID, code) != _CODE_EVENTS:
+        monitoring.set_local_events(_DEBUGGER_ID, code, _CODE_EVENTS)
+
+
+def _get_code_tracing_info(py_db, frame):
+    code = frame.f_code
+    code_tracing_info = global_cache_skips.get(id(code))
+    if (
+            code_tracing_info is None
+            or code_tracing_info.code is not code
+            or code_tracing_info.generation != py_db.code_tracing_info_generation
+        ):
+        code_tracing_info = create_code_tracing_info(py_db, frame, global_cache_skips)
+    else:
+        code_tracing_info_bounded_cache.hits += 1
+    return code_tracing_info
+
+
+def _has_breakpoint_in_code(py_db, code_tracing_info):
+    breakpoints_for_file = py_db.breakpoints.get(code_tracing_info.abs_path_canonical_path_and_base[1])
+    if not breakpoints_for_file:
+        return False
+
+    # Note: same cache (and values) used in PyDBFrame.trace_dispatch.
+    frame_cache_key = code_tracing_info.frame_cache_key
+    breakpoints_in_frame_cache = global_cache_frame_skips.get(frame_cache_key, -1)
+    if breakpoints_in_frame_cache != -1:
+        return breakpoints_in_frame_cache == 1
+
+    func_lines = set(offset_and_lineno[1] for offset_and_lineno in dis.findlinestarts(code_tracing_info.code))
+    has_breakpoint_in_frame = any(bp_line in func_lines for bp_line in breakpoints_for_file)
+    global_cache_frame_skips[frame_cache_key] = 1 if has_breakpoint_in_frame else 0
+    return has_breakpoint_in_frame
+
+
+def _get_thread_and_info(py_db):
+    '''
+    :return tuple(Thread, PyDBAdditionalThreadInfo):
+        The current thread and its info or (None, None) if it shouldn't be debugged.
+    '''
+    # Note: don't use threading.current_thread() to avoid creating dummy threads.
+    thread = py_db.threading_active.get(py_db.threading_get_ident())
+    if thread is None or getattr(thread, 'is_pydev_daemon_thread', False) or getattr(thread, 'pydev_do_not_trace', False):
+        return None, None
+
+    try:
+        additional_info = thread.additional_info
+        if additional_info is None:
+            raise AttributeError()
+    except:
+        additional_info = py_db.set_additional_thread_info(thread)
+    return thread, additional_info
+
+
+def _is_stepping(additional_info):
+    return additional_info.pydev_step_cmd != -1 or additional_info.pydev_state == STATE_SUSPEND
+
+
+def _disable_unless_stepping(py_db):
+    # Note: disabling an event is global (not per thread), so, it can only be done if no thread
+    # is stepping (this is cheap enough as each event is only called once when disabled).
+    for thread in list(py_db.threading_active.values()):
+        additional_info = getattr(thread, 'additional_info', None)
+        if additional_info is not None and _is_stepping(additional_info):
+            return None
+    return DISABLE
+
+
+def _dispatch(py_db, code_tracing_info, thread, additional_info, frame, event, arg):
+    try:
+        PyDBFrame(
+            (
+                py_db, code_tracing_info.abs_path_canonical_path_and_base, additional_info, thread,
+                global_cache_frame_skips, code_tracing_info.frame_cache_key,
+            )
+        ).trace_dispatch(frame, event, arg)
+    except SystemExit:
+        pass
+    except Exception:
+        # Errors must not be propagated to the user code.
+        if not py_db.pydb_disposed:
+            pydev_log.exception()
+
+
+def _on_py_start(code, instruction_offset):
+    py_db = _py_db
+    if py_db is None or py_db.pydb_disposed:
+        return DISABLE
+
+    frame = sys._getframe(1)
+    code_tracing_info = _get_code_tracing_info(py_db, frame)
+    if code_tracing_info.skip in (SKIP_FILE_TYPE, SKIP_FILES_FILTER):
+        _thread, additional_info = _get_thread_and_info(py_db)
+        if (
+                additional_info is not None
+                and additional_info.pydev_step_cmd != -1
+                and additional_info.pydev_original_step_cmd in (CMD_STEP_INTO, CMD_STEP_INTO_MY_CODE)
+            ):
+            notify_skipped_step_in_because_of_filters(py_db, frame)
+        return DISABLE
+
+    if _has_breakpoint_in_code(py_db, code_tracing_info):
+        _enable_code_events(code)
+        return DISABLE
+
+    _thread, additional_info = _get_thread_and_info(py_db)
+    if additional_info is not None and _is_stepping(additional_info):
+        if (
+                additional_info.pydev_state != STATE_SUSPEND
+                and additional_info.pydev_step_cmd in (CMD_STEP_OVER, CMD_STEP_OVER_MY_CODE, CMD_STEP_RETURN, CMD_STEP_RETURN_MY_CODE)
+                and not (py_db.show_return_values and frame.f_back is additional_info.pydev_step_stop)
+            ):
+            # When stepping over/returning there's no need to monitor the code called (but
+            # this code may still have to be monitored for a later step into).
+            return None
+
+        _enable_code_events(code)
+        return DISABLE
+
+    ret = _disable_unless_stepping(py_db)
+    if ret is DISABLE and monitoring.get_local_events(_DEBUGGER_ID, code):
+        # Not needed anymore (i.e.: it was monitored for a step which already finished).
+        monitoring.set_local_events(_DEBUGGER_ID, code, 0)
+    return ret
+
+
+def _on_line(code, line):
+    py_db = _py_db
+    if py_db is None or py_db.pydb_disposed:
+        return DISABLE
+
+    frame = sys._getframe(1)
+    code_tracing_info = _get_code_tracing_info(py_db, frame)
+    breakpoints_for_file = py_db.breakpoints.get(code_tracing_info.abs_path_canonical_path_and_base[1])
+    has_breakpoint = breakpoints_for_file is not None and line in breakpoints_for_file
+
+    thread, additional_info = _get_thread_and_info(py_db)
+    if additional_info is None:
+        return None if has_breakpoint else _disable_unless_stepping(py_db)
+
+    if not has_breakpoint and not _is_stepping(additional_info):
+        return _disable_unless_stepping(py_db)
+
+    _dispatch(py_db, code_tracing_info, thread, additional_info, frame, 'line', None)
+
+
+def _on_py_return(code, instruction_offset, retval):
+    py_db = _py_db
+    if py_db is None or py_db.pydb_disposed:
+        return DISABLE
+
+    thread, additional_info = _get_thread_and_info(py_db)
+    if additional_info is None or not _is_stepping(additional_info):
+        return _disable_unless_stepping(py_db)
+
+    frame = sys._getframe(1)
+    _dispatch(py_db, _get_code_tracing_info(py_db, frame), thread, additional_info, frame, 'return', retval)
+
+
+def _on_raise(code, instruction_offset, exception):
+    # Note: RAISE is also called in the caller frames as the exception is propagated (which
+    # matches the 'exception' event from sys.settrace).
+    py_db = _py_db
+    if py_db is None or py_db.pydb_disposed:
+        return
+
+    frame = sys._getframe(1)
+    code_tracing_info = _get_code_tracing_info(py_db, frame)
+    if code_tracing_info.skip in (SKIP_FILE_TYPE, SKIP_FILES_FILTER):
+        return
+
+    thread, additional_info = _get_thread_and_info(py_db)
+    if additional_info is None:
+        return
+
+    _dispatch(py_db, code_tracing_info, thread, additional_info, frame, 'exception',
+              (type(exception), exception, exception.__traceback__))
+
+
+# The functions which run the code of a thread (same as in fix_top_level_trace_and_get_trace_func).
+_TOP_LEVEL_FUNCTIONS = {
+    '_bootstrap_inner': 'threading.py',
+    '__bootstrap_inner': 'threading.py',
+    '__call__': 'pydev_monkey.py',
+    '_exec': 'pydevd.py',
+}
+
+
+def _is_top_level_frame(frame):
+    basename = _TOP_LEVEL_FUNCTIONS.get(frame.f_code.co_name)
+    return basename is not None and basename == pydevd_file_utils.basename(frame.f_code.co_filename)
+
+
+def _on_py_unwind(code, instruction_offset, exception):
+    py_db = _py_db
+    if py_db is None or py_db.pydb_disposed:
+        return
+
+    # The exception is unhandled if it's leaving the topmost user frame.
+    back = sys._getframe(1).f_back
+    if back is not None and not _is_top_level_frame(back):
+        return
+
+    thread, additional_info = _get_thread_and_info(py_db)
+    if additional_info is None or additional_info.suspended_at_unhandled:
+        return
+
+    additional_info.suspended_at_unhandled = True
+    try:
+        py_db.stop_on_unhandled_exception(
+            py_db, thread, additional_info, (type(exception), exception, exception.__traceback__))
+    except Exception:
+        if not py_db.pydb_disposed:
+            pydev_log.exception()
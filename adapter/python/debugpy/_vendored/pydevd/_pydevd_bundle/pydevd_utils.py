@@ -31,7 +31,10 @@ def save_main_module(file, module_name):
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", category=DeprecationWarning)
         warnings.simplefilter("ignore", category=PendingDeprecationWarning)
-        from imp import new_module
+        try:
+            from imp import new_module
+        except ImportError:  # imp was removed in Python 3.12.
+            from types import ModuleType as new_module
 
     m = new_module('__main__')
     sys.modules['__main__'] = m
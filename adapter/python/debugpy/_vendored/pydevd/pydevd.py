@@ -32,6 +32,7 @@ from _pydevd_bundle import pydevd_io, pydevd_vm_type
 from _pydevd_bundle import pydevd_utils
 from _pydev_bundle.pydev_console_utils import DebugConsoleStdIn
 from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
+from _pydevd_bundle.pydevd_bounded_cache import BoundedCache
 from _pydevd_bundle.pydevd_breakpoints import ExceptionBreakpoint, get_exception_breakpoint
 from _pydevd_bundle.pydevd_comm_constants import (CMD_THREAD_SUSPEND, CMD_STEP_INTO, CMD_SET_BREAK,
     CMD_STEP_INTO_MY_CODE, CMD_STEP_OVER, CMD_SMART_STEP_INTO, CMD_RUN_TO_LINE,
@@ -41,7 +42,8 @@ from _pydevd_bundle.pydevd_constants import (IS_JYTH_LESS25, get_thread_id, get_
     dict_keys, dict_iter_items, DebugInfoHolder, PYTHON_SUSPEND, STATE_SUSPEND, STATE_RUN, get_frame,
     clear_cached_thread_id, INTERACTIVE_MODE_AVAILABLE, SHOW_DEBUG_INFO_ENV, IS_PY34_OR_GREATER, IS_PY2, NULL,
     NO_FTRACE, IS_IRONPYTHON, JSON_PROTOCOL, IS_CPYTHON, HTTP_JSON_PROTOCOL, USE_CUSTOM_SYS_CURRENT_FRAMES_MAP, call_only_once,
-    ForkSafeLock, IGNORE_BASENAMES_STARTING_WITH, EXCEPTION_TYPE_UNHANDLED)
+    ForkSafeLock, IGNORE_BASENAMES_STARTING_WITH, EXCEPTION_TYPE_UNHANDLED, JSON_WIRE_ENCODING,
+    set_wire_encoding, PYDEVD_USE_SYS_MONITORING)
 from _pydevd_bundle.pydevd_defaults import PydevdCustomization  # Note: import alias used on pydev_monkey.
 from _pydevd_bundle.pydevd_custom_frames import CustomFramesContainer, custom_frames_container_init
 from _pydevd_bundle.pydevd_dont_trace_files import DONT_TRACE, PYDEV_FILE, LIB_FILE, DONT_TRACE_DIRS
@@ -49,7 +51,7 @@ from _pydevd_bundle.pydevd_extension_api import DebuggerEventHandler
 from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame, remove_exception_from_frame
 from _pydevd_bundle.pydevd_net_command_factory_xml import NetCommandFactory
 from _pydevd_bundle.pydevd_trace_dispatch import (
-    trace_dispatch as _trace_dispatch, global_cache_skips, global_cache_frame_skips, fix_top_level_trace_and_get_trace_func)
+    trace_dispatch as _trace_dispatch, global_cache_frame_skips, fix_top_level_trace_and_get_trace_func)
 from _pydevd_bundle.pydevd_utils import save_main_module, is_current_thread_main_thread
 from _pydevd_frame_eval.pydevd_frame_eval_main import (
     frame_eval_func, dummy_trace_dispatch)
@@ -80,6 +82,7 @@ from socket import SHUT_RDWR
 from _pydevd_bundle.pydevd_api import PyDevdAPI
 from _pydevd_bundle.pydevd_timeout import TimeoutTracker
 from _pydevd_bundle.pydevd_thread_lifecycle import suspend_all_threads, mark_thread_suspended
+from _pydevd_bundle import pydevd_sys_monitoring
 
 if USE_CUSTOM_SYS_CURRENT_FRAMES_MAP:
     from _pydevd_bundle.pydevd_constants import constructed_tid_to_last_frame
@@ -152,7 +155,8 @@ _global_redirect_stderr_to_server = False
 
 file_system_encoding = getfilesystemencoding()
 
-_CACHE_FILE_TYPE = {}
+_CACHE_FILE_TYPE_BOUNDED_CACHE = BoundedCache('fileType')
+_CACHE_FILE_TYPE = _CACHE_FILE_TYPE_BOUNDED_CACHE.cache
 
 pydev_log.debug('Using GEVENT_SUPPORT: %s', pydevd_constants.SUPPORT_GEVENT)
 pydev_log.debug('pydevd __file__: %s', os.path.abspath(__file__))
@@ -525,6 +529,10 @@ class PyDB(object):
         # mtime to be raised when breakpoints change
         self.mtime = 0
 
+        # To be raised when breakpoints or filters change (invalidates the info on how each code
+        # object should be traced -- see: pydevd_trace_dispatch_regular.CodeTracingInfo).
+        self.code_tracing_info_generation = 0
+
         self.file_to_id_to_line_breakpoint = {}
         self.file_to_id_to_plugin_breakpoint = {}
 
@@ -651,9 +659,12 @@ class PyDB(object):
         self.PYDEV_FILE = PYDEV_FILE
         self.LIB_FILE = LIB_FILE
 
-        self._in_project_scope_cache = {}
-        self._exclude_by_filter_cache = {}
-        self._apply_filter_cache = {}
+        self._in_project_scope_bounded_cache = BoundedCache('inProjectScope')
+        self._in_project_scope_cache = self._in_project_scope_bounded_cache.cache
+        self._exclude_by_filter_bounded_cache = BoundedCache('excludeByFilter')
+        self._exclude_by_filter_cache = self._exclude_by_filter_bounded_cache.cache
+        self._apply_filter_bounded_cache = BoundedCache('applyFilter')
+        self._apply_filter_cache = self._apply_filter_bounded_cache.cache
         self._ignore_system_exit_codes = set()
 
         # DAP related
@@ -830,7 +841,8 @@ class PyDB(object):
         # be changed for another function in PyDevdAPI.set_dont_trace_start_end_patterns.
         return False
 
-    def get_file_type(self, frame, abs_real_path_and_basename=None, _cache_file_type=_CACHE_FILE_TYPE):
+    def get_file_type(self, frame, abs_real_path_and_basename=None, _cache_file_type=_CACHE_FILE_TYPE,
+                      _on_miss=_CACHE_FILE_TYPE_BOUNDED_CACHE.on_miss, _bounded_cache=_CACHE_FILE_TYPE_BOUNDED_CACHE):
         '''
         :param abs_real_path_and_basename:
             The result from get_abs_path_real_path_and_base_from_file or
@@ -866,8 +878,11 @@ class PyDB(object):
         # speedups).
         cache_key = (frame.f_code.co_firstlineno, abs_real_path_and_basename[0], frame.f_code)
         try:
-            return _cache_file_type[cache_key]
+            file_type = _cache_file_type[cache_key]
+            _bounded_cache.hits += 1
+            return file_type
         except:
+            _on_miss()
             if abs_real_path_and_basename[0] == '<string>':
 
                 # Consider it an untraceable file unless there's no back frame (ignoring
@@ -931,6 +946,11 @@ class PyDB(object):
             this function is called on a multi-threaded program (either programmatically or attach
             to pid).
         '''
+        if PYDEVD_USE_SYS_MONITORING:
+            # Events are monitored in all threads.
+            pydevd_sys_monitoring.start_monitoring(self)
+            return
+
         if self.frame_eval_func is not None:
             self.frame_eval_func()
             pydevd_tracing.SetTrace(self.dummy_trace_dispatch)
@@ -959,6 +979,10 @@ class PyDB(object):
         '''
         When breakpoints change, we have to re-evaluate all the assumptions we've made so far.
         '''
+        self.code_tracing_info_generation += 1
+        if PYDEVD_USE_SYS_MONITORING:
+            pydevd_sys_monitoring.on_breakpoints_changed(self, removed)
+
         if not self.ready_to_run:
             # No need to do anything if we're still not running.
             return
@@ -973,7 +997,10 @@ class PyDB(object):
         # Enable the tracing for existing threads (because there may be frames being executed that
         # are currently untraced).
 
-        if IS_CPYTHON:
+        if PYDEVD_USE_SYS_MONITORING:
+            pydevd_sys_monitoring.set_events_for_untraced_contexts(self)
+
+        elif IS_CPYTHON:
             # Note: use sys._current_frames instead of threading.enumerate() because this way
             # we also see C/C++ threads, not only the ones visible to the threading module.
             tid_to_frame = sys._current_frames()
@@ -1049,8 +1076,11 @@ class PyDB(object):
 
             cache_key = (frame.f_code.co_firstlineno, absolute_filename, frame.f_code)
 
-            return self._in_project_scope_cache[cache_key]
+            in_project_scope = self._in_project_scope_cache[cache_key]
+            self._in_project_scope_bounded_cache.hits += 1
+            return in_project_scope
         except KeyError:
+            self._in_project_scope_bounded_cache.on_miss()
             cache = self._in_project_scope_cache
             try:
                 abs_real_path_and_basename  # If we've gotten it previously, use it again.
@@ -1084,6 +1114,9 @@ class PyDB(object):
         self._exclude_filters_enabled = self._files_filtering.use_exclude_filters()
         self._is_libraries_filter_enabled = self._files_filtering.use_libraries_filter()
         self.is_files_filter_enabled = self._exclude_filters_enabled or self._is_libraries_filter_enabled
+        # Note: only raised after the caches are cleared (so, info computed in the meanwhile
+        # is computed again).
+        self.code_tracing_info_generation += 1
 
     def clear_dont_trace_start_end_patterns_caches(self):
         # When start/end patterns are changed we must clear all caches which would be
@@ -1103,8 +1136,11 @@ class PyDB(object):
         '''
         cache_key = (absolute_filename, frame.f_code.co_name, frame.f_code.co_firstlineno)
         try:
-            return self._exclude_by_filter_cache[cache_key]
+            exclude = self._exclude_by_filter_cache[cache_key]
+            self._exclude_by_filter_bounded_cache.hits += 1
+            return exclude
         except KeyError:
+            self._exclude_by_filter_bounded_cache.on_miss()
             cache = self._exclude_by_filter_cache
 
             # pydevd files are always filtered out
@@ -1138,8 +1174,11 @@ class PyDB(object):
         '''
         cache_key = (frame.f_code.co_firstlineno, original_filename, force_check_project_scope, frame.f_code)
         try:
-            return self._apply_filter_cache[cache_key]
+            exclude = self._apply_filter_cache[cache_key]
+            self._apply_filter_bounded_cache.hits += 1
+            return exclude
         except KeyError:
+            self._apply_filter_bounded_cache.on_miss()
             if self.plugin is not None and (self.has_plugin_line_breaks or self.has_plugin_exception_breaks):
                 # If it's explicitly needed by some plugin, we can't skip it.
                 if not self.plugin.can_skip(self, frame):
@@ -1244,6 +1283,9 @@ class PyDB(object):
         if curr_writer:
             curr_writer.do_kill_pydev_thread()
 
+        # A new client has to ask for an encoding other than json again.
+        set_wire_encoding(JSON_WIRE_ENCODING)
+
         self.writer = WriterThread(sock, self, terminate_on_socket_close=terminate_on_socket_close)
         self.reader = ReaderThread(
             sock,
@@ -1604,8 +1646,8 @@ class PyDB(object):
         self._clear_skip_caches()
 
     def _clear_skip_caches(self):
-        global_cache_skips.clear()
         global_cache_frame_skips.clear()
+        self.code_tracing_info_generation += 1
 
     def add_break_on_exception(
         self,
@@ -2006,6 +2048,10 @@ class PyDB(object):
         disable = kwargs.pop('disable', False)
         assert not kwargs
 
+        if PYDEVD_USE_SYS_MONITORING:
+            pydevd_sys_monitoring.set_events_for_frame_and_parents(self, frame, disable=disable)
+            return
+
         while frame is not None:
             # Don't change the tracing on debugger-related files
             file_type = self.get_file_type(frame)
@@ -2157,11 +2203,12 @@ class PyDB(object):
         self.start_auxiliary_daemon_threads()
 
     def patch_threads(self):
-        try:
-            # not available in jython!
-            threading.settrace(self.trace_dispatch)  # for all future threads
-        except:
-            pass
+        if not PYDEVD_USE_SYS_MONITORING:  # sys.monitoring events are already global.
+            try:
+                # not available in jython!
+                threading.settrace(self.trace_dispatch)  # for all future threads
+            except:
+                pass
 
         from _pydev_bundle.pydev_monkey import patch_thread_modules
         patch_thread_modules()
@@ -2779,6 +2826,9 @@ def stoptrace():
     except:
         pass
 
+    if PYDEVD_USE_SYS_MONITORING:
+        pydevd_sys_monitoring.stop_monitoring()
+
     from _pydev_bundle.pydev_monkey import undo_patch_thread_modules
     undo_patch_thread_modules()
 
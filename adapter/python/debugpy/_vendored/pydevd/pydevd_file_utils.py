@@ -46,6 +46,7 @@ from _pydevd_bundle.pydevd_constants import IS_PY2, IS_PY3K, DebugInfoHolder, IS
 from _pydev_bundle._pydev_filesystem_encoding import getfilesystemencoding
 from _pydevd_bundle.pydevd_comm_constants import file_system_encoding, filesystem_encoding_is_utf8
 from _pydev_bundle.pydev_log import error_once
+from _pydevd_bundle.pydevd_bounded_cache import BoundedCache
 
 import json
 import os.path
@@ -300,10 +301,17 @@ else:
     _default_normcase = _normcase_linux
 
 
-def normcase(s, NORMCASE_CACHE={}):
+_normcase_bounded_cache = BoundedCache('normcase')
+
+
+def normcase(s, NORMCASE_CACHE=_normcase_bounded_cache.cache, on_miss=_normcase_bounded_cache.on_miss,
+             bounded_cache=_normcase_bounded_cache):
     try:
-        return NORMCASE_CACHE[s]
+        normalized = NORMCASE_CACHE[s]
+        bounded_cache.hits += 1
+        return normalized
     except:
+        on_miss()
         normalized = NORMCASE_CACHE[s] = _default_normcase(s)
         return normalized
 
@@ -354,8 +362,10 @@ def set_ide_os(os):
 
 
 # Caches filled as requested during the debug session.
-NORM_PATHS_CONTAINER = {}
-NORM_PATHS_AND_BASE_CONTAINER = {}
+_norm_paths_bounded_cache = BoundedCache('normPaths')
+_norm_paths_and_base_bounded_cache = BoundedCache('normPathsAndBase')
+NORM_PATHS_CONTAINER = _norm_paths_bounded_cache.cache
+NORM_PATHS_AND_BASE_CONTAINER = _norm_paths_and_base_bounded_cache.cache
 
 
 def canonical_normalized_path(filename):
@@ -385,9 +395,12 @@ def basename(filename):
 
 
 # Returns tuple of absolute path and real path for given filename
-def _abs_and_canonical_path(filename, NORM_PATHS_CONTAINER=NORM_PATHS_CONTAINER):
+def _abs_and_canonical_path(filename, NORM_PATHS_CONTAINER=NORM_PATHS_CONTAINER,
+                            on_miss=_norm_paths_bounded_cache.on_miss, bounded_cache=_norm_paths_bounded_cache):
     try:
-        return NORM_PATHS_CONTAINER[filename]
+        ret = NORM_PATHS_CONTAINER[filename]
+        bounded_cache.hits += 1
+        return ret
     except:
         if filename.__class__ != str:
             raise AssertionError('Paths passed to _abs_and_canonical_path must be str. Found: %s (%s)' % (filename, type(filename)))
@@ -413,6 +426,7 @@ def _abs_and_canonical_path(filename, NORM_PATHS_CONTAINER=NORM_PATHS_CONTAINER)
         real_path = _apply_func_and_normalize_case(filename, os_path_real_path, isabs, normalize)
 
         # cache it for fast access later
+        on_miss()
         NORM_PATHS_CONTAINER[filename] = abs_path, real_path
         return abs_path, real_path
 
@@ -824,9 +838,12 @@ setup_client_server_paths(PATHS_FROM_ECLIPSE_TO_PYTHON)
 
 # For given file f returns tuple of its absolute path, real path and base name
 def get_abs_path_real_path_and_base_from_file(
-        filename, NORM_PATHS_AND_BASE_CONTAINER=NORM_PATHS_AND_BASE_CONTAINER):
+        filename, NORM_PATHS_AND_BASE_CONTAINER=NORM_PATHS_AND_BASE_CONTAINER,
+        on_miss=_norm_paths_and_base_bounded_cache.on_miss, bounded_cache=_norm_paths_and_base_bounded_cache):
     try:
-        return NORM_PATHS_AND_BASE_CONTAINER[filename]
+        ret = NORM_PATHS_AND_BASE_CONTAINER[filename]
+        bounded_cache.hits += 1
+        return ret
     except:
         f = filename
         if not f:
@@ -856,13 +873,18 @@ def get_abs_path_real_path_and_base_from_file(
             i = max(f.rfind('/'), f.rfind('\\'))
             base = f[i + 1:]
         ret = abs_path, canonical_normalized_filename, base
+        on_miss()
         NORM_PATHS_AND_BASE_CONTAINER[filename] = ret
         return ret
 
 
-def get_abs_path_real_path_and_base_from_frame(frame, NORM_PATHS_AND_BASE_CONTAINER=NORM_PATHS_AND_BASE_CONTAINER):
+def get_abs_path_real_path_and_base_from_frame(frame, NORM_PATHS_AND_BASE_CONTAINER=NORM_PATHS_AND_BASE_CONTAINER,
+                                               on_miss=_norm_paths_and_base_bounded_cache.on_miss,
+                                               bounded_cache=_norm_paths_and_base_bounded_cache):
     try:
-        return NORM_PATHS_AND_BASE_CONTAINER[frame.f_code.co_filename]
+        ret = NORM_PATHS_AND_BASE_CONTAINER[frame.f_code.co_filename]
+        bounded_cache.hits += 1
+        return ret
     except:
         # This one is just internal (so, does not need any kind of client-server translation)
         f = frame.f_code.co_filename
@@ -882,6 +904,8 @@ def get_abs_path_real_path_and_base_from_frame(frame, NORM_PATHS_AND_BASE_CONTAI
 
         ret = get_abs_path_real_path_and_base_from_file(f)
         # Also cache based on the frame.f_code.co_filename (if we had it inside build/bdist it can make a difference).
+        if frame.f_code.co_filename not in NORM_PATHS_AND_BASE_CONTAINER:
+            on_miss()
         NORM_PATHS_AND_BASE_CONTAINER[frame.f_code.co_filename] = ret
         return ret
 
@@ -0,0 +1,58 @@
+from _pydevd_bundle.pydevd_bounded_cache import BoundedCache, get_bounded_caches_stats
+
+
+def _add(bounded_cache, key):
+    if key not in bounded_cache.cache:
+        bounded_cache.on_miss()
+        bounded_cache.cache[key] = key
+
+
+def test_bounded_cache_evicts_oldest():
+    bounded_cache = BoundedCache('test_bounded_cache', max_size=8)
+    for i in range(8):
+        _add(bounded_cache, i)
+    assert len(bounded_cache.cache) == 8
+
+    # When full, the oldest quarter is evicted to make room.
+    _add(bounded_cache, 8)
+    assert sorted(bounded_cache.cache) == [2, 3, 4, 5, 6, 7, 8]
+
+    for i in range(9, 100):
+        _add(bounded_cache, i)
+    assert len(bounded_cache.cache) <= 8
+    assert 99 in bounded_cache.cache
+
+    stats = get_bounded_caches_stats()['test_bounded_cache']
+    assert stats == {
+        'size': len(bounded_cache.cache), 'maxSize': 8, 'hits': 0, 'misses': 100, 'evictions': 100 - len(bounded_cache.cache)}
+
+
+def test_bounded_cache_unbounded():
+    bounded_cache = BoundedCache('test_bounded_cache', max_size=0)
+    for i in range(100):
+        _add(bounded_cache, i)
+    assert len(bounded_cache.cache) == 100
+    assert bounded_cache.get_stats()['evictions'] == 0
+
+
+def test_file_utils_caches_bounded():
+    import pydevd_file_utils
+    bounded_cache = pydevd_file_utils._norm_paths_and_base_bounded_cache
+    assert bounded_cache.cache is pydevd_file_utils.NORM_PATHS_AND_BASE_CONTAINER
+
+    max_size = bounded_cache.max_size
+    bounded_cache.max_size = 10
+    try:
+        for i in range(50):
+            pydevd_file_utils.get_abs_path_real_path_and_base_from_file('/tmp/bounded_cache_%s.py' % (i,))
+        assert len(bounded_cache.cache) <= 10
+        assert pydevd_file_utils.get_abs_path_real_path_and_base_from_file('/tmp/bounded_cache_0.py')[2] == 'bounded_cache_0.py'
+
+        hits = bounded_cache.hits
+        misses = bounded_cache.misses
+        assert pydevd_file_utils.get_abs_path_real_path_and_base_from_file('/tmp/bounded_cache_0.py')[2] == 'bounded_cache_0.py'
+        assert (bounded_cache.hits, bounded_cache.misses) == (hits + 1, misses)
+    finally:
+        bounded_cache.max_size = max_size
+
+    assert 'normPathsAndBase' in get_bounded_caches_stats()
@@ -586,6 +586,42 @@ def test_case_json_hit_count_and_step(case_setup):
         writer.finished_ok = True
 
 
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='sys.monitoring requires Python 3.12 onwards.')
+def test_case_sys_monitoring_break_and_step(case_setup):
+
+    def get_environ(self):
+        env = os.environ.copy()
+        env['PYDEVD_USE_SYS_MONITORING'] = '1'
+        return env
+
+    with case_setup.test_file('_debugger_case_stepping.py', get_environ=get_environ) as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_launch()
+        break2_line = writer.get_line_index_with_content('Break here 2')
+        json_facade.write_set_breakpoints(break2_line)
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped(line=break2_line)
+
+        json_facade.write_step_next(json_hit.thread_id)
+        json_hit = json_facade.wait_for_thread_stopped('step', line=break2_line + 1)
+
+        json_facade.write_step_in(json_hit.thread_id)
+        json_hit = json_facade.wait_for_thread_stopped(
+            'step', line=writer.get_line_index_with_content("print('step into')"))
+
+        json_facade.write_step_out(json_hit.thread_id)
+        json_hit = json_facade.wait_for_thread_stopped('step', line=break2_line + 1)
+
+        json_facade.write_step_next(json_hit.thread_id)
+        json_hit = json_facade.wait_for_thread_stopped('step', line=break2_line + 2)
+
+        json_facade.write_continue()
+
+        writer.finished_ok = True
+
+
 def test_case_process_event(case_setup):
     with case_setup.test_file('_debugger_case_change_breaks.py') as writer:
         json_facade = JsonFacade(writer)
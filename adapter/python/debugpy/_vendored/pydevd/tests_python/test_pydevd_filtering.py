@@ -130,6 +130,45 @@ def test_in_project_roots(tmpdir):
         sys.path.remove(str(site_packages))
 
 
+def test_in_project_roots_deepest_root(tmpdir):
+    from _pydevd_bundle.pydevd_filtering import FilesFiltering
+    import os.path
+    files_filtering = FilesFiltering()
+
+    tmpdir = str(tmpdir)
+    lib = os.path.join(tmpdir, 'lib')
+    lib_project = os.path.join(lib, 'project')
+    lib_project_lib = os.path.join(lib_project, 'lib')
+
+    files_filtering.set_project_roots([lib_project, tmpdir])
+    files_filtering.set_library_roots([lib_project_lib, lib])
+
+    check = [
+        (tmpdir, True),
+        (os.path.join(tmpdir, 'a.py'), True),
+        (lib, False),
+        (os.path.join(lib, 'a.py'), False),
+        (os.path.join(lib, 'projectx', 'a.py'), False),
+        (lib_project, True),
+        (os.path.join(lib_project, 'a.py'), True),
+        (os.path.join(lib_project_lib, 'a.py'), False),
+        (os.path.join(lib_project_lib, 'b', 'c', 'a.py'), False),
+        (os.path.dirname(tmpdir), False),
+    ]
+    for check_path, find in check:
+        assert files_filtering.in_project_roots(check_path) == find, \
+            'Expected: %s to be a part of the project: %s' % (check_path, find)
+
+    # Changing the roots updates what's found.
+    files_filtering.set_library_roots([])
+    assert files_filtering.in_project_roots(os.path.join(lib_project_lib, 'a.py'))
+    assert files_filtering.in_project_roots(os.path.join(lib, 'a.py'))
+
+    # The same root in both is considered a library.
+    files_filtering.set_library_roots([tmpdir])
+    assert not files_filtering.in_project_roots(os.path.join(tmpdir, 'a.py'))
+
+
 def test_filtering(tmpdir):
     from _pydevd_bundle.pydevd_filtering import FilesFiltering
     from _pydevd_bundle.pydevd_filtering import ExcludeFilter
@@ -150,6 +189,26 @@ def test_filtering(tmpdir):
     assert files_filtering.exclude_by_filter('/foo/bar', None) is False
 
 
+def test_filtering_order():
+    from _pydevd_bundle.pydevd_filtering import FilesFiltering
+    from _pydevd_bundle.pydevd_filtering import ExcludeFilter
+    files_filtering = FilesFiltering()
+
+    # The first filter that matches (in the given order) is the one used.
+    files_filtering.set_exclude_filters([
+        ExcludeFilter('/foo/bar/**', False, True),
+        ExcludeFilter('mod.sub', False, False),
+        ExcludeFilter('/foo/**', True, True),
+        ExcludeFilter('mod', True, False),
+    ])
+    assert files_filtering.exclude_by_filter('/foo/bar/a.py', 'mod') is False
+    assert files_filtering.exclude_by_filter('/foo/a.py', 'mod.sub') is False
+    assert files_filtering.exclude_by_filter('/foo/a.py', 'mod.sub.a') is False
+    assert files_filtering.exclude_by_filter('/foo/a.py', 'mod') is True
+    assert files_filtering.exclude_by_filter('/other/a.py', 'mod.other') is True
+    assert files_filtering.exclude_by_filter('/other/a.py', 'module') is None
+
+
 def test_glob_matching():
     from _pydevd_bundle.pydevd_filtering import glob_matches_path
 
@@ -206,6 +265,10 @@ def test_glob_matching():
             assert glob_matches_path(build('/a/b/c/d'), r'**\d', sep, altsep)
             assert glob_matches_path(build('/a/b/c/d'), r'c:\**\d', sep, altsep)
 
+        # Many `**` don't make it exponential.
+        assert not glob_matches_path(build('/a' * 30), '/'.join(['**'] * 30) + '/b', sep, altsep)
+        assert glob_matches_path(build('/a' * 30 + '/b'), '/'.join(['**'] * 30) + '/b', sep, altsep)
+
         # Corner cases
         assert not glob_matches_path(build('/'), r'', sep, altsep)
         assert glob_matches_path(build(''), r'', sep, altsep)
@@ -214,6 +277,130 @@ def test_glob_matching():
         assert glob_matches_path(build('/'), r'*', sep, altsep)
 
 
+def _reference_check_matches(patterns, paths):
+    # The recursive matching pydevd used before globs were compiled (kept as a reference).
+    import fnmatch
+    import glob
+    from pydevd_file_utils import normcase
+
+    if not patterns and not paths:
+        return True
+
+    if (not patterns and paths) or (patterns and not paths):
+        return False
+
+    pattern = normcase(patterns[0])
+    path = normcase(paths[0])
+
+    if not glob.has_magic(pattern):
+        if pattern != path:
+            return False
+
+    elif pattern == '**':
+        if len(patterns) == 1:
+            return True
+
+        for i in range(len(paths)):
+            if _reference_check_matches(patterns[1:], paths[i:]):
+                return True
+
+    elif not fnmatch.fnmatch(path, pattern):
+        return False
+
+    return _reference_check_matches(patterns[1:], paths[1:])
+
+
+def _reference_glob_matches_path(path, pattern, sep, altsep):
+    if altsep:
+        pattern = pattern.replace(altsep, sep)
+        path = path.replace(altsep, sep)
+
+    drive = ''
+    if len(path) > 1 and path[1] == ':':
+        drive, path = path[0], path[2:]
+
+    if drive and len(pattern) > 1:
+        if pattern[1] == ':':
+            if drive.lower() != pattern[0].lower():
+                return False
+            pattern = pattern[2:]
+
+    patterns = pattern.split(sep)
+    paths = path.split(sep)
+    if paths:
+        if paths[0] == '':
+            paths = paths[1:]
+    if patterns:
+        if patterns[0] == '':
+            patterns = patterns[1:]
+
+    return _reference_check_matches(patterns, paths)
+
+
+def _random_glob(rnd):
+    segments = [rnd.choice(['a', 'b', 'c', '*', '?', 'a*', '*.py', '**', '**', 'b.py', '[ab]'])
+                for _i in range(rnd.randint(0, 5))]
+    return rnd.choice(['/', '', '**/']) + '/'.join(segments)
+
+
+def _random_path(rnd):
+    segments = [rnd.choice(['a', 'b', 'c', 'ab', 'a.py', 'b.py', 'x'])
+                for _i in range(rnd.randint(0, 6))]
+    return '/' + '/'.join(segments)
+
+
+def test_glob_matching_same_as_reference():
+    from random import Random
+    from _pydevd_bundle.pydevd_filtering import glob_matches_path
+
+    rnd = Random(0)
+    for _i in range(3000):
+        pattern = _random_glob(rnd)
+        path = _random_path(rnd)
+        windows_pattern = rnd.choice(['', 'c:']) + pattern
+        windows_path = rnd.choice(['', 'c:', 'd:']) + path.replace('/', '\\')
+        for path, pattern, sep, altsep in (
+                (path, pattern, '/', None),
+                (windows_path, windows_pattern, '\\', '/'),
+            ):
+            assert glob_matches_path(path, pattern, sep, altsep) == \
+                _reference_glob_matches_path(path, pattern, sep, altsep), (path, pattern, sep)
+
+
+def test_exclude_by_filter_same_as_reference():
+    from random import Random
+    import os
+    from _pydevd_bundle.pydevd_filtering import FilesFiltering
+    from _pydevd_bundle.pydevd_filtering import ExcludeFilter
+
+    def reference_exclude_by_filter(exclude_filters, path, module_name):
+        for exclude_filter in exclude_filters:
+            if exclude_filter.is_path:
+                if _reference_glob_matches_path(path, exclude_filter.name, os.sep, os.altsep):
+                    return exclude_filter.exclude
+            elif exclude_filter.name == module_name or module_name.startswith(exclude_filter.name + '.'):
+                return exclude_filter.exclude
+        return None
+
+    rnd = Random(0)
+    files_filtering = FilesFiltering()
+    for _i in range(300):
+        exclude_filters = []
+        for _j in range(rnd.randint(1, 8)):
+            if rnd.random() < 0.7:
+                exclude_filters.append(ExcludeFilter(_random_glob(rnd), rnd.random() < 0.5, True))
+            else:
+                module = '.'.join(rnd.choice(['a', 'b', 'ab']) for _k in range(rnd.randint(1, 3)))
+                exclude_filters.append(ExcludeFilter(module, rnd.random() < 0.5, False))
+        files_filtering.set_exclude_filters(exclude_filters)
+
+        for _j in range(20):
+            path = _random_path(rnd)
+            module_name = '.'.join(rnd.choice(['a', 'b', 'ab']) for _k in range(rnd.randint(1, 3)))
+            assert files_filtering.exclude_by_filter(path, module_name) == \
+                reference_exclude_by_filter(exclude_filters, path, module_name), (path, module_name, exclude_filters)
+
+
 def test_rules_to_exclude_filter(tmpdir):
     from _pydevd_bundle.pydevd_process_net_command_json import _convert_rules_to_exclude_filters
     from _pydevd_bundle.pydevd_filtering import ExcludeFilter
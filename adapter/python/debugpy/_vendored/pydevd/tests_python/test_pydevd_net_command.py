@@ -0,0 +1,183 @@
+import json
+
+import pytest
+
+from _pydevd_bundle import pydevd_constants
+from _pydevd_bundle.pydevd_comm_constants import CMD_RETURN
+from _pydevd_bundle.pydevd_constants import HTTP_JSON_PROTOCOL, JSON_WIRE_ENCODING, \
+    MARSHAL_WIRE_ENCODING
+
+
+class _SocketStub(object):
+
+    def __init__(self):
+        self.sent = b''
+
+    def sendall(self, data):
+        self.sent += data
+
+
+@pytest.fixture
+def wire_encoding():
+    protocol = pydevd_constants.get_protocol()
+    pydevd_constants.set_protocol(HTTP_JSON_PROTOCOL)
+    try:
+        yield pydevd_constants.set_wire_encoding
+    finally:
+        pydevd_constants.set_wire_encoding(JSON_WIRE_ENCODING)
+        pydevd_constants.set_protocol(protocol)
+
+
+def _send(as_dict):
+    from _pydevd_bundle.pydevd_net_command import NetCommand
+    sock = _SocketStub()
+    NetCommand(CMD_RETURN, 0, as_dict, is_json=True).send(sock)
+    headers, body = sock.sent.split(b'\r\n\r\n', 1)
+    headers = headers.split(b'\r\n')
+    assert headers[0] == ('Content-Length: %s' % (len(body),)).encode('ascii')
+    return headers[1:], body
+
+
+def test_json_wire_encoding(wire_encoding):
+    wire_encoding(JSON_WIRE_ENCODING)
+    headers, body = _send({'type': 'event', 'event': 'foo'})
+    assert headers == []
+    assert json.loads(body.decode('utf-8'))['event'] == 'foo'
+
+
+@pytest.mark.skipif(MARSHAL_WIRE_ENCODING not in pydevd_constants.get_supported_wire_encodings(),
+                    reason='marshal is only used on CPython 3.')
+def test_marshal_wire_encoding(wire_encoding):
+    import marshal
+    wire_encoding(MARSHAL_WIRE_ENCODING)
+
+    headers, body = _send({'type': 'event', 'event': 'foo', 'body': {'items': [1, 'a', None]}})
+    assert headers == [b'Content-Type: marshal']
+    as_dict = marshal.loads(body)
+    assert 'pydevd_cmd_id' not in as_dict
+    assert as_dict['body'] == {'items': [1, 'a', None]}
+
+    # Messages which can't be marshalled are still sent as json.
+    class Unmarshallable(dict):
+        pass
+
+    headers, body = _send({'type': 'event', 'event': 'foo', 'body': Unmarshallable(a=1)})
+    assert headers == []
+    assert json.loads(body.decode('utf-8'))['body'] == {'a': 1}
+
+
+class _PyDbStub(object):
+
+    def __init__(self):
+        self.created_pydb_daemon_threads = {}
+        self.dap_messages_listeners = []
+        self.cmd_factory = self
+
+    def make_exit_command(self, py_db):
+        from _pydevd_bundle.pydevd_comm_constants import CMD_EXIT
+        from _pydevd_bundle.pydevd_net_command import NetCommand
+        return NetCommand(CMD_EXIT, 0, {'type': 'event', 'event': 'terminated'}, is_json=True)
+
+
+class _RecordingSocket(_SocketStub):
+
+    def __init__(self):
+        _SocketStub.__init__(self)
+        self.calls = 0
+
+    def sendall(self, data):
+        self.calls += 1
+        _SocketStub.sendall(self, data)
+
+
+def test_writer_thread_batches(wire_encoding):
+    from _pydevd_bundle.pydevd_comm import WriterThread
+    from _pydevd_bundle.pydevd_net_command import NetCommand
+
+    sock = _RecordingSocket()
+    writer = WriterThread(sock, _PyDbStub())
+    for i in range(10):
+        writer.add_command(NetCommand(CMD_RETURN, 0, {'type': 'event', 'event': 'e%s' % i}, is_json=True))
+    writer.do_kill_pydev_thread()
+
+    # Everything queued when the writer runs goes in a single sendall.
+    writer.start()
+    writer.join(5)
+    assert not writer.is_alive()
+
+    assert sock.calls == 1
+    assert sock.sent.count(b'Content-Length:') == 11
+    stats = writer.get_stats()
+    assert stats['commandsSent'] == 11
+    assert stats['batchesSent'] == 1
+    assert stats['maxQueueDepth'] == 11
+    assert stats['queueDepth'] == 0
+    assert stats['maxSendLatency'] >= stats['averageSendLatency'] >= 0
+
+
+def test_writer_thread_wakes_up_when_killed(wire_encoding):
+    import time
+    from _pydevd_bundle.pydevd_comm import WriterThread
+
+    sock = _RecordingSocket()
+    writer = WriterThread(sock, _PyDbStub())
+    writer.start()
+    time.sleep(.2)
+    assert sock.calls == 0
+
+    writer.do_kill_pydev_thread()
+    writer.join(5)
+    assert not writer.is_alive()
+    assert b'"terminated"' in sock.sent
+
+
+class _SendmsgSocket(object):
+    ''' Socket which supports scatter-gather writes, but only accepts a few bytes at a time. '''
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.sent = b''
+        self.calls = 0
+
+    def sendmsg(self, buffers):
+        self.calls += 1
+        data = b''.join(bytes(b) for b in buffers)[:self.max_bytes]
+        self.sent += data
+        return len(data)
+
+
+def test_send_single_write(wire_encoding):
+    from _pydevd_bundle.pydevd_net_command import NetCommand
+    cmd = NetCommand(CMD_RETURN, 0, {'type': 'event', 'event': 'foo'}, is_json=True)
+
+    sock = _RecordingSocket()
+    cmd.send(sock)
+    assert sock.calls == 1
+    assert sock.sent.startswith(b'Content-Length: ')
+
+    sock = _SendmsgSocket(1 << 20)
+    cmd.send(sock)
+    assert sock.calls == 1
+
+    # Partial sends are retried until everything is written.
+    partial_sock = _SendmsgSocket(7)
+    cmd.send(partial_sock)
+    assert partial_sock.sent == sock.sent
+    assert partial_sock.calls == (len(sock.sent) + 6) // 7
+
+
+def test_writer_thread_sendmsg(wire_encoding):
+    from _pydevd_bundle.pydevd_comm import WriterThread
+    from _pydevd_bundle.pydevd_net_command import NetCommand
+
+    sock = _SendmsgSocket(1 << 20)
+    writer = WriterThread(sock, _PyDbStub())
+    for i in range(10):
+        writer.add_command(NetCommand(CMD_RETURN, 0, {'type': 'event', 'event': 'e%s' % i}, is_json=True))
+    writer.do_kill_pydev_thread()
+    writer.start()
+    writer.join(5)
+    assert not writer.is_alive()
+
+    assert sock.calls == 1
+    assert sock.sent.count(b'Content-Length:') == 11
@@ -140,3 +140,77 @@ def test_get_child_variables():
             if not found_len:
                 raise AssertionError('Expected to find variable named: len()')
 
+
+
+def get_list_large_frame():
+    obj = list(range(_NUMBER_OF_ITEMS_TO_CREATE))
+    return sys._getframe()
+
+
+class _ListCountingDir(list):
+
+    dir_calls = 0
+
+    def __dir__(self):
+        _ListCountingDir.dir_calls += 1
+        return list.__dir__(self)
+
+
+def get_list_counting_dir_frame():
+    obj = _ListCountingDir(range(_NUMBER_OF_ITEMS_TO_CREATE))
+    return sys._getframe()
+
+
+def test_get_child_variables_paged():
+    from _pydevd_bundle.pydevd_suspended_frames import SuspendedFramesManager
+    suspended_frames_manager = SuspendedFramesManager()
+    py_db = _DummyPyDB()
+    for frame, expected_names in (
+        (get_dict_large_frame(), ['310', '311', '312']),
+        (get_set_large_frame(), None),
+        (get_tuple_large_frame(), ['310', '311', '312']),
+        (get_list_large_frame(), ['310', '311', '312']),
+        ):
+        with suspended_frames_manager.track_frames(py_db) as tracker:
+            # : :type tracker: _FramesTracker
+            tracker.track('thread1', pydevd_frame_utils.create_frames_list_from_frame(frame))
+            variable = suspended_frames_manager.get_variable(id(frame))
+            obj_var = variable.get_child_variable_named('obj')
+
+            var_data = obj_var.get_var_data()
+            assert var_data['indexedVariables'] == _NUMBER_OF_ITEMS_TO_CREATE
+            assert 'namedVariables' not in var_data
+
+            named = obj_var.get_children_variables(filter='named')
+            assert GENERATED_LEN_ATTR_NAME in [x.name for x in named]
+
+            page = obj_var.get_children_variables(filter='indexed', start=310, count=3)
+            assert len(page) == 3
+            if expected_names is not None:
+                assert [x.name for x in page] == expected_names
+                assert page[0].evaluate_name == 'obj[310]'
+
+            # count == 0 means everything after start.
+            page = obj_var.get_children_variables(filter='indexed', start=10)
+            assert len(page) == _NUMBER_OF_ITEMS_TO_CREATE - 10
+            assert TOO_LARGE_ATTR not in [x.name for x in page]
+
+    # Small containers are still sent all at once.
+    frame = get_frame()
+    with suspended_frames_manager.track_frames(py_db) as tracker:
+        tracker.track('thread1', pydevd_frame_utils.create_frames_list_from_frame(frame))
+        variable = suspended_frames_manager.get_variable(id(frame))
+        assert 'indexedVariables' not in variable.get_child_variable_named('var2').get_var_data()
+
+    # The attributes of a big container are only listed when the client asks for them.
+    frame = get_list_counting_dir_frame()
+    with suspended_frames_manager.track_frames(py_db) as tracker:
+        tracker.track('thread1', pydevd_frame_utils.create_frames_list_from_frame(frame))
+        obj_var = suspended_frames_manager.get_variable(id(frame)).get_child_variable_named('obj')
+        _ListCountingDir.dir_calls = 0
+        assert obj_var.get_var_data()['indexedVariables'] == _NUMBER_OF_ITEMS_TO_CREATE
+        assert len(obj_var.get_children_variables(filter='indexed', start=0, count=10)) == 10
+        assert _ListCountingDir.dir_calls == 0
+
+        obj_var.get_children_variables(filter='named')
+        assert _ListCountingDir.dir_calls > 0
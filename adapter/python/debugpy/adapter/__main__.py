@@ -67,8 +67,14 @@ def main(args):
         endpoints["client"] = {"host": client_host, "port": client_port}
 
     if args.for_server is not None:
+        # The debug server spawning us is on the same host. If clients connect to
+        # a Unix domain socket, have it connect to one next to it too.
+        server_host = "127.0.0.1"
+        client_socket_path = sockets.unix_socket_path(args.host)
+        if client_socket_path is not None:
+            server_host = sockets.UNIX_HOST_PREFIX + client_socket_path + ".server"
         try:
-            server_host, server_port = servers.serve()
+            server_host, server_port = servers.serve(server_host)
         except Exception as exc:
             endpoints = {"error": "Can't listen for server connections: " + str(exc)}
         else:
@@ -130,6 +130,17 @@ class Client(components.Component):
     # Generic request handler, used if there's no specific handler below.
     @message_handler
     def request(self, request):
+        channel = self.channel
+        if channel.handler_pool_size and request.command in channel.CONCURRENT_REQUESTS:
+            # The handlers for these requests run concurrently, so don't keep the session
+            # locked while waiting for the server to respond - otherwise, they would still
+            # end up waiting for each other.
+            propagated_request = self.server.channel.propagate(request)
+            self.session.lock.release()
+            try:
+                return propagated_request.wait_for_response()
+            finally:
+                self.session.lock.acquire()
         return self.server.channel.delegate(request)
 
     @message_handler
@@ -643,7 +654,7 @@ class Client(components.Component):
             body["connect"]["host"] = host if host is not None else "127.0.0.1"
         if "port" not in body["connect"]:
             if port is None:
-                _, port = listener.getsockname()
+                _, port = sockets.get_address(listener)
             body["connect"]["port"] = port
 
         self.channel.send_event("debugpyAttach", body)
@@ -652,11 +663,11 @@ class Client(components.Component):
 def serve(host, port):
     global listener
     listener = sockets.serve("Client", Client, host, port)
-    return listener.getsockname()
+    return sockets.get_address(listener)
 
 
 def stop_serving():
     try:
-        listener.close()
+        sockets.close_server(listener)
     except Exception:
         log.swallow_exception(level="warning")
@@ -52,11 +52,24 @@ class Connection(object):
 
         stream = messaging.JsonIOStream.from_socket(sock, str(self))
         self.channel = messaging.JsonMessageChannel(stream, self)
+        # Responses from the server are mostly passed along to the client as is, and
+        # can be huge - e.g. "variables" - so don't convert all of their dicts upfront.
+        self.channel.lazy_message_dicts = True
         self.channel.start()
 
         try:
             self.authenticate()
-            info = self.channel.request("pydevdSystemInfo")
+            # Ask the server to send messages in a more compact and faster to parse
+            # encoding than JSON, if it can - it says which one it uses in the response.
+            info = self.channel.request(
+                "pydevdSystemInfo",
+                {"wireEncodings": list(stream.READABLE_ENCODINGS)},
+            )
+            log.info(
+                "{0} sends messages as {1}",
+                self,
+                info("pydevd", json.object())("wireEncoding", "json"),
+            )
             process_info = info("process", json.object())
             self.pid = process_info("pid", int)
             self.ppid = process_info("ppid", int, optional=True)
@@ -371,12 +384,12 @@ class Server(components.Component):
 def serve(host="127.0.0.1", port=0):
     global listener
     listener = sockets.serve("Server", Connection, host, port)
-    return listener.getsockname()
+    return sockets.get_address(listener)
 
 
 def stop_serving():
     try:
-        listener.close()
+        sockets.close_server(listener)
     except Exception:
         log.swallow_exception(level="warning")
 
@@ -443,7 +456,7 @@ def dont_wait_for_first_connection():
 
 
 def inject(pid, debugpy_args):
-    host, port = listener.getsockname()
+    host, port = sockets.get_address(listener)
 
     cmdline = [
         sys.executable,
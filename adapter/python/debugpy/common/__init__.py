@@ -14,3 +14,13 @@ PROCESS_SPAWN_TIMEOUT = float(os.getenv("DEBUGPY_PROCESS_SPAWN_TIMEOUT", 15))
 
 # The lower time bound for assuming that the process hasn't exited gracefully.
 PROCESS_EXIT_TIMEOUT = float(os.getenv("DEBUGPY_PROCESS_EXIT_TIMEOUT", 5))
+
+# The number of threads that run the handlers of incoming requests which can be handled
+# concurrently (see JsonMessageChannel.handler_pool_size). If 0, all handlers for a
+# channel run one after another on a single thread.
+HANDLER_POOL_SIZE = int(os.getenv("DEBUGPY_HANDLER_POOL_SIZE", 0))
+
+# The maximum number of seconds that a message can be held back, so that messages sent
+# shortly after it are written along with it (see JsonIOStream.write_coalescing_window).
+# If 0, every message is written as soon as it is sent.
+WRITE_COALESCING_WINDOW = float(os.getenv("DEBUGPY_WRITE_COALESCING_WINDOW", 0))
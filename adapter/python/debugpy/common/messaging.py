@@ -11,15 +11,21 @@ responses, and events.
 https://microsoft.github.io/debug-adapter-protocol/overview#base-protocol
 """
 
+import codecs
 import collections
 import contextlib
 import functools
+import io
+import marshal
+import platform
 import itertools
 import os
 import socket
 import sys
 import threading
+import time
 
+from debugpy import common
 from debugpy.common import compat, fmt, json, log
 from debugpy.common.compat import unicode
 
@@ -66,6 +72,39 @@ class JsonIOStream(object):
 
     MAX_BODY_SIZE = 0xFFFFFF
 
+    BUFFER_SIZE = 0x10000
+    """Initial size of the buffer that read_json() reads into. It grows as needed
+    to fit the largest message read so far.
+    """
+
+    write_coalescing_window = common.WRITE_COALESCING_WINDOW
+    """If not 0, write_json() doesn't write messages right away. Instead, messages are
+    written in batches by a background thread, each batch holding every message sent
+    while the first message in it waited for at most that many seconds - or less, if
+    the batch reaches MAX_COALESCED_BYTES earlier. Bursts of events then take a single
+    write - a single sendmsg() for sockets - rather than one per message.
+
+    Errors writing a batch are reported by the next call to write_json(). Messages
+    still waiting to be written are flushed by close().
+    """
+
+    MAX_COALESCED_BYTES = 0x100000
+
+    log_raw_messages = False
+    """Whether read_json() logs the raw data of a message that it couldn't read or
+    parse, in addition to the exception. Off by default, since on readers without
+    readinto(), it means keeping a copy of every message while it is being read.
+    """
+
+    if sys.version_info >= (3,) and platform.python_implementation() == "CPython":
+        READABLE_ENCODINGS = ("marshal",)
+    else:
+        READABLE_ENCODINGS = ()
+    """Encodings besides JSON that read_json() can decode, as named by the Content-Type
+    header of a message. "marshal" is a dict dumped by marshal (format version 4),
+    which pydevd can be asked to use instead of JSON - see pydevdSystemInfo.
+    """
+
     json_decoder_factory = json.JsonDecoder
     """Used by read_json() when decoder is None."""
 
@@ -122,7 +161,10 @@ class JsonIOStream(object):
                 pass
             sock.close()
 
-        return cls(socket_io, socket_io, name, cleanup)
+        stream = cls(socket_io, socket_io, name, cleanup)
+        # Used to write batches of coalesced messages without joining them first.
+        stream._sendmsg = getattr(sock, "sendmsg", None)
+        return stream
 
     def __init__(self, reader, writer, name=None, cleanup=lambda: None):
         """Creates a new JsonIOStream.
@@ -149,6 +191,39 @@ class JsonIOStream(object):
         self._cleanup = cleanup
         self._closed = False
 
+        # Incoming data is read into a single buffer that is reused for every message,
+        # and messages are decoded straight from it. Bytes between _buffer_start and
+        # _buffer_end have been read, but not consumed by read_json() yet.
+        self._buffer = None
+        self._buffer_start = 0
+        self._buffer_end = 0
+
+        # readinto() of buffered readers only returns once the buffer is full, while
+        # readinto1() returns whatever is available, as readinto() of raw readers does.
+        self._readinto = getattr(reader, "readinto1", None)
+        if self._readinto is None and isinstance(reader, io.RawIOBase):
+            self._readinto = reader.readinto
+
+        # See write_coalescing_window. Buffers waiting to be written are in _pending,
+        # and _flush_lock is held while a batch is being written, to keep them in order.
+        self._sendmsg = None
+        self._pending = []
+        self._pending_bytes = 0
+        self._pending_since = None
+        self._pending_changed = threading.Condition(threading.Lock())
+        self._flush_lock = threading.Lock()
+        self._flusher = None
+        self._write_error = None
+
+        self.flushes = 0
+        """Number of batches of coalesced messages written so far."""
+
+        self.coalesced_messages = 0
+        """Number of messages written in those batches."""
+
+        self.coalesced_bytes = 0
+        """Number of bytes written in those batches."""
+
     def close(self):
         """Closes the stream, the reader, and the writer.
         """
@@ -157,7 +232,22 @@ class JsonIOStream(object):
             return
         self._closed = True
 
+        try:
+            self.flush()
+        except Exception:
+            log.swallow_exception("Error while flushing {0} message stream", self.name)
+        with self._pending_changed:
+            self._pending_changed.notify_all()
+
         log.debug("Closing {0} message stream", self.name)
+        if self.flushes:
+            log.debug(
+                "{0} message stream wrote {1} messages ({2} bytes) in {3} batches",
+                self.name,
+                self.coalesced_messages,
+                self.coalesced_bytes,
+                self.flushes,
+            )
         try:
             try:
                 # Close the writer first, so that the other end of the connection has
@@ -187,18 +277,47 @@ class JsonIOStream(object):
         )
         return logger(format_string, self.name, dir, data)
 
-    def _read_line(self, reader):
-        line = b""
-        while True:
+    def _fill_buffer(self, size):
+        """Reads from reader until the buffer holds at least size unconsumed bytes.
+        """
+
+        buffer = self._buffer
+        if buffer is None:
+            buffer = self._buffer = bytearray(max(self.BUFFER_SIZE, size))
+        elif self._buffer_start + size > len(buffer):
+            # Move the unconsumed bytes to the front to make room, growing the buffer
+            # if they still wouldn't fit.
+            pending = self._buffer_end - self._buffer_start
+            if size > len(buffer):
+                buffer = bytearray(max(size, len(buffer) * 2))
+            buffer[:pending] = self._buffer[self._buffer_start : self._buffer_end]
+            self._buffer = buffer
+            self._buffer_start = 0
+            self._buffer_end = pending
+
+        while self._buffer_end - self._buffer_start < size:
+            if self._readinto is not None:
+                view = memoryview(buffer)[self._buffer_end :]
+            else:
+                # Without readinto(), read() blocks until it gets as many bytes as
+                # requested, so don't ask for more than what's needed.
+                view = memoryview(buffer)[self._buffer_end : self._buffer_start + size]
             try:
-                line += reader.readline()
+                count = self._readinto_view(view)
             except Exception as exc:
                 raise NoMoreMessages(str(exc), stream=self)
-            if not line:
+            finally:
+                del view  # so that the buffer can be resized later
+            if not count:
                 raise NoMoreMessages(stream=self)
-            if line.endswith(b"\r\n"):
-                line = line[0:-2]
-                return line
+            self._buffer_end += count
+
+    def _readinto_view(self, view):
+        if self._readinto is not None:
+            return self._readinto(view)
+        data = self._reader.read(len(view))
+        view[: len(data)] = data
+        return len(data)
 
     def read_json(self, decoder=None):
         """Read a single JSON value from reader.
@@ -208,49 +327,54 @@ class JsonIOStream(object):
         """
 
         decoder = decoder if decoder is not None else self.json_decoder_factory()
-        reader = self._reader
-        read_line = functools.partial(self._read_line, reader)
 
         # If any error occurs while reading and parsing the message, log the original
-        # raw message data as is, so that it's possible to diagnose missing or invalid
-        # headers, encoding issues, JSON syntax errors etc.
+        # raw message data as is if enabled, so that it's possible to diagnose missing
+        # or invalid headers, encoding issues, JSON syntax errors etc. That data is
+        # still in the buffer, between raw[0] and raw[1].
         def log_message_and_reraise_exception(format_string="", *args, **kwargs):
-            if format_string:
-                format_string += "\n\n"
-            format_string += "{name} -->\n{raw_lines}"
-
-            raw_lines = b"".join(raw_chunks).split(b"\n")
-            raw_lines = "\n".join(repr(line) for line in raw_lines)
+            if self.log_raw_messages:
+                if format_string:
+                    format_string += "\n\n"
+                format_string += "{name} -->\n{raw_lines}"
 
-            log.reraise_exception(
-                format_string, *args, name=self.name, raw_lines=raw_lines, **kwargs
-            )
+                raw_lines = bytes(self._buffer[raw[0] : raw[1]]).split(b"\n")
+                raw_lines = "\n".join(repr(line) for line in raw_lines)
+                kwargs.update(name=self.name, raw_lines=raw_lines)
 
-        raw_chunks = []
-        headers = {}
+            log.reraise_exception(format_string, *args, **kwargs)
 
+        # Read until the blank line terminating the headers.
+        scanned = 0
         while True:
+            raw = [self._buffer_start, self._buffer_end]
+            if self._buffer is not None:
+                headers_end = self._buffer.find(b"\r\n\r\n", raw[0] + scanned, raw[1])
+                if headers_end >= 0:
+                    break
+            scanned = max(raw[1] - raw[0] - 3, 0)
+
             try:
-                line = read_line()
+                self._fill_buffer(raw[1] - raw[0] + 1)
             except Exception:
-                # Only log it if we have already read some headers, and are looking
-                # for a blank line terminating them. If this is the very first read,
-                # there's no message data to log in any case, and the caller might
-                # be anticipating the error - e.g. NoMoreMessages on disconnect.
-                if headers:
+                # Only log it if we have already read some headers. If this is the
+                # very first read, there's no message data to log in any case, and
+                # the caller might be anticipating the error - e.g. NoMoreMessages
+                # on disconnect.
+                if raw[1] > raw[0]:
+                    raw = [self._buffer_start, self._buffer_end]
                     log_message_and_reraise_exception(
                         "Error while reading message headers:"
                     )
                 else:
                     raise
 
-            raw_chunks += [line, b"\n"]
-            if line == b"":
-                break
-
+        headers = {}
+        for line in bytes(self._buffer[raw[0] : headers_end]).split(b"\r\n"):
             key, _, value = line.partition(b":")
             headers[key] = value
 
+        raw[1] = headers_end + 4
         try:
             length = int(headers[b"Content-Length"])
             if not (0 <= length <= self.MAX_BODY_SIZE):
@@ -261,29 +385,40 @@ class JsonIOStream(object):
             except Exception:
                 log_message_and_reraise_exception()
 
-        body_start = len(raw_chunks)
-        body_remaining = length
-        while body_remaining > 0:
-            try:
-                chunk = reader.read(body_remaining)
-                if not chunk:
-                    raise EOFError
-            except Exception as exc:
-                # Not logged due to https://github.com/microsoft/ptvsd/issues/1699
-                raise NoMoreMessages(str(exc), stream=self)
+        # Not logged due to https://github.com/microsoft/ptvsd/issues/1699
+        body_offset = raw[1] - raw[0]
+        self._fill_buffer(body_offset + length)
 
-            raw_chunks.append(chunk)
-            body_remaining -= len(chunk)
-        assert body_remaining == 0
+        # The whole message is in the buffer now. Consume it before parsing, so that
+        # a message that fails to parse doesn't get in the way of the next one - its
+        # data stays in place until the next read.
+        raw = [self._buffer_start, self._buffer_start + body_offset + length]
+        if raw[1] == self._buffer_end:
+            self._buffer_start = self._buffer_end = 0
+        else:
+            self._buffer_start = raw[1]
 
-        body = b"".join(raw_chunks[body_start:])
+        marshalled = headers.get(b"Content-Type", b"").strip() == b"marshal"
+        view = memoryview(self._buffer)[raw[0] + body_offset : raw[1]]
         try:
-            body = body.decode("utf-8")
+            if marshalled:
+                if "marshal" not in self.READABLE_ENCODINGS:
+                    raise IOError("Content-Type: marshal is not supported:")
+                body = marshal.loads(view)
+            else:
+                body = codecs.utf_8_decode(view, "strict", True)[0]
         except Exception:
             log_message_and_reraise_exception()
+        finally:
+            del view
 
         try:
-            body = decoder.decode(body)
+            if marshalled:
+                object_hook = getattr(decoder, "object_hook", None)
+                if object_hook is not None:
+                    body = _apply_object_hook(body, object_hook)
+            else:
+                body = decoder.decode(body)
         except Exception:
             log_message_and_reraise_exception()
 
@@ -319,28 +454,143 @@ class JsonIOStream(object):
         header = fmt("Content-Length: {0}\r\n\r\n", len(body))
         header = header.encode("ascii")
 
-        data = header + body
-        data_written = 0
+        if self.write_coalescing_window:
+            self._enqueue_write(header, body)
+            self._log_message("<--", value)
+            return
+
         try:
-            while data_written < len(data):
-                written = writer.write(data[data_written:])
-                # On Python 2, socket.makefile().write() does not properly implement
-                # BytesIO.write(), and always returns None instead of the number of
-                # bytes written - but also guarantees that it is always a full write.
-                if written is None:
-                    break
-                data_written += written
-            writer.flush()
+            self._write_data(header + body)
         except Exception as exc:
             self._log_message("<--", value, logger=log.exception)
             raise JsonIOError(stream=self, cause=exc)
 
         self._log_message("<--", value)
 
+    def _write_data(self, data):
+        writer = self._writer
+        data_written = 0
+        while data_written < len(data):
+            written = writer.write(data[data_written:])
+            # On Python 2, socket.makefile().write() does not properly implement
+            # BytesIO.write(), and always returns None instead of the number of
+            # bytes written - but also guarantees that it is always a full write.
+            if written is None:
+                break
+            data_written += written
+        writer.flush()
+
+    def _enqueue_write(self, header, body):
+        with self._pending_changed:
+            if self._write_error is not None:
+                raise JsonIOError(stream=self, cause=self._write_error)
+
+            was_empty = not self._pending
+            if was_empty:
+                self._pending_since = time.time()
+            self._pending += [header, body]
+            self._pending_bytes += len(header) + len(body)
+
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically,
+                    name=fmt("{0} message writer", self.name),
+                )
+                self._flusher.pydev_do_not_trace = True
+                self._flusher.is_pydev_daemon_thread = True
+                self._flusher.daemon = True
+                self._flusher.start()
+            elif was_empty or self._pending_bytes >= self.MAX_COALESCED_BYTES:
+                # Wake up the flusher to start the window of this batch, or to write
+                # it right away if it's big enough already.
+                self._pending_changed.notify()
+
+    def _flush_periodically(self):
+        while True:
+            with self._pending_changed:
+                while not self._pending and not self._closed:
+                    self._pending_changed.wait()
+                if not self._pending:
+                    return
+
+                # Wait for more messages, until the first one waited long enough.
+                deadline = self._pending_since + self.write_coalescing_window
+                while (
+                    self._pending_bytes < self.MAX_COALESCED_BYTES
+                    and not self._closed
+                ):
+                    timeout = deadline - time.time()
+                    if timeout <= 0:
+                        break
+                    self._pending_changed.wait(timeout)
+
+            try:
+                self.flush()
+            except Exception as exc:
+                with self._pending_changed:
+                    self._write_error = exc
+                    del self._pending[:]
+                    self._pending_bytes = 0
+                log.swallow_exception("Error while writing to {0}", self.name)
+                return
+
+    def flush(self):
+        """Writes the messages that write_json() held back, if any.
+        """
+
+        with self._flush_lock:
+            with self._pending_changed:
+                buffers = self._pending
+                if not buffers:
+                    return
+                self._pending = []
+                size = self._pending_bytes
+                self._pending_bytes = 0
+
+            if self._sendmsg is not None:
+                self._send_buffers(buffers)
+            else:
+                self._write_data(b"".join(buffers))
+
+            self.flushes += 1
+            self.coalesced_messages += len(buffers) // 2
+            self.coalesced_bytes += size
+
+    _IOV_MAX = 1024
+    """Maximum number of buffers passed to a single sendmsg() call."""
+
+    def _send_buffers(self, buffers):
+        buffers = [memoryview(buf) for buf in buffers]
+        first = 0
+        while first < len(buffers):
+            sent = self._sendmsg(buffers[first : first + self._IOV_MAX])
+            # Skip what was sent, which can end in the middle of a buffer.
+            while first < len(buffers) and sent >= len(buffers[first]):
+                sent -= len(buffers[first])
+                first += 1
+            if sent:
+                buffers[first] = buffers[first][sent:]
+
     def __repr__(self):
         return fmt("{0}({1!r})", type(self).__name__, self.name)
 
 
+def _apply_object_hook(value, object_hook):
+    """Does for a value that wasn't decoded from JSON what a JSON decoder with that
+    object_hook would do: replaces every dict in it, innermost first, with what
+    object_hook returns for it.
+    """
+
+    if isinstance(value, dict):
+        return object_hook(
+            {key: _apply_object_hook(item, object_hook) for key, item in value.items()}
+        )
+    elif isinstance(value, (list, tuple)):
+        return [_apply_object_hook(item, object_hook) for item in value]
+    else:
+        return value
+
+
 class MessageDict(collections.OrderedDict):
     """A specialized dict that is used for JSON message payloads - Request.arguments,
     Response.body, and Event.body.
@@ -351,12 +601,15 @@ class MessageDict(collections.OrderedDict):
     that it is valid according to the protocol specification; if anything is missing,
     it will be reported automatically in the proper manner.
 
-    If the value for the requested key is itself a dict, it is returned as is, and not
-    automatically converted to MessageDict. Thus, to enable convenient chaining - e.g.
-    d["a"]["b"]["c"] - the dict must consistently use MessageDict instances rather than
-    vanilla dicts for all its values, recursively. This is guaranteed for the payload
-    of all freshly received messages (unless and until it is mutated), but there is no
-    such guarantee for outgoing messages.
+    If the value for the requested key is itself a MessageDict, it is returned as is.
+    To enable convenient chaining - e.g. d["a"]["b"]["c"] - vanilla dicts are converted
+    to MessageDict instances associated with the same message when they are retrieved
+    via __getitem__(), get(), pop() or __call__() - either as the value itself, or as
+    items of a list value - and replace the original in this dict. Thus, the payload
+    of freshly received messages behaves as if it were made of MessageDict instances
+    all the way down, even if they are only created as needed (see
+    JsonMessageChannel.lazy_message_dicts). There is no such guarantee for outgoing
+    messages.
     """
 
     def __init__(self, message, items=None):
@@ -421,6 +674,50 @@ class MessageDict(collections.OrderedDict):
             raise message.isnt_valid("{0!j}{1}", key, err)
         return value
 
+    def get(self, key, default=None):
+        value = collections.OrderedDict.get(self, key, default)
+        if type(value) is dict and key in self:
+            value = self._adopt(value)
+            collections.OrderedDict.__setitem__(self, key, value)
+        elif type(value) is list:
+            self._adopt_items(value)
+        return value
+
+    def _getitem(self, key):
+        value = collections.OrderedDict.__getitem__(self, key)
+        if type(value) is dict:
+            value = self._adopt(value)
+            collections.OrderedDict.__setitem__(self, key, value)
+        elif type(value) is list:
+            self._adopt_items(value)
+        return value
+
+    def _pop(self, key, *args):
+        value = collections.OrderedDict.pop(self, key, *args)
+        if type(value) is dict:
+            value = self._adopt(value)
+        elif type(value) is list:
+            self._adopt_items(value)
+        return value
+
+    def _adopt(self, items):
+        """Converts a vanilla dict retrieved from this one to a MessageDict associated
+        with the same message.
+        """
+
+        d = MessageDict(self.message, items)
+        associate_with = getattr(self, "associate_with", None)
+        if associate_with is not None:
+            # The message isn't created yet - see _parse_incoming_message().
+            d.associate_with = associate_with
+            associate_with.message_dicts.append(d)
+        return d
+
+    def _adopt_items(self, items):
+        for i, item in enumerate(items):
+            if type(item) is dict:
+                items[i] = self._adopt(item)
+
     def _invalid_if_no_key(func):
         def wrap(self, key, *args, **kwargs):
             try:
@@ -431,11 +728,11 @@ class MessageDict(collections.OrderedDict):
 
         return wrap
 
-    __getitem__ = _invalid_if_no_key(collections.OrderedDict.__getitem__)
+    __getitem__ = _invalid_if_no_key(_getitem)
     __delitem__ = _invalid_if_no_key(collections.OrderedDict.__delitem__)
-    pop = _invalid_if_no_key(collections.OrderedDict.pop)
+    pop = _invalid_if_no_key(_pop)
 
-    del _invalid_if_no_key
+    del _invalid_if_no_key, _getitem, _pop
 
 
 def _payload(value):
@@ -1134,6 +1431,100 @@ class InvalidMessageError(MessageHandlingError):
         return InvalidMessageError.PREFIX + str(self.reason)
 
 
+class _HandlerPool(object):
+    """Runs handlers on a pool of worker threads.
+
+    Every handler is submitted with an ordering key. Handlers with the same key run one
+    after another, in the order in which they were submitted; handlers with different
+    keys can run concurrently.
+    """
+
+    def __init__(self, channel, size):
+        self.channel = channel
+        self.size = size
+        self._lock = threading.Lock()
+        self._work_available = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._pending = {}  # {key: deque([(what, handler)])}
+        self._ready = collections.deque()  # keys with pending handlers, not running
+        self._threads = 0
+        self._busy = 0
+        self._stopping = False
+
+        self.queued = 0
+        """Number of handlers waiting for a worker thread."""
+
+        self.in_flight = 0
+        """Number of handlers currently running."""
+
+    def submit(self, key, what, handler):
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = collections.deque()
+                self._ready.append(key)
+            pending.append((what, handler))
+            self.queued += 1
+
+            idle = self._threads - self._busy
+            if len(self._ready) > idle and self._threads < self.size:
+                self._threads += 1
+                thread = threading.Thread(
+                    target=self._run_worker,
+                    name=fmt("{0} message handler {1}", self.channel, self._threads),
+                )
+                thread.pydev_do_not_trace = True
+                thread.is_pydev_daemon_thread = True
+                thread.daemon = True
+                thread.start()
+            self._work_available.notify()
+
+    def wait_until_idle(self):
+        """Blocks until every submitted handler has run.
+        """
+        with self._lock:
+            while self.queued or self.in_flight:
+                self._idle.wait()
+
+    def stop(self):
+        """Makes worker threads exit once there's nothing left to run.
+        """
+        with self._lock:
+            self._stopping = True
+            self._work_available.notify_all()
+
+    def _run_worker(self):
+        while True:
+            with self._lock:
+                while not self._ready:
+                    if self._stopping:
+                        self._threads -= 1
+                        return
+                    self._work_available.wait()
+
+                # The key stays in _pending while its handler runs, but not in _ready,
+                # so that no other worker picks up the next handler for the same key.
+                key = self._ready.popleft()
+                what, handler = self._pending[key].popleft()
+                self.queued -= 1
+                self.in_flight += 1
+                self._busy += 1
+
+            try:
+                self.channel._run_handler(what, handler)
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+                    self._busy -= 1
+                    if self._pending[key]:
+                        self._ready.append(key)
+                        self._work_available.notify()
+                    else:
+                        del self._pending[key]
+                    if not self.queued and not self.in_flight:
+                        self._idle.notify_all()
+
+
 class JsonMessageChannel(object):
     """Implements a JSON message channel on top of a raw JSON message stream, with
     support for DAP requests, responses, and events.
@@ -1146,6 +1537,44 @@ class JsonMessageChannel(object):
             channel.send_event(...)
     """
 
+    CONCURRENT_REQUESTS = frozenset(
+        [
+            "completions",
+            "evaluate",
+            "exceptionInfo",
+            "loadedSources",
+            "modules",
+            "scopes",
+            "source",
+            "stackTrace",
+            "threads",
+            "variables",
+        ]
+    )
+    """Requests whose handlers can run concurrently with the handlers of other messages
+    when handler_pool_size is not 0.
+
+    Handlers for these requests still run one after another if the requests concern the
+    same thread or frame, or if neither is specified, if they are for the same command.
+    The handlers of all other messages wait until these are done, and run by themselves.
+    """
+
+    handler_pool_size = common.HANDLER_POOL_SIZE
+    """The number of threads that run the handlers of CONCURRENT_REQUESTS. If 0, all
+    handlers run one after another on a single thread.
+
+    Must be set before start().
+    """
+
+    lazy_message_dicts = False
+    """Whether nested dicts in the payload of incoming messages are only converted to
+    MessageDict when they are retrieved from it, rather than all of them as soon as
+    the message is parsed.
+
+    Incoming messages are then decoded into vanilla dicts, which is much faster for
+    large payloads that are only passed along - e.g. "variables" responses.
+    """
+
     def __init__(self, stream, handlers=None, name=None):
         self.stream = stream
         self.handlers = handlers
@@ -1158,6 +1587,7 @@ class JsonMessageChannel(object):
         self._handler_queue = []  # [(what, handler)]
         self._handlers_enqueued = threading.Condition(self._lock)
         self._handler_thread = None
+        self._handler_pool = None
         self._parser_thread = None
 
     def __str__(self):
@@ -1217,6 +1647,22 @@ class JsonMessageChannel(object):
         if handler_thread is not None:
             handler_thread.join()
 
+    def handler_metrics(self):
+        """Returns a dict with the number of handlers waiting to run ("queued"), and
+        the number of handlers that the pool is running ("in_flight").
+        """
+
+        with self:
+            queued = len(self._handler_queue)
+            pool = self._handler_pool
+
+        in_flight = 0
+        if pool is not None:
+            with pool._lock:
+                queued += pool.queued
+                in_flight = pool.in_flight
+        return {"queued": queued, "in_flight": in_flight}
+
     # Order of keys for _prettify() - follows the order of properties in
     # https://microsoft.github.io/debug-adapter-protocol/specification
     _prettify_order = (
@@ -1401,15 +1847,27 @@ class JsonMessageChannel(object):
         # that message. This method can then be invoked on the top-level dict by the
         # parser, after it has parsed enough of the dict to create the appropriate
         # instance of Event, Request, or Response for this message.
+        #
+        # With lazy_message_dicts, only the top-level dict is created upfront, and nested
+        # dicts are added to message_dicts as MessageDict._adopt() converts them.
         def associate_with(message):
             for d in message_dicts:
                 d.message = message
                 del d.associate_with
 
         message_dicts = []
-        decoder = self.stream.json_decoder_factory(object_hook=object_hook)
-        message_dict = self.stream.read_json(decoder)
-        assert isinstance(message_dict, MessageDict)  # make sure stream used decoder
+        associate_with.message_dicts = message_dicts
+
+        if self.lazy_message_dicts:
+            message_dict = self.stream.read_json(self.stream.json_decoder_factory())
+            message_dict = MessageDict(None, message_dict)
+            message_dict.associate_with = associate_with
+            message_dicts.append(message_dict)
+            self._prettify(message_dict)
+        else:
+            decoder = self.stream.json_decoder_factory(object_hook=object_hook)
+            message_dict = self.stream.read_json(decoder)
+            assert isinstance(message_dict, MessageDict)  # make sure stream used decoder
 
         msg_type = message_dict("type", json.enum("event", "request", "response"))
         parser = self._message_parsers[msg_type]
@@ -1489,8 +1947,14 @@ class JsonMessageChannel(object):
                     # needs to call _enqueue_handlers() later, it will spin up
                     # a new handler thread.
                     self._handler_thread = None
+                    if self._handler_pool is not None:
+                        self._handler_pool.stop()
                     return
 
+                if self._handler_pool is None and self.handler_pool_size:
+                    self._handler_pool = _HandlerPool(self, self.handler_pool_size)
+                pool = self._handler_pool
+
             for what, handler in handlers:
                 # If the channel is closed, we don't want to process any more events
                 # or requests - only responses and the final disconnect handler. This
@@ -1499,13 +1963,42 @@ class JsonMessageChannel(object):
                 if closed and handler in (Event._handle, Request._handle):
                     continue
 
-                with log.prefixed("/handling {0}/\n", what.describe()):
-                    try:
-                        handler()
-                    except Exception:
-                        # It's already logged by the handler, so just fail fast.
-                        self.close()
-                        os._exit(1)
+                key = None if pool is None else self._concurrency_key(what, handler)
+                if key is not None:
+                    pool.submit(key, what, handler)
+                    continue
+
+                # Anything else runs by itself, after the handlers that came before it.
+                if pool is not None:
+                    pool.wait_until_idle()
+                self._run_handler(what, handler)
+
+    def _run_handler(self, what, handler):
+        with log.prefixed("/handling {0}/\n", what.describe()):
+            try:
+                handler()
+            except Exception:
+                # It's already logged by the handler, so just fail fast.
+                self.close()
+                os._exit(1)
+
+    def _concurrency_key(self, what, handler):
+        """Returns the key ordering the handler with respect to other handlers that
+        run concurrently, or None if it must run by itself.
+        """
+
+        if type(what) is not Request or handler != what._handle:
+            return None
+        if what.command not in self.CONCURRENT_REQUESTS:
+            return None
+
+        arguments = what.arguments
+        if isinstance(arguments, dict):
+            for name in ("threadId", "frameId"):
+                value = arguments.get(name)
+                if value is not None:
+                    return (name, value)
+        return ("command", what.command)
 
     def _get_handler_for(self, type, name):
         """Returns the handler for a message of a given type.
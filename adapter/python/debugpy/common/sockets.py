@@ -4,13 +4,48 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import os
 import socket
+import stat
 import sys
 import threading
 
 from debugpy.common import log
 
 
+UNIX_HOST_PREFIX = "unix:"
+"""Hosts starting with it stand for the Unix domain socket at the path that follows,
+e.g. "unix:/tmp/debugpy.sock", rather than for a TCP address. The port that goes
+along with such a host is ignored, and reported as 0.
+"""
+
+
+def unix_socket_path(host):
+    """If host stands for a Unix domain socket, returns its path. Otherwise, returns
+    None.
+    """
+
+    if host is not None and host.startswith(UNIX_HOST_PREFIX):
+        return host[len(UNIX_HOST_PREFIX) :]
+    return None
+
+
+def address(host, port):
+    """Returns the address to bind or connect a socket created for host to."""
+
+    path = unix_socket_path(host)
+    return (host, port) if path is None else path
+
+
+def get_address(sock):
+    """Returns the (host, port) the socket is bound to."""
+
+    name = sock.getsockname()
+    if isinstance(name, tuple):
+        return name[:2]
+    return UNIX_HOST_PREFIX + name, 0
+
+
 def create_server(host, port=0, backlog=socket.SOMAXCONN, timeout=None):
     """Return a local server socket listening on the given port."""
 
@@ -20,9 +55,14 @@ def create_server(host, port=0, backlog=socket.SOMAXCONN, timeout=None):
     if port is None:
         port = 0
 
+    path = unix_socket_path(host)
     try:
-        server = _new_sock()
-        server.bind((host, port))
+        server = _new_sock() if path is None else _new_unix_sock()
+        if path is not None:
+            # The socket file outlives its listener if the process that created it
+            # died without closing it, and then gets in the way of binding again.
+            _remove_unix_socket(path)
+        server.bind(address(host, port))
         if timeout is not None:
             server.settimeout(timeout)
         server.listen(backlog)
@@ -32,9 +72,25 @@ def create_server(host, port=0, backlog=socket.SOMAXCONN, timeout=None):
     return server
 
 
-def create_client():
-    """Return a client socket that may be connected to a remote address."""
-    return _new_sock()
+def create_client(host=None):
+    """Return a client socket that may be connected to a remote address, or to the
+    Unix domain socket if host stands for one.
+    """
+    return _new_sock() if unix_socket_path(host) is None else _new_unix_sock()
+
+
+def _new_unix_sock():
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix domain sockets are not supported on this platform")
+    return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+
+def _remove_unix_socket(path):
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    except OSError:
+        pass
 
 
 def _new_sock():
@@ -60,6 +116,16 @@ def close_socket(sock):
     sock.close()
 
 
+def close_server(server):
+    """Close a server socket, and remove its file if it's a Unix domain socket."""
+
+    host, _ = get_address(server)
+    server.close()
+    path = unix_socket_path(host)
+    if path is not None:
+        _remove_unix_socket(path)
+
+
 def serve(name, handler, host, port=0, backlog=socket.SOMAXCONN, timeout=None):
     """Accepts TCP connections on the specified host and port, and invokes the
     provided handler function for every new connection.
@@ -75,23 +141,26 @@ def serve(name, handler, host, port=0, backlog=socket.SOMAXCONN, timeout=None):
         log.reraise_exception(
             "Error listening for incoming {0} connections on {1}:{2}:", name, host, port
         )
-    host, port = listener.getsockname()
+    host, port = get_address(listener)
     log.info("Listening for incoming {0} connections on {1}:{2}...", name, host, port)
 
     def accept_worker():
         while True:
             try:
-                sock, (other_host, other_port) = listener.accept()
+                sock, other_address = listener.accept()
             except (OSError, socket.error):
                 # Listener socket has been closed.
                 break
 
-            log.info(
-                "Accepted incoming {0} connection from {1}:{2}.",
-                name,
-                other_host,
-                other_port,
-            )
+            if isinstance(other_address, tuple):
+                log.info(
+                    "Accepted incoming {0} connection from {1}:{2}.",
+                    name,
+                    other_address[0],
+                    other_address[1],
+                )
+            else:
+                log.info("Accepted incoming {0} connection on {1}.", name, host)
             handler(sock)
 
     thread = threading.Thread(target=accept_worker)
@@ -108,6 +108,12 @@ def _starts_debugging(func):
         if _settrace.called:
             raise RuntimeError("this process already has a debug adapter")
 
+        if isinstance(address, (bytes, compat.unicode)):
+            # Path of a Unix domain socket.
+            host = compat.filename_str(address)
+            if sockets.unix_socket_path(host) is None:
+                host = sockets.UNIX_HOST_PREFIX + host
+            address = (host, 0)
         try:
             _, port = address
         except Exception:
@@ -1 +1,6 @@
 + maya_debugger 0.1.0 .
+// Uncomment to have debugpy imported and listening as soon as Maya starts,
+// so attaching doesn't need to set it up. Must match the debugpy host/port of the debug configuration
+// MAYA_DEBUGGER_PRELISTEN=localhost:7005
+// Uncomment to run the command server on another port, ie to debug several Maya at once
+// MAYA_DEBUGGER_PORT=8891
@@ -2,11 +2,28 @@
 Maya Threaded Server
 
 Modified from: https://gist.github.com/Meatplowz/154fb17487e9ce0c0e8b362262a2d8a4
+
+Clients keep a connection open and send requests framed like DAP messages:
+"Content-Length: <bytes>\r\n\r\n" followed by a JSON body {"id": 1, "code": "..."}.
+Each request is answered on the same connection with {"id": 1, "success": true, "result": "..."}
+or {"id": 1, "success": false, "error": "..."}. Clients sending unframed code are still
+supported: everything they send until closing the connection is executed, without a reply.
+
+Requests can also be queries about the server's state instead of code, ie {"id": 1, "query": "debugpy"}
+answers with the address debugpy is already listening on (see prelisten_debugpy), or null.
+
+Code from every client is run on the main thread in batches: all snippets waiting when Maya
+gets to run one are run by the same callback, instead of one idle tick each. Requests a client
+sends without waiting for the replies are run, and answered, in the order they were sent.
 """
 
 import logging
 import socket
 import threading
+import json
+import time
+import sys
+import os
 
 import maya.cmds as cmds
 import maya.utils as maya_utils
@@ -17,31 +34,382 @@ HOST = "localhost"
 PORT = 8890
 CONNECTIONS = 5
 
+CONTENT_HEADER = b"Content-Length: "
+SHUTDOWN = b"#Shutdown#"
+
+# Port the server listens on instead of PORT, to run one in each of several Maya
+PORT_VARIABLE = "MAYA_DEBUGGER_PORT"
+# Set to "host:port" (or "unix:/path/to/socket") to start debugpy listening in the background
+# when the server starts
+PRELISTEN_VARIABLE = "MAYA_DEBUGGER_PRELISTEN"
+# Python used by debugpy to run its adapter, defaults to the mayapy next to Maya's executable
+PYTHON_VARIABLE = "MAYA_DEBUGGER_PYTHON"
+# Seconds to wait for more snippets before asking the main thread to run a batch
+BATCH_LATENCY_VARIABLE = "MAYA_DEBUGGER_BATCH_LATENCY"
+DEBUGPY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "python"))
+
+_shutting_down = threading.Event()
+_debugpy_address = None  # {"host": ..., "port": ...} once prelisten_debugpy is done
+
 
 def function_to_process(data):
     """
     Maya function
     :param data: incoming data to process
-    :return:
+    :return: The value of data if it is an expression, otherwise None
     """
 
     logging.info("Debug Server, Process Function: {}".format(data))
     cmds.headsUpMessage("Processing incoming data: {}".format(data), time=3.0)
 
-    exec(data)
+    try:
+        code = compile(data, "<sublime_debugger>", "eval")
+    except SyntaxError:
+        exec(data)
+        return None
+    return eval(code)
+
+
+class WorkItem(object):
+    """
+    A function to run on the main thread, and the outcome of running it
+    """
+
+    def __init__(self, func, args):
+        self.func = func
+        self.args = args
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.queued = 0.0  # Seconds spent waiting for the main thread
+        self.duration = 0.0  # Seconds spent running
+
+    def run(self):
+        start = time.time()
+        self.queued = start - self.submitted
+        try:
+            self.result = self.func(*self.args)
+        except Exception as e:
+            self.error = e
+        self.duration = time.time() - start
+        self.done.set()
+
+
+class MainThreadBatcher(object):
+    """
+    Runs functions on the main thread, running all those pending in a single deferred callback
+    """
+
+    def __init__(self, max_latency=0.0):
+        self.max_latency = max_latency
+        self.lock = threading.Lock()
+        self.pending = []
+        self.scheduled = False
+
+    def submit(self, func, *args):
+        """
+        Blocks until func(*args) has run on the main thread
+        :return: The WorkItem holding the result or exception, and timings
+        """
+
+        return self.submit_all([(func, args)])[0]
+
+    def submit_all(self, calls):
+        """
+        Blocks until every (func, args) in calls has run on the main thread, one after the other
+        :return: The WorkItems of the calls, in the same order
+        """
+
+        items = [WorkItem(func, args) for func, args in calls]
+        if not items:
+            return items
+
+        with self.lock:
+            self.pending.extend(items)
+            schedule = not self.scheduled
+            self.scheduled = True
+
+        if schedule:
+            if self.max_latency:
+                # Give other snippets a chance to join this batch
+                time.sleep(self.max_latency)
+            maya_utils.executeDeferred(self.run_batch)
+
+        for item in items:
+            item.done.wait()
+        return items
+
+    def run_batch(self):
+        """
+        Runs every pending function. Called on the main thread
+        """
+
+        with self.lock:
+            items, self.pending = self.pending, []
+            self.scheduled = False
+
+        start = time.time()
+        for item in items:
+            item.run()
+        logging.info("Debug Server, Ran a batch of {} in {:.3f}s".format(len(items), time.time() - start))
+
+
+_batcher = MainThreadBatcher(float(os.environ.get(BATCH_LATENCY_VARIABLE, 0)))
 
 
 def process_update(data):
     """
     Process incoming data, run this in the Maya main thread
     :param data:
+    :return: The WorkItem holding the result of function_to_process, or what it raised
+    """
+
+    return _batcher.submit(function_to_process, data)
+
+
+def process_updates(codes):
+    """
+    Process several pieces of incoming code in order, in the Maya main thread
+    :param codes: The code of each update
+    :return: The WorkItem of each, in the same order
+    """
+
+    return _batcher.submit_all([(function_to_process, (code,)) for code in codes])
+
+
+def process_query(query):
+    """
+    Answers a query about the server's state
+    :param query: Name of the query
+    :return: JSON serializable answer
+    """
+
+    if query == "debugpy":
+        return _debugpy_address
+    raise ValueError("Unknown query: {}".format(query))
+
+
+def prelisten_debugpy(host, port, python=None):
+    """
+    Imports debugpy from this thread, then has it listen from the main thread.
+    Run in a background thread at startup so the adapter can attach without sending any code.
+    :param host: Host debugpy listens on
+    :param port: Integer
+    :param python: Python executable debugpy runs its adapter with
     :return:
     """
 
+    global _debugpy_address
+
+    if python is None:
+        maya_dir = os.path.dirname(sys.executable)
+        python = os.path.join(maya_dir, "mayapy.exe" if os.name == "nt" else "mayapy")
+
+    if DEBUGPY_PATH not in sys.path:
+        sys.path.insert(0, DEBUGPY_PATH)
+
+    # The expensive part, importing pydevd, happens here instead of in the main thread
+    import debugpy
+    from debugpy.server import api
+
+    def listen():
+        debugpy.configure(python=python)
+        debugpy.listen((host, port))
+
     try:
-        maya_utils.executeInMainThreadWithResult(function_to_process, data)
+        maya_utils.executeInMainThreadWithResult(listen)
     except Exception as e:
-        cmds.error("Debug Server, Exception processing Function: {}".format(e))
+        logging.error("Debug Server, Failed to start debugpy: {}".format(e))
+        return
+
+    _debugpy_address = {"host": host, "port": port}
+    logging.info("Debug Server, debugpy listening on {}:{}".format(host, port))
+
+
+class ClientConnection(object):
+    """
+    Reads framed requests from a client socket, and sends replies to it
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.buffer = bytearray()
+
+    def receive(self):
+        data = self.client.recv(65536)
+        if not data:
+            raise EOFError("Connection closed")
+        self.buffer += data
+
+    def is_framed(self):
+        """
+        Waits for enough data to know whether the client frames its requests
+        """
+
+        while len(self.buffer) < len(CONTENT_HEADER) and CONTENT_HEADER.startswith(bytes(self.buffer)):
+            try:
+                self.receive()
+            except EOFError:
+                break
+        return bytes(self.buffer[:len(CONTENT_HEADER)]) == CONTENT_HEADER
+
+    def read_all(self):
+        """
+        Reads until the client closes the connection
+        """
+
+        while True:
+            try:
+                self.receive()
+            except EOFError:
+                return bytes(self.buffer)
+
+    def read_message(self):
+        """
+        Reads the next framed request and returns its body
+        """
+
+        frame = self.buffered_frame()
+        while frame is None:
+            self.receive()
+            frame = self.buffered_frame()
+
+        start, end = frame
+        body = bytes(self.buffer[start:end])
+        del self.buffer[:end]
+        return body
+
+    def read_messages(self):
+        """
+        Reads the next framed request, and every other one already received after it
+        :return: Their bodies, in the order they were sent
+        """
+
+        bodies = [self.read_message()]
+        while self.buffered_frame() is not None:
+            bodies.append(self.read_message())
+        return bodies
+
+    def buffered_frame(self):
+        """
+        :return: The start and end of the body of the first request in the buffer, or None if it isn't all there yet
+        """
+
+        header_end = self.buffer.find(b"\r\n\r\n")
+        if header_end < 0:
+            return None
+
+        content_length = 0
+        for header in bytes(self.buffer[:header_end]).split(b"\r\n"):
+            if header.startswith(CONTENT_HEADER):
+                content_length = int(header[len(CONTENT_HEADER):])
+
+        start = header_end + 4
+        if len(self.buffer) < start + content_length:
+            return None
+        return start, start + content_length
+
+    def send_message(self, contents):
+        body = json.dumps(contents).encode("utf-8")
+        self.client.sendall(CONTENT_HEADER + str(len(body)).encode("utf-8") + b"\r\n\r\n" + body)
+
+
+def serve_requests(connection, requests):
+    """
+    Runs framed requests in order and sends back their replies, in the same order.
+    The code of all of them is run by the same batch.
+    :param connection: The ClientConnection they came from
+    :param requests: Contents of each request
+    :return:
+    """
+
+    logging.info("Debug Server, Requests Received: {}".format([request.get("id") for request in requests]))
+    code_requests = [request for request in requests if "query" not in request]
+    items = iter(process_updates([request.get("code", "") for request in code_requests]))
+
+    for request in requests:
+        if "query" in request:
+            try:
+                reply = {"id": request.get("id"), "success": True, "result": process_query(request["query"])}
+            except Exception as e:
+                reply = {"id": request.get("id"), "success": False, "error": "{}: {}".format(type(e).__name__, e)}
+        else:
+            item = next(items)
+            if item.error:
+                logging.error("Debug Server, Exception processing Function: {}".format(item.error))
+                reply = {"id": request.get("id"), "success": False,
+                         "error": "{}: {}".format(type(item.error).__name__, item.error)}
+            else:
+                reply = {"id": request.get("id"), "success": True, "result": repr(item.result)}
+            reply["timing"] = {"queued": item.queued, "run": item.duration}
+
+        try:
+            connection.send_message(reply)
+        except Exception as send_error:
+            logging.info("Debug Server, Error Replying to Client: {}".format(send_error))
+
+
+def handle_client(client, server):
+    """
+    Serves one client until it disconnects
+    :param client: The client's socket
+    :param server: The server's socket, closed when a client asks for a shutdown
+    :return:
+    """
+
+    connection = ClientConnection(client)
+    try:
+        if not connection.is_framed():
+            # Unframed client, which sends a single piece of code then closes the connection
+            data = connection.read_all()
+            if data == SHUTDOWN:
+                shutdown(server)
+            elif data:
+                logging.info("Debug Server, Data Received: {}".format(data))
+                item = process_update(data)
+                if item.error:
+                    logging.error("Debug Server, Exception processing Function: {}".format(item.error))
+            return
+
+        while True:
+            # Every request already received is served together, so that they share a batch.
+            # They are all answered before reading more, which keeps them in order.
+            requests = [json.loads(body.decode("utf-8")) for body in connection.read_messages()]
+            codes = [request.get("code", "") for request in requests]
+            if SHUTDOWN.decode("utf-8") in codes:
+                serve_requests(connection, requests[:codes.index(SHUTDOWN.decode("utf-8"))])
+                shutdown(server)
+                return
+
+            serve_requests(connection, requests)
+
+    except EOFError:
+        pass
+    except Exception as client_error:
+        logging.info("Debug Server, Error Handling Client: {}".format(client_error))
+    finally:
+        try:
+            client.close()
+        except Exception as client_error:
+            logging.info("Debug Server, Error Closing Client Socket: {}".format(client_error))
+
+
+def shutdown(server):
+    """
+    Stops the server from accepting new clients
+    """
+
+    _shutting_down.set()
+    try:
+        # Wakes up accept() where closing alone doesn't (ie Linux)
+        server.shutdown(socket.SHUT_RDWR)
+    except Exception:
+        pass
+    try:
+        server.close()
+    except Exception as close_error:
+        logging.info("Debug Server, Error Closing Socket: {}".format(close_error))
 
 
 def maya_server(host=HOST, port=PORT, connections=CONNECTIONS):
@@ -64,29 +432,37 @@ def maya_server(host=HOST, port=PORT, connections=CONNECTIONS):
 
     sock.listen(connections)
     logging.info("Starting Debug Server: {}".format(port))
-    while True:
-        client, address = sock.accept()
-        data = client.recv(1024)
-        if data:
-            if data == "#Shutdown#":
-                break
-            else:
-                logging.info("Debug Server, Data Received: {}".format(data))
-                process_update(data)
+    while not _shutting_down.is_set():
         try:
-            client.close()
-        except Exception as client_error:
-            logging.info("Debug Server, Error Closing Client Socket: {}".format(client_error))
+            client, address = sock.accept()
+        except Exception as accept_error:
+            if not _shutting_down.is_set():
+                logging.error("Debug Server, Error Accepting Client: {}".format(accept_error))
+            break
+
+        client_thread = threading.Thread(target=handle_client, args=(client, sock))
+        client_thread.daemon = True
+        client_thread.start()
 
     logging.info("Debug Server, Shutting Down.")
-    try:
-        sock.close()
-    except Exception as close_error:
-        logging.info("Debug Server, Error Closing Socket: {}".format(close_error))
+    shutdown(sock)
 
 
 def start():
     logging.basicConfig(level=logging.DEBUG)
-    threading.Thread(target=maya_server).start()
+    threading.Thread(target=maya_server, kwargs={"port": int(os.environ.get(PORT_VARIABLE, PORT))}).start()
+
+    prelisten = os.environ.get(PRELISTEN_VARIABLE)
+    if prelisten:
+        if prelisten.startswith("unix:"):
+            host, port = prelisten, 0  # Unix domain socket, which has no port
+        else:
+            host, _, port = prelisten.rpartition(":")
+        prelisten_thread = threading.Thread(
+            target=prelisten_debugpy,
+            args=(host or HOST, int(port), os.environ.get(PYTHON_VARIABLE)),
+        )
+        prelisten_thread.daemon = True
+        prelisten_thread.start()
 
     QMessageBox.information(None, 'Server is ready', 'Sublime debugger can now attach to Maya for UI debugging.')
@@ -0,0 +1,91 @@
+"""
+
+Cache of debugpy's responses to the read-only requests the debugger repeats while Maya is stopped.
+
+Every time its panels refresh, the debugger asks again for the same threads, stack frames,
+scopes and variables. Each of those requests would otherwise make debugpy do the work
+on Maya's suspended thread again, although the answer can't have changed.
+
+"""
+
+from util import log, has_command, has_event, COMMAND_PATTERN
+from threading import Lock
+import json
+
+
+# Requests whose responses are cached, keyed on their arguments
+CACHEABLE_COMMANDS = (b'threads', b'stackTrace', b'scopes', b'variables', b'source')
+
+# Requests which can't change what the cached requests would answer
+READ_ONLY_COMMANDS = (b'setBreakpoints', b'setFunctionBreakpoints', b'setExceptionBreakpoints',
+                      b'exceptionInfo', b'completions', b'modules', b'loadedSources', b'gotoTargets',
+                      b'mayaAdapterStats')
+
+# Events telling the state of the debuggee changed
+INVALIDATING_EVENTS = (b'continued', b'stopped', b'invalidated', b'thread')
+
+
+class ResponseCache:
+    """
+    Answers repeated cacheable requests with debugpy's previous response to them.
+    Cleared when an event says the debuggee changed, or a request may change it.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.responses = {}  # (command, arguments as JSON) -> response contents
+        self.pending = {}  # seq of forwarded cacheable requests -> (key, generation)
+        self.generation = 0  # Incremented when invalidated, so responses in flight are not stored
+        self.hits = 0
+        self.misses = 0
+
+    def on_request(self, message):
+        """
+        Checks a request from the debugger.
+        Returns the response to send back to the debugger if it is cached, otherwise None.
+        """
+
+        commands = COMMAND_PATTERN.findall(message)
+        if not commands or not all(cmd in CACHEABLE_COMMANDS for cmd in commands):
+            if any(cmd not in READ_ONLY_COMMANDS for cmd in commands):
+                self.invalidate()
+            return None
+
+        contents = json.loads(message.decode('UTF-8'))
+        key = (contents['command'], json.dumps(contents.get('arguments'), sort_keys=True))
+
+        with self.lock:
+            response = self.responses.get(key)
+            if response is None:
+                self.misses += 1
+                self.pending[contents['seq']] = (key, self.generation)
+                return None
+            self.hits += 1
+
+        log("Answering {} from the cache ({} hits, {} misses)".format(key[0], self.hits, self.misses))
+        response = dict(response, request_seq=contents['seq'])
+        return json.dumps(response).encode('UTF-8')
+
+    def on_message_from_debugpy(self, message):
+        """
+        Stores responses to the cacheable requests that were forwarded,
+        and clears the cache on events changing the debuggee's state.
+        """
+
+        if has_event(message, INVALIDATING_EVENTS):
+            self.invalidate()
+            return
+
+        if not self.pending or not has_command(message, CACHEABLE_COMMANDS):
+            return
+
+        contents = json.loads(message.decode('UTF-8'))
+        with self.lock:
+            pending = self.pending.pop(contents.get('request_seq'), None)
+            if pending and pending[1] == self.generation and contents.get('success'):
+                self.responses[pending[0]] = contents
+
+    def invalidate(self):
+        with self.lock:
+            self.responses.clear()
+            self.generation += 1
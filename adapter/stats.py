@@ -0,0 +1,184 @@
+"""
+
+Measures where time goes in the adapter: latency of each request until its response is sent
+back to the debugger, time messages spend waiting in the send queues, and how many messages
+and bytes go through in each direction.
+
+The debugger can ask for these with a custom "mayaAdapterStats" request,
+and they are written to stats.json when it disconnects.
+
+"""
+
+from util import log, abspath, join, dirname, COMMAND_PATTERN
+from threading import Lock
+from queue import Queue
+import atexit
+import json
+import time
+import re
+
+
+stats_file = abspath(join(dirname(__file__), 'stats.json'))
+
+# Upper bounds of the histogram buckets, in milliseconds
+BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+SEQ_PATTERN = re.compile(br'"seq"\s*:\s*(\d+)')
+REQUEST_SEQ_PATTERN = re.compile(br'"request_seq"\s*:\s*(\d+)')
+
+
+class Histogram:
+    """
+    Counts durations in buckets growing roughly exponentially
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        index = 0
+        while index < len(BUCKETS) and ms > BUCKETS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def to_dict(self):
+        labels = ['<={}ms'.format(bound) for bound in BUCKETS] + ['>{}ms'.format(BUCKETS[-1])]
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count if self.count else 0,
+            'max_ms': self.max,
+            'buckets': dict((label, n) for label, n in zip(labels, self.counts) if n),
+        }
+
+
+class RelayStats:
+    """
+    Collects the measurements of the whole adapter. Safe to use from any thread.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.start_time = time.time()
+        self.messages = {}  # Direction -> messages
+        self.bytes = {}  # Direction -> bytes
+        self.latency = {}  # Command -> Histogram of request -> response time
+        self.queue_wait = {}  # Queue name -> Histogram
+        self.requests = {}  # seq -> (command, time received)
+
+    def message_received(self, peer, message):
+        """
+        Counts a message read from peer ("debugger" or "debugpy"),
+        starting the clock for requests from the debugger
+        """
+
+        self._count('from_' + peer, message)
+        if peer != 'debugger':
+            return
+
+        seq = SEQ_PATTERN.search(message)
+        command = COMMAND_PATTERN.search(message)
+        if seq and command:
+            with self.lock:
+                self.requests[int(seq.group(1))] = (command.group(1).decode('UTF-8'), time.time())
+
+    def message_sent(self, peer, message):
+        """
+        Counts a message written to peer, stopping the clock of the request it answers
+        """
+
+        self._count('to_' + peer, message)
+        if peer != 'debugger':
+            return
+
+        request_seq = REQUEST_SEQ_PATTERN.search(message)
+        if not request_seq:
+            return
+
+        with self.lock:
+            request = self.requests.pop(int(request_seq.group(1)), None)
+            if request:
+                command, received = request
+                self.latency.setdefault(command, Histogram()).add(time.time() - received)
+
+        if request and request[0] == 'disconnect':
+            self.dump()
+
+    def waited(self, queue_name, seconds):
+        with self.lock:
+            self.queue_wait.setdefault(queue_name, Histogram()).add(seconds)
+
+    def to_dict(self):
+        with self.lock:
+            elapsed = max(time.time() - self.start_time, 1e-6)
+            return {
+                'uptime_s': elapsed,
+                'directions': dict(
+                    (direction, {
+                        'messages': self.messages[direction],
+                        'bytes': self.bytes[direction],
+                        'messages_per_s': self.messages[direction] / elapsed,
+                        'bytes_per_s': self.bytes[direction] / elapsed,
+                    }) for direction in self.messages
+                ),
+                'latency': dict((command, h.to_dict()) for command, h in self.latency.items()),
+                'queue_wait': dict((name, h.to_dict()) for name, h in self.queue_wait.items()),
+                'pending_requests': len(self.requests),
+            }
+
+    def dump(self):
+        try:
+            with open(stats_file, 'w') as f:
+                json.dump(self.to_dict(), f, indent=4)
+            log("Adapter stats written to " + stats_file)
+        except Exception as e:
+            log("Failure writing adapter stats: " + str(e))
+
+    def _count(self, direction, message):
+        with self.lock:
+            self.messages[direction] = self.messages.get(direction, 0) + 1
+            self.bytes[direction] = self.bytes.get(direction, 0) + len(message)
+
+
+class TimedQueue(Queue):
+    """
+    Queue recording how long each item waited in it
+    """
+
+    def __init__(self, name):
+        Queue.__init__(self)
+        self.name = name
+
+    def put(self, item, block=True, timeout=None):
+        Queue.put(self, (time.time(), item), block, timeout)
+
+    def get(self, block=True, timeout=None):
+        put_time, item = Queue.get(self, block, timeout)
+        stats.waited(self.name, time.time() - put_time)
+        return item
+
+
+def stats_response(request_seq):
+    """
+    Builds the response to a mayaAdapterStats request
+    """
+
+    return json.dumps({
+        "request_seq": request_seq,
+        "body": stats.to_dict(),
+        "seq": 0,
+        "success": True,
+        "command": "mayaAdapterStats",
+        "message": "",
+        "type": "response",
+    }).encode('UTF-8')
+
+
+stats = RelayStats()
+atexit.register(stats.dump)
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The adapter is run as a script, so its modules import each other as top level modules
+ADAPTER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ADAPTER_DIR, 'python'))
+sys.path.insert(0, ADAPTER_DIR)
@@ -0,0 +1,102 @@
+import asyncio
+
+from async_engine import AsyncRelay, BlockingWriter, TimedQueue
+from util import frame_message
+
+
+class DeadWriter(BlockingWriter):
+    """ Writer of a connection closed by the other side """
+
+    def __init__(self):
+        BlockingWriter.__init__(self, None)
+
+    def write(self, data):
+        raise ConnectionResetError("Connection reset by peer")
+
+
+def feed_messages(count):
+    reader = asyncio.StreamReader()
+    for seq in range(count):
+        reader.feed_data(frame_message(b'{"seq": %d}' % seq))
+    reader.feed_eof()
+    return reader
+
+
+def test_read_loop_continues_when_writer_dies_with_full_queue():
+    relay = AsyncRelay(None, None, queue_size=2)
+    received = []
+
+    async def run():
+        relay.loop = asyncio.get_running_loop()
+        relay.debugger_queue = asyncio.Queue()
+
+        queue = relay._debugpy_queue(0)
+        for _ in range(relay.queue_size):
+            relay.send_to_debugpy(b'{}')
+        writer = relay._spawn(relay._write_loop(queue, DeadWriter(), 'debugpy'))
+
+        def on_receive(message):
+            received.append(message)
+            relay.send_to_debugpy(message)
+
+        await asyncio.wait_for(relay._read_loop(feed_messages(10), on_receive, 'debugger'), 5)
+        await writer
+
+        assert queue.closed and queue.qsize() == 0
+
+    asyncio.run(run())
+    assert len(received) == 10
+
+
+def test_read_loop_ignores_full_queues_it_does_not_write_to():
+    relay = AsyncRelay(None, None, queue_size=2)
+    received = []
+
+    async def run():
+        relay.loop = asyncio.get_running_loop()
+        relay.debugger_queue = TimedQueue('test.debugger_queue')
+        writer = relay._spawn(relay._write_loop(relay.debugger_queue, BlockingWriter(Sink()), 'debugger'))
+
+        # Nothing ever writes the messages of this one
+        for _ in range(relay.queue_size):
+            relay.send_to_debugpy(b'{}')
+
+        def on_receive(message):
+            received.append(message)
+            relay.send(message)
+
+        await asyncio.wait_for(relay._read_loop(feed_messages(10), on_receive, 'debugpy'), 5)
+        writer.cancel()
+
+    asyncio.run(run())
+    assert len(received) == 10
+
+
+def test_cancelled_writer_closes_its_queue():
+    relay = AsyncRelay(None, None, queue_size=2)
+
+    async def run():
+        relay.loop = asyncio.get_running_loop()
+        queue = relay._debugpy_queue(0)
+        writer = relay._spawn(relay._write_loop(queue, BlockingWriter(Sink()), 'debugpy'))
+        await asyncio.sleep(0)
+
+        writer.cancel()
+        await asyncio.gather(writer, return_exceptions=True)
+        relay.send_to_debugpy(b'{}')
+        assert queue.closed and queue.qsize() == 0
+        await asyncio.wait_for(queue.join(), 1)
+
+    asyncio.run(run())
+
+
+class Sink:
+
+    def __init__(self):
+        self.written = []
+
+    def write(self, data):
+        self.written.append(data)
+
+    def flush(self):
+        pass
@@ -0,0 +1,326 @@
+import collections
+import io
+import json
+import random
+import socket
+import threading
+import time
+
+import pytest
+
+from debugpy.common import messaging
+
+
+def framed(*bodies):
+    data = b""
+    for body in bodies:
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        data += b"Content-Length: %d\r\n\r\n" % len(body) + body
+    return data
+
+
+class ChunkedReader(io.RawIOBase):
+    """Returns the data in chunks of the given sizes, one per readinto(), the way
+    a socket returns whatever has arrived so far.
+    """
+
+    def __init__(self, data, sizes):
+        self.data = data
+        self.sizes = list(sizes)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(self.sizes.pop(0) if self.sizes else len(self.data), len(buffer), len(self.data))
+        buffer[:size] = self.data[:size]
+        self.data = self.data[size:]
+        return size
+
+
+def read_all(stream):
+    values = []
+    while True:
+        try:
+            values.append(stream.read_json())
+        except messaging.NoMoreMessages:
+            return values
+
+
+class TestJsonIOStream(object):
+    MESSAGES = [{"seq": seq, "type": "event", "event": "output"} for seq in range(1, 6)]
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 25, 1000])
+    def test_read_split_frames(self, chunk_size):
+        data = framed(*self.MESSAGES)
+        reader = ChunkedReader(data, [chunk_size] * len(data))
+        stream = messaging.JsonIOStream(reader, io.BytesIO(), "test")
+        assert read_all(stream) == self.MESSAGES
+
+    def test_read_reuses_buffer(self):
+        data = framed(*self.MESSAGES)
+        stream = messaging.JsonIOStream(io.BytesIO(data), io.BytesIO(), "test")
+
+        assert stream.read_json() == self.MESSAGES[0]
+        buffer = stream._buffer
+        assert read_all(stream) == self.MESSAGES[1:]
+        assert stream._buffer is buffer
+
+    def test_read_partial_frame_at_end_of_buffer(self):
+        # The second message starts right before the end of the buffer, so its headers
+        # are split in two, and the unconsumed bytes must be moved to the front.
+        first = b'{"seq": 1, "padding": "%s"}'
+        padding = messaging.JsonIOStream.BUFFER_SIZE - len(framed(first % b""))
+        first = first % (b"x" * (padding - 10))
+        data = framed(first, self.MESSAGES[1])
+
+        reader = ChunkedReader(data, [messaging.JsonIOStream.BUFFER_SIZE] * 2)
+        stream = messaging.JsonIOStream(reader, io.BytesIO(), "test")
+        assert stream.read_json()["seq"] == 1
+        buffer = stream._buffer
+        assert stream.read_json() == self.MESSAGES[1]
+        assert stream._buffer is buffer
+
+    def test_read_message_bigger_than_buffer(self):
+        big = {"seq": 1, "body": "x" * (messaging.JsonIOStream.BUFFER_SIZE * 3)}
+        data = framed(self.MESSAGES[0], big, self.MESSAGES[1])
+        reader = ChunkedReader(data, [4096] * len(data))
+        stream = messaging.JsonIOStream(reader, io.BytesIO(), "test")
+
+        assert read_all(stream) == [self.MESSAGES[0], big, self.MESSAGES[1]]
+        assert len(stream._buffer) >= len(framed(big))
+
+    def test_read_invalid_message_then_next(self):
+        data = framed(b"{not json", self.MESSAGES[0])
+        stream = messaging.JsonIOStream(io.BytesIO(data), io.BytesIO(), "test")
+
+        with pytest.raises(Exception):
+            stream.read_json()
+        assert stream.read_json() == self.MESSAGES[0]
+
+    def test_read_truncated_message(self):
+        data = framed(self.MESSAGES[0])[:-1]
+        stream = messaging.JsonIOStream(io.BytesIO(data), io.BytesIO(), "test")
+        with pytest.raises(messaging.NoMoreMessages):
+            stream.read_json()
+
+
+def parse_messages(data, lazy):
+    """Parses every message in data, without running their handlers."""
+
+    stream = messaging.JsonIOStream(io.BytesIO(data), io.BytesIO(), "test")
+    channel = messaging.JsonMessageChannel(stream)
+    channel.lazy_message_dicts = lazy
+    parsed = []
+    channel._enqueue_handlers = lambda what, *handlers: parsed.append(what)
+    while True:
+        try:
+            channel._parse_incoming_message()
+        except messaging.NoMoreMessages:
+            return parsed
+
+
+def all_dicts(value):
+    """Retrieves every dict in value through MessageDict, the way handlers do."""
+
+    if isinstance(value, dict):
+        dicts = [value]
+        for key in list(value):
+            dicts += all_dicts(value[key])
+        return dicts
+    elif isinstance(value, list):
+        return [d for item in value for d in all_dicts(item)]
+    return []
+
+
+class TestLazyMessageDicts(object):
+    MESSAGES = [
+        {
+            "seq": 1,
+            "type": "request",
+            "command": "setBreakpoints",
+            "arguments": {
+                "source": {"path": "/tmp/a.py", "sources": [{"name": "b"}]},
+                "breakpoints": [{"line": 1}, {"line": 2, "condition": "x"}],
+                "lines": [1, 2],
+            },
+        },
+        {
+            "seq": 2,
+            "type": "response",
+            "request_seq": 1,
+            "command": "variables",
+            "success": True,
+            "body": {"variables": [{"name": "a", "value": "1", "presentationHint": {"kind": "data"}}]},
+        },
+        {"seq": 3, "type": "event", "event": "output", "body": {"output": "hi", "data": None}},
+        {"seq": 4, "type": "event", "event": "initialized"},
+    ]
+
+    def parse(self, lazy):
+        # Responses are only parsed for requests sent on the channel, so parse them
+        # as events carrying the same payload.
+        messages = [
+            dict(message, type="event", event=message["command"]) if message["type"] == "response" else message
+            for message in self.MESSAGES
+        ]
+        return parse_messages(framed(*messages), lazy)
+
+    def test_same_payload(self):
+        eager = self.parse(False)
+        lazy = self.parse(True)
+
+        assert [type(message) for message in lazy] == [type(message) for message in eager]
+        for eager_message, lazy_message in zip(eager, lazy):
+            assert lazy_message.seq == eager_message.seq
+            assert lazy_message.payload == eager_message.payload
+            assert json.dumps(lazy_message.json) == json.dumps(eager_message.json)
+
+    def test_nested_dicts_are_message_dicts(self):
+        for message in self.parse(True):
+            for d in all_dicts(message.payload):
+                assert isinstance(d, messaging.MessageDict)
+                assert d.message is message
+
+        request = self.parse(True)[0]
+        breakpoints = request.arguments["breakpoints"]
+        assert all(isinstance(bp, messaging.MessageDict) for bp in breakpoints)
+        assert request.arguments["source"]["sources"][0]("name", str) == "b"
+        # Converted dicts replace the original ones, so they are only converted once.
+        assert request.arguments["source"] is request.arguments["source"]
+
+    def test_missing_property(self):
+        for lazy in (False, True):
+            request = self.parse(lazy)[0]
+            with pytest.raises(messaging.InvalidMessageError) as exc_info:
+                request.arguments["source"]["missing"]
+            assert exc_info.value.cause is request
+
+            request = self.parse(lazy)[0]
+            with pytest.raises(messaging.InvalidMessageError):
+                request.arguments["breakpoints"][0]("line", str)
+
+
+class FakeChannel(object):
+    """Just enough of a JsonMessageChannel for _HandlerPool to run handlers."""
+
+    def __str__(self):
+        return "test"
+
+    def _run_handler(self, what, handler):
+        handler()
+
+
+class TestHandlerPool(object):
+    def test_same_key_in_order(self):
+        pool = messaging._HandlerPool(FakeChannel(), 4)
+        lock = threading.Lock()
+        ran = collections.defaultdict(list)
+        running = collections.Counter()
+        overlapped = []
+
+        def handler(key, index):
+            def run():
+                with lock:
+                    running[key] += 1
+                    if running[key] > 1:
+                        overlapped.append(key)
+                time.sleep(random.random() * 0.002)
+                with lock:
+                    running[key] -= 1
+                    ran[key].append(index)
+
+            return run
+
+        for index in range(50):
+            for key in ("a", "b", "c", (1, "stackTrace")):
+                pool.submit(key, None, handler(key, index))
+        pool.wait_until_idle()
+        pool.stop()
+
+        assert not overlapped
+        assert dict(ran) == {key: list(range(50)) for key in ("a", "b", "c", (1, "stackTrace"))}
+
+    def test_different_keys_concurrently(self):
+        pool = messaging._HandlerPool(FakeChannel(), 2)
+        # Both handlers only return once the other one is running too.
+        barrier = threading.Barrier(2, timeout=5)
+        pool.submit("a", None, barrier.wait)
+        pool.submit("b", None, barrier.wait)
+        pool.wait_until_idle()
+        pool.stop()
+        assert not barrier.broken
+
+    def test_handler_metrics(self):
+        class Channel(messaging.JsonMessageChannel):
+            def _run_handler(self, what, handler):
+                handler()
+
+        channel = Channel(None, name="test")
+        assert channel.handler_metrics() == {"queued": 0, "in_flight": 0}
+
+        pool = channel._handler_pool = messaging._HandlerPool(channel, 2)
+        release = threading.Event()
+        for key in ("a", "a", "b", "c"):
+            pool.submit(key, None, release.wait)
+
+        # Two workers run the handlers for "a" and "b"; the second handler for "a"
+        # waits for the first one, and the handler for "c" waits for a worker.
+        deadline = time.time() + 5
+        while channel.handler_metrics()["in_flight"] < 2 and time.time() < deadline:
+            time.sleep(0.001)
+        assert channel.handler_metrics() == {"queued": 2, "in_flight": 2}
+
+        channel._handler_queue.append((None, release.wait))
+        assert channel.handler_metrics() == {"queued": 3, "in_flight": 2}
+        del channel._handler_queue[:]
+
+        release.set()
+        pool.wait_until_idle()
+        pool.stop()
+        assert channel.handler_metrics() == {"queued": 0, "in_flight": 0}
+
+
+class TestWriteCoalescing(object):
+    WINDOW = 0.005
+
+    @pytest.fixture
+    def streams(self):
+        writer_sock, reader_sock = socket.socketpair()
+        writer = messaging.JsonIOStream.from_socket(writer_sock, "writer")
+        writer.write_coalescing_window = self.WINDOW
+        reader = messaging.JsonIOStream.from_socket(reader_sock, "reader")
+        reader_sock.settimeout(1)  # Fails the test instead of hanging if nothing is written
+        yield writer, reader
+        writer.close()
+        reader.close()
+
+    def test_small_messages_flushed(self, streams):
+        writer, reader = streams
+        for seq in (1, 2):
+            writer.write_json({"seq": seq})
+            # Each is written by its own batch, once the window is over
+            assert reader.read_json() == {"seq": seq}
+
+        time.sleep(self.WINDOW * 2)
+        writer.write_json({"seq": 3})
+        writer.write_json({"seq": 4})
+        assert reader.read_json() == {"seq": 3}
+        assert reader.read_json() == {"seq": 4}
+        assert writer.coalesced_messages == 4
+
+    def test_burst_coalesced(self, streams):
+        writer, reader = streams
+        for seq in range(100):
+            writer.write_json({"seq": seq})
+        for seq in range(100):
+            assert reader.read_json() == {"seq": seq}
+        assert writer.flushes < 100
+
+    def test_flushed_on_close(self, streams):
+        writer, reader = streams
+        writer.write_coalescing_window = 60
+        writer.write_json({"seq": 1})
+        writer.close()
+        assert reader.read_json() == {"seq": 1}
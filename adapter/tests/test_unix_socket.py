@@ -0,0 +1,145 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import textwrap
+import threading
+
+import pytest
+
+import util
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="Unix domain sockets are not available")
+
+TIMEOUT = 30
+
+# Stands in for Maya started with MAYA_DEBUGGER_PRELISTEN: debugpy listens on the socket
+DEBUGGEE = textwrap.dedent("""
+    import sys
+    import time
+
+    sys.path.insert(0, {debugpy_path!r})
+    import debugpy
+
+    debugpy.listen({path!r})
+    print("listening", flush=True)
+    while True:
+        time.sleep(0.1)
+""")
+
+
+class FakeMayaServer:
+    """ Answers the adapter's query for the address debugpy already listens on, as Maya's command server does """
+
+    def __init__(self, debugpy_address):
+        self.debugpy_address = debugpy_address
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(('localhost', 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+        self.code = []  # Code the adapter sent, which it shouldn't
+
+        thread = threading.Thread(target=self.serve)
+        thread.daemon = True
+        thread.start()
+
+    def serve(self):
+        client, _ = self.server.accept()
+        reader = util.MessageReader(client.recv_into)
+        while True:
+            try:
+                request = json.loads(reader.read().decode('UTF-8'))
+            except EOFError:
+                return
+            if request.get('query') == 'debugpy':
+                result = {'host': self.debugpy_address[0], 'port': self.debugpy_address[1]}
+            else:
+                self.code.append(request.get('code'))
+                result = None
+            reply = json.dumps({'id': request['id'], 'success': True, 'result': result}).encode('UTF-8')
+            client.sendall(util.frame_message(reply))
+
+    def close(self):
+        self.server.close()
+
+
+class Debugger:
+    """ Talks to the adapter over its stdin and stdout, as Sublime's Debugger does """
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.reader = util.MessageReader(adapter.stdout.readinto1)
+        self.seq = 0
+
+    def request(self, command, arguments=None):
+        self.seq += 1
+        message = {'seq': self.seq, 'type': 'request', 'command': command, 'arguments': arguments or {}}
+        self.adapter.stdin.write(util.frame_message(json.dumps(message).encode('UTF-8')))
+        self.adapter.stdin.flush()
+        return self.seq
+
+    def wait_for(self, predicate):
+        while True:
+            message = json.loads(self.reader.read().decode('UTF-8'))
+            if predicate(message):
+                return message
+
+    def wait_for_response(self, seq):
+        response = self.wait_for(lambda message: message['type'] == 'response' and message['request_seq'] == seq)
+        assert response['success'], response
+        return response
+
+
+@pytest.fixture
+def debugpy_path():
+    # Socket paths are limited to about a hundred characters, which tmp_path can exceed
+    path = os.path.join('/tmp', 'maya-debugpy-test-{}.sock'.format(os.getpid()))
+    code = DEBUGGEE.format(debugpy_path=util.debugpy_path, path=path)
+    debuggee = subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True)
+    try:
+        assert debuggee.stdout.readline().strip() == 'listening'
+        yield path
+    finally:
+        debuggee.kill()
+        debuggee.wait()
+        debuggee.stdout.close()
+        for leftover in (path, path + '.server'):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+
+
+@pytest.mark.parametrize('engine_args', [[], ['--asyncio']], ids=['threads', 'asyncio'])
+def test_attach_over_unix_socket(debugpy_path, engine_args):
+    maya = FakeMayaServer((util.UNIX_HOST_PREFIX + debugpy_path, 0))
+    env = dict(os.environ, **{util.LOG_LEVEL_VARIABLE: 'off'})
+    adapter = subprocess.Popen(
+        [sys.executable, os.path.join(util.dirname(util.__file__), '__main__.py')] + engine_args,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env,
+    )
+    timer = threading.Timer(TIMEOUT, adapter.kill)  # Fails the test instead of hanging
+    timer.start()
+    try:
+        debugger = Debugger(adapter)
+        debugger.wait_for_response(debugger.request('initialize', {'adapterID': 'mayaui'}))
+        attach = debugger.request('attach', {
+            'program': __file__,
+            'interpreter': sys.executable,
+            'targets': [{'commandPort': maya.port, 'debugpy': {'path': debugpy_path}}],
+        })
+        debugger.wait_for(lambda message: message.get('event') == 'initialized')
+        debugger.wait_for_response(debugger.request('configurationDone'))
+        debugger.wait_for_response(attach)
+
+        threads = debugger.wait_for_response(debugger.request('threads'))
+        assert 'MainThread' in [thread['name'] for thread in threads['body']['threads']]
+        assert maya.code == []
+
+        debugger.wait_for_response(debugger.request('disconnect', {'terminateDebuggee': False}))
+    finally:
+        timer.cancel()
+        adapter.kill()
+        adapter.wait()
+        adapter.stdin.close()
+        adapter.stdout.close()
+        maya.close()
@@ -0,0 +1,117 @@
+import importlib
+import io
+
+import pytest
+
+import util
+
+
+@pytest.fixture
+def reload_util(monkeypatch):
+    def reload(level=None):
+        if level is None:
+            monkeypatch.delenv(util.LOG_LEVEL_VARIABLE, raising=False)
+        else:
+            monkeypatch.setenv(util.LOG_LEVEL_VARIABLE, level)
+        return importlib.reload(util)
+
+    yield reload
+    monkeypatch.undo()
+    importlib.reload(util)
+
+
+def test_relayed_messages_not_logged_by_default(reload_util, monkeypatch):
+    util = reload_util()
+    monkeypatch.setattr(util, '_start_log_writer', lambda: None)  # Keep entries in the buffer
+    assert util.log_settings["level"] == "info"
+
+    util.log("Received from debugpy:", b'{"seq": 1}')
+    assert len(util._log_buffer) == 0
+
+    util.log("Connecting to Maya")
+    assert len(util._log_buffer) == 1
+
+
+@pytest.mark.parametrize("level, expected", [("messages", "messages"), ("off", "off"), ("verbose", "info")])
+def test_log_level_from_environment(reload_util, level, expected):
+    util = reload_util(level)
+    assert util.log_settings["level"] == expected
+
+
+def test_configure_logging(reload_util, monkeypatch):
+    util = reload_util()
+    monkeypatch.setattr(util, '_start_log_writer', lambda: None)
+
+    util.configure_logging({"level": "messages", "sample": "10", "max_body": 512.0, "buffer_size": "100",
+                            "flush_interval": "0.5"})
+    assert util.log_settings == {"level": "messages", "sample": 10, "max_body": 512, "buffer_size": 100,
+                                 "flush_interval": 0.5}
+    assert util._log_buffer.maxlen == 100
+
+    util.configure_logging({"sample": {"Received from debugpy": "3"}})
+    assert util.log_settings["sample"] == {"Received from debugpy": 3}
+    for seq in range(6):
+        util.log("Received from debugpy:", b'{"seq": %d}' % seq)
+    assert len(util._log_buffer) == 2
+
+
+@pytest.mark.parametrize("config", [
+    {"level": "verbose"},
+    {"sample": "ten"},
+    {"sample": {"Received from debugpy": None}},
+    {"sample": -1},
+    {"max_body": [1024]},
+    {"buffer_size": 0},
+    {"buffer_size": 1.5e400},
+    {"flush_interval": "nan"},
+    {"flush_interval": float("inf")},
+    {"unknown": 1},
+    "messages",
+])
+def test_configure_logging_invalid(reload_util, monkeypatch, config):
+    util = reload_util()
+    monkeypatch.setattr(util, '_start_log_writer', lambda: None)
+    settings = dict(util.log_settings)
+
+    util.configure_logging(config)
+    assert util.log_settings == settings
+    assert util._log_buffer.maxlen == settings["buffer_size"]
+    assert "logging" in util._log_buffer[-1][1]
+
+
+class OneByteReader(io.RawIOBase):
+    """Returns one byte per readinto(), to split every message and header."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def readinto(self, buffer):
+        if not self.data:
+            return 0
+        buffer[0] = self.data[0]
+        self.data = self.data[1:]
+        return 1
+
+
+@pytest.mark.parametrize("one_byte", [False, True], ids=["whole", "one_byte"])
+def test_message_reader(one_byte):
+    data = (b'Content-Length: 8\r\n\r\n{"a": 1}' + b'Content-Type: json\r\nContent-Length: 2\r\n\r\n{}'
+            + b'Content-Length: 1000\r\n\r\n' + b'x' * 1000)
+    stream = OneByteReader(data) if one_byte else io.BytesIO(data)
+    reader = util.MessageReader(stream.readinto, buffer_size=16)
+
+    assert reader.read() == b'{"a": 1}'
+    assert reader.read() == b'{}'
+    assert reader.read() == b'x' * 1000
+    with pytest.raises(EOFError):
+        reader.read()
+
+
+def test_message_reader_skips_frames_without_length():
+    data = (b'Content-Type: json\r\n\r\n' + b'Content-Length: 0\r\n\r\n'
+            + b'Content-Length: 8\r\n\r\n{"a": 1}' + b'\r\n\r\n')
+    reader = util.MessageReader(io.BytesIO(data).readinto)
+
+    assert reader.read() == b'{"a": 1}'
+    with pytest.raises(EOFError):
+        reader.read()
@@ -1,9 +1,16 @@
 
 from os.path import abspath, join, dirname, basename, split
+from threading import Thread, Lock, Event
+from collections import deque
 from datetime import datetime
-from threading import Thread
+import atexit
+import random
+import os
+import socket
 import json
+import time
 import sys
+import re
 
 # Import correct Queue
 if (sys.version_info[0] == 3):
@@ -12,31 +19,428 @@ else:  # Python 2
     from multiprocessing import Queue
 
 #  Debugging this adapter
-debug = True
 log_file = abspath(join(dirname(__file__), 'log.txt'))
 
-if debug:
+debugpy_path = join(abspath(dirname(__file__)), "python")
+
+# Logging levels, from quietest to most verbose. "messages" also logs every relayed DAP message
+LOG_LEVELS = ("off", "info", "messages")
+
+# Environment variable setting the logging level until the launch config is received
+LOG_LEVEL_VARIABLE = "MAYA_ADAPTER_LOG_LEVEL"
+
+# Logging settings, which can be changed by the "logging" entry of the launch config
+log_settings = {
+    "level": os.environ.get(LOG_LEVEL_VARIABLE, "info"),
+    "sample": 1,  # Log one relayed message out of every N, per direction. Can be a {direction: N} dict
+    "max_body": 8192,  # Messages longer than this are truncated instead of pretty-printed
+    "buffer_size": 10000,  # Entries kept in memory waiting to be written, the oldest are dropped first
+    "flush_interval": 0.2,  # Minimum time in seconds between two writes to the log file
+}
+
+if log_settings["level"] not in LOG_LEVELS:
+    log_settings["level"] = "info"
+
+if log_settings["level"] != "off":
     open(log_file, 'w+').close()  # Creates and/or clears the file
 
-debugpy_path = join(abspath(dirname(__file__)), "python")
+_log_buffer = deque(maxlen=log_settings["buffer_size"])
+_log_lock = Lock()
+_log_event = Event()
+_log_counts = {}
+_log_dropped = 0
+_log_thread = None
 
 
 # --- Utility functions --- #
 
 def log(msg, json_msg=None):
-    if debug:
+    """
+    Queues a log entry for the background writer. The message in json_msg, if any,
+    is only formatted by the writer, so this costs next to nothing on the relay's path.
+    """
+
+    global _log_dropped
+
+    level = log_settings["level"]
+    if level == "off" or (json_msg and level != "messages"):
+        return
+
+    if json_msg and not _log_sampled(msg):
+        return
+
+    with _log_lock:
+        if len(_log_buffer) == _log_buffer.maxlen:
+            _log_dropped += 1
+        _log_buffer.append((datetime.now(), msg, json_msg))
+
+    if _log_thread is None:
+        _start_log_writer()
+    _log_event.set()
+
+
+def configure_logging(config):
+    """
+    Updates the logging settings from the "logging" entry of a launch config, ie
+    {"level": "info", "sample": {"Received from debugpy": 10}, "max_body": 1024}
+    """
+
+    global _log_buffer
+
+    if not config:
+        return
+
+    if not isinstance(config, dict):
+        log("Invalid logging settings {!r}, expected an object".format(config))
+        return
+
+    settings = {}
+    for name, value in config.items():
+        if name == "level":
+            if value not in LOG_LEVELS:
+                log("Unknown logging level {}, expected one of {}".format(value, LOG_LEVELS))
+                continue
+        elif name not in log_settings:
+            log("Unknown logging setting {}".format(name))
+            continue
+        else:
+            try:
+                value = _log_setting_value(name, value)
+            except (TypeError, ValueError, OverflowError):
+                log("Invalid value {!r} for the logging setting {}, keeping {!r}".format(
+                    value, name, log_settings[name]))
+                continue
+        settings[name] = value
+
+    with _log_lock:
+        log_settings.update(settings)
+        if _log_buffer.maxlen != log_settings["buffer_size"]:
+            _log_buffer = deque(_log_buffer, maxlen=log_settings["buffer_size"])
+        _log_counts.clear()
+
+
+def _log_setting_value(name, value):
+    """
+    Returns the value of a logging setting converted to the type of its default,
+    raising ValueError or TypeError if it isn't valid
+    """
+
+    if name == "sample" and isinstance(value, dict):
+        return dict((direction, _log_setting_value(name, n)) for direction, n in value.items())
+
+    if isinstance(log_settings[name], float):
+        value = float(value)
+    else:
+        value = int(value)
 
+    # The buffer must keep at least one entry, 0 means no limit for max_body
+    minimum = 1 if name == "buffer_size" else 0
+    if not minimum <= value < float("inf"):  # Also rejects nan
+        raise ValueError("{} must be a number of at least {}".format(name, minimum))
+    return value
+
+
+def flush_log():
+    """
+    Writes all queued log entries to the log file
+    """
+
+    global _log_dropped
+
+    with _log_lock:
+        entries = list(_log_buffer)
+        _log_buffer.clear()
+        dropped, _log_dropped = _log_dropped, 0
+
+    if not entries and not dropped:
+        return
+
+    lines = []
+    if dropped:
+        lines.append("\n{} log entries were dropped, the log buffer was full\n".format(dropped))
+    for timestamp, msg, json_msg in entries:
         if json_msg:
-            msg += '\n' + json.dumps(json.loads(json_msg), indent=4)
+            msg += '\n' + _format_json(json_msg)
+        lines.append('\n' + timestamp.strftime("%Y-%m-%d %H:%M:%S") + " - " + msg + '\n')
+
+    with open(log_file, 'a+') as f:
+        f.write(''.join(lines))
+
+
+def _log_sampled(msg):
+    """
+    Returns whether this message should be logged, counting messages per direction (its label)
+    """
+
+    direction = msg.rstrip(': ')
+    sample = log_settings["sample"]
+    if isinstance(sample, dict):
+        sample = sample.get(direction, 1)
+    if sample <= 1:
+        return True
+
+    # Races between threads only shift which message gets sampled
+    count = _log_counts.get(direction, 0)
+    _log_counts[direction] = count + 1
+    return count % sample == 0
+
 
-        with open(log_file, 'a+') as f:
-            f.write('\n' + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + " - " + msg + '\n')
+def _format_json(json_msg):
+    max_body = log_settings["max_body"]
+    if max_body and len(json_msg) > max_body:
+        remaining = len(json_msg) - max_body
+        json_msg = json_msg[:max_body]
+        if isinstance(json_msg, bytes):
+            json_msg = json_msg.decode('UTF-8', 'replace')
+        return json_msg + '... ({} more)'.format(remaining)
+
+    if isinstance(json_msg, bytes):
+        json_msg = json_msg.decode('UTF-8', 'replace')
+    try:
+        return json.dumps(json.loads(json_msg), indent=4)
+    except ValueError:
+        return json_msg
+
+
+def _start_log_writer():
+    global _log_thread
+
+    with _log_lock:
+        if _log_thread is not None:
+            return
+        _log_thread = Thread(target=_log_writer_loop)
+        _log_thread.daemon = True
+        _log_thread.start()
+
+    # Write whatever is left when the adapter exits
+    atexit.register(flush_log)
+
+
+def _log_writer_loop():
+    """
+    Writes queued entries in batches, at most once every flush_interval
+    """
+
+    while True:
+        _log_event.wait()
+        _log_event.clear()
+        try:
+            flush_log()
+        except Exception as e:
+            sys.stderr.write("Failure writing to the adapter log: " + str(e) + '\n')
+        time.sleep(log_settings["flush_interval"])
 
 
 def run(func, args=()):
     Thread(target=func, args=args).start()
 
 
+def maya_connection_error():
+    """
+    Creates the exception raised when Maya's command port can't be reached,
+    explaining the potential solution to the user.
+    """
+
+    import platform
+    module_path = join(dirname(__file__), 'resources', 'module')
+    separator = ';' if platform.system() == 'Windows' else ':'
+    return Exception(
+        """
+                          Could not connect to Maya.
+
+            Please ensure Maya is running. If this is your first time
+            using the debug adapter, ensure the MAYA_MODULE_PATH
+            environment variable is set correctly (ie contains {0}), 
+                       then restart Maya and try again.
+        """.format(module_path + separator)
+    )
+
+
+def backoff_delays(initial=0.05, maximum=1.0, factor=2.0, jitter=0.5):
+    """
+    Yields exponentially growing delays between retries, up to maximum seconds.
+    Each one is randomly shortened by up to the jitter fraction so retries don't line up.
+    """
+
+    delay = initial
+    while True:
+        yield delay * (1 - jitter * random.random())
+        delay = min(delay * factor, maximum)
+
+
+def unix_socket_path(address):
+    """
+    Returns the path of the Unix domain socket a (host, port) address stands for, or None for a TCP one
+    """
+
+    host = address[0]
+    return host[len(UNIX_HOST_PREFIX):] if host.startswith(UNIX_HOST_PREFIX) else None
+
+
+def format_address(address):
+    """ Returns host:port, or the Unix domain socket's path """
+
+    return unix_socket_path(address) or "{}:{}".format(address[0], address[1])
+
+
+def create_connection(address, timeout):
+    """ Same as socket.create_connection, also connecting to Unix domain sockets """
+
+    path = unix_socket_path(address)
+    if path is None:
+        return socket.create_connection(address, timeout=timeout)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def connect_with_retry(address, timeout=None):
+    """
+    Connects to address, retrying with backoff while nothing is listening there yet,
+    ie while Maya hasn't run the attach code. Raises the last error after timeout seconds
+    (CONNECT_TIMEOUT by default).
+    """
+
+    deadline = time.time() + (CONNECT_TIMEOUT if timeout is None else timeout)
+    attempts = 0
+    for delay in backoff_delays():
+        attempts += 1
+        try:
+            sock = create_connection(address, timeout=max(deadline - time.time(), 0.1))
+        except OSError as e:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                log("Giving up connecting to {} after {} attempts".format(format_address(address), attempts))
+                raise
+            time.sleep(min(delay, remaining))
+            continue
+
+        sock.settimeout(None)
+        if attempts > 1:
+            log("Connected to {} after {} attempts".format(format_address(address), attempts))
+        return sock
+
+
+def has_command(message, commands):
+    """
+    Scans the raw bytes of a DAP message for any "command" field whose value is in commands,
+    without decoding the message. Nested objects may also match, so a True result only means
+    the message needs to be parsed to know for sure, while False means it can be relayed as-is.
+    """
+
+    for cmd in COMMAND_PATTERN.findall(message):
+        if cmd in commands:
+            return True
+    return False
+
+
+def has_event(message, events):
+    """
+    Same as has_command, for the "event" field of DAP events
+    """
+
+    for event in EVENT_PATTERN.findall(message):
+        if event in events:
+            return True
+    return False
+
+
+# --- Message framing --- #
+
+def frame_message(message):
+    """
+    Prepends the Content-Length header to a message so header and body
+    can be written out with a single call. The length is counted in bytes.
+    """
+
+    return (CONTENT_HEADER + '{}\r\n\r\n').format(len(message)).encode('UTF-8') + message
+
+
+class MessageReader:
+    """
+    Reads Content-Length framed DAP messages using a single growable receive buffer.
+
+    readinto is a function filling a writable buffer with at most its size in bytes
+    and returning the count read, such as socket.recv_into or a raw file's readinto.
+    """
+
+    def __init__(self, readinto, buffer_size=65536):
+        self.readinto = readinto
+        self.buffer = bytearray(buffer_size)
+        self.start = 0  # First byte not yet consumed
+        self.end = 0  # One past the last byte received
+
+    def read(self):
+        """
+        Blocks until a full message is available and returns its body as bytes.
+        Header blocks without a positive Content-Length are skipped.
+        Raises EOFError once the stream is closed.
+        """
+
+        content_length = 0
+        while content_length <= 0:
+            content_length = self._read_headers()
+
+        # Wait for the whole body to be in the buffer
+        while self.end - self.start < content_length:
+            self._fill(content_length)
+
+        message = bytes(self.buffer[self.start:self.start + content_length])
+        self.start += content_length
+        return message
+
+    def _read_headers(self):
+        """
+        Blocks until a full header block is available, consumes it and returns its
+        Content-Length, 0 if it has none.
+        """
+
+        header_end = self.buffer.find(b'\r\n\r\n', self.start, self.end)
+        while header_end < 0:
+            # Only rescan the tail that could hold a partial separator, relative to start
+            # since filling may move the unconsumed bytes to the front of the buffer
+            searched = max(0, self.end - self.start - 3)
+            self._fill(self.end - self.start + 1)
+            header_end = self.buffer.find(b'\r\n\r\n', self.start + searched, self.end)
+
+        content_length = 0
+        content_header = CONTENT_HEADER.encode('UTF-8')
+        for header in bytes(self.buffer[self.start:header_end]).split(b'\r\n'):
+            header = header.strip()
+            if header.startswith(content_header):
+                content_length = int(header[len(content_header):])
+
+        self.start = header_end + 4
+        return content_length
+
+    def _fill(self, needed):
+        """
+        Receives more data, first making room for at least needed unconsumed bytes
+        by moving them to the front of the buffer and growing it if required.
+        """
+
+        if self.start + needed > len(self.buffer):
+            pending = self.end - self.start
+            if pending:
+                self.buffer[:pending] = self.buffer[self.start:self.end]
+            self.start, self.end = 0, pending
+
+            if needed > len(self.buffer):
+                self.buffer.extend(bytearray(max(needed, 2 * len(self.buffer)) - len(self.buffer)))
+
+        with memoryview(self.buffer) as view:
+            count = self.readinto(view[self.end:])
+        if not count:
+            raise EOFError('Stream closed')
+        self.end += count
+
+
 # --- Resources --- #
 
 # Own constants
@@ -60,6 +464,15 @@ finally:
 
 CONTENT_HEADER = "Content-Length: "
 
+MAYA_ADDRESS = ("localhost", 8890)
+# Hosts starting with it stand for the Unix domain socket at the path that follows, ie "unix:/tmp/maya.sock"
+UNIX_HOST_PREFIX = "unix:"
+MAYA_TIMEOUT = 30  # Seconds to wait for Maya's main thread to run code sent to it
+CONNECT_TIMEOUT = 30  # Seconds to keep retrying to connect to debugpy in Maya
+
+COMMAND_PATTERN = re.compile(br'"command"\s*:\s*"([^"\\]*)"')
+EVENT_PATTERN = re.compile(br'"event"\s*:\s*"([^"\\]*)"')
+
 INITIALIZE_RESPONSE = """{
     "request_seq": 1,
     "body": {
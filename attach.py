@@ -45,10 +45,13 @@ config_snippets = [
     },
 ]
 
+# Run the adapter on a single asyncio event loop instead of one thread per connection
+use_asyncio = False
+
 # The settings used by the Debugger to run the adapter.
 settings = {
     "type": adapter_type,
-    "command": [sys.executable, adapter_path]
+    "command": [sys.executable, adapter_path] + (["--asyncio"] if use_asyncio else [])
 }
 
 # Instantiate variables needed for checking thread